@@ -0,0 +1,117 @@
+# benchmarks/benchmark_binding_conversion.py
+
+import os
+import sys
+import time
+import argparse
+from typing import Callable
+
+import numpy as np
+import pynng
+
+# Append the project directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import compiled_binaries.tsp_ts as ts
+from src.backend.tsp_management.tsplib_parser import TSPLIBParser
+from src.backend.tsp_management.tsp_file import TSPFile
+from src.backend.tsp_management.distance_source import DistanceSource
+from src.utils.path_config import get_path
+
+# Port of the NNG listener the constructed engines connect to
+PORT: int = 5599
+
+
+def create_engine(distance_kwargs: dict) -> ts.TabuSearch:
+    """
+    Constructs a Tabu Search engine with a random initial solution, so that the constructor time is dominated
+    by passing the distances to C++.
+
+    :param distance_kwargs: The distance-related keyword arguments of the constructor.
+    :return: The constructed engine.
+    """
+    return ts.TabuSearch(
+        port=PORT,
+        data_frequency_ms=1000,
+        **distance_kwargs,
+        duration_ms=0,
+        initial_solution_method=ts.InitialSolutionMethodTS.RANDOM,
+        neighbor_selection_method=ts.NeighborSelectionMethodTS.SWAP,
+        max_neighbors=1,
+        tabu_list_limit_method=ts.TabuListLimitMethodTS.N,
+        tabu_list_custom_limit=1,
+        tenure_type=ts.TenureTypeTS.CONSTANT,
+        constant_tenure=1,
+        random_tenure_range=(1, 1),
+    )
+
+
+def best_time(function: Callable[[], object], repeats: int) -> float:
+    """
+    Returns the shortest of several timed calls.
+
+    :param function: The function to time.
+    :param repeats: Number of calls.
+    :return: The shortest call duration in seconds.
+    """
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def benchmark_instance(file_path: str, packed: bool, repeats: int) -> None:
+    """
+    Times the engine constructor with the compact matrix array passed without copying, and with an int64 copy of
+    it that the binding has to convert. The time of converting the matrix to nested lists, which the former
+    std::vector<std::vector<int>> binding required before pybind11 converted every element again, is shown
+    as a lower bound of the previous cost.
+
+    :param file_path: Path to the .tsp file.
+    :param packed: Whether to pass the packed upper triangle instead of the dense matrix.
+    :param repeats: Number of timed constructions.
+    :return: None
+    """
+    tsp_file = TSPFile(file_path, get_path("data/metadata/optimal_results.json"), TSPLIBParser())
+    tsp_file.ensure_loaded()
+    tsp_file.load_distance_matrix(packed=packed)
+    distance_matrix = tsp_file.get_distance_matrix()
+
+    distance_kwargs = DistanceSource(distance_matrix=distance_matrix).to_binding_kwargs()
+    converted_kwargs = {**distance_kwargs, "dist_matrix": distance_matrix.values.astype(np.int64)}
+
+    zero_copy_time = best_time(lambda: create_engine(distance_kwargs), repeats)
+    converted_time = best_time(lambda: create_engine(converted_kwargs), repeats)
+    list_time = best_time(lambda: distance_matrix.to_dense().tolist(), 1)
+
+    print(f"{os.path.basename(file_path):<16} n={len(distance_matrix):<6} {distance_matrix.values.dtype}"
+          f"{' packed' if distance_matrix.packed else ' dense '} {distance_matrix.nbytes / 1024 ** 2:8.1f} MB "
+          f"zero-copy={zero_copy_time * 1000:9.3f}ms converted={converted_time * 1000:9.3f}ms "
+          f"tolist={list_time * 1000:9.1f}ms")
+
+
+def main() -> None:
+    """
+    Benchmarks passing distance matrices to the C++ engines for the given TSPLIB instances.
+
+    :return: None
+    """
+    argument_parser = argparse.ArgumentParser(description="Benchmark passing distance matrices to the C++ engines.")
+    argument_parser.add_argument("instances", nargs="*", default=["berlin52", "att532", "dsj1000", "d2103", "pcb3038"],
+                                 help="Instance names from data/tsplib or paths to .tsp files.")
+    argument_parser.add_argument("--packed", action="store_true",
+                                 help="Pass the packed upper triangle instead of the dense matrix.")
+    argument_parser.add_argument("--repeats", type=int, default=5, help="Number of timed constructions.")
+    args = argument_parser.parse_args()
+
+    # The engines connect to this socket in their constructors
+    with pynng.Pair1(listen=f"tcp://127.0.0.1:{PORT}"):
+        for instance in args.instances:
+            file_path = instance if instance.endswith(".tsp") else get_path(f"data/tsplib/{instance}.tsp")
+            benchmark_instance(file_path, args.packed, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
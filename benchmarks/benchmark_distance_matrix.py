@@ -0,0 +1,137 @@
+# benchmarks/benchmark_distance_matrix.py
+
+import os
+import sys
+import math
+import time
+import argparse
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+# Append the project directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backend.tsp_management.tsplib_parser import TSPLIBParser
+from src.utils.path_config import get_path
+
+
+# --- Reference implementations (pure-Python double loops used before the NumPy engine) ---
+
+def reference_euclidean(coordinates: List[Tuple[float, float]]) -> List[List[int]]:
+    num_cities = len(coordinates)
+    matrix = [[0] * num_cities for _ in range(num_cities)]
+    for i in range(num_cities):
+        for j in range(i + 1, num_cities):
+            x1, y1 = coordinates[i]
+            x2, y2 = coordinates[j]
+            matrix[i][j] = matrix[j][i] = int(math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2) + 0.5)
+    return matrix
+
+
+def reference_ceil_euclidean(coordinates: List[Tuple[float, float]]) -> List[List[int]]:
+    num_cities = len(coordinates)
+    matrix = [[0] * num_cities for _ in range(num_cities)]
+    for i in range(num_cities):
+        for j in range(i + 1, num_cities):
+            x1, y1 = coordinates[i]
+            x2, y2 = coordinates[j]
+            matrix[i][j] = matrix[j][i] = math.ceil(math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2))
+    return matrix
+
+
+def reference_att(coordinates: List[Tuple[float, float]]) -> List[List[int]]:
+    num_cities = len(coordinates)
+    matrix = [[0] * num_cities for _ in range(num_cities)]
+    for i in range(num_cities):
+        for j in range(i + 1, num_cities):
+            x1, y1 = coordinates[i]
+            x2, y2 = coordinates[j]
+            xd = x1 - x2
+            yd = y1 - y2
+            rij = math.sqrt((xd ** 2 + yd ** 2) / 10.0)
+            tij = int(rij + 0.5)
+            matrix[i][j] = matrix[j][i] = tij + 1 if tij < rij else tij
+    return matrix
+
+
+def reference_geographical(coordinates: List[Tuple[float, float]]) -> List[List[int]]:
+    PI = 3.141592
+    RRR = 6378.388
+
+    def to_radians(deg_min):
+        deg = int(deg_min)
+        min = deg_min - deg
+        return PI * (deg + 5.0 * min / 3.0) / 180.0
+
+    num_cities = len(coordinates)
+    matrix = [[0] * num_cities for _ in range(num_cities)]
+    latitudes = [to_radians(latitude) for latitude, _ in coordinates]
+    longitudes = [to_radians(longitude) for _, longitude in coordinates]
+    for i in range(num_cities):
+        for j in range(i + 1, num_cities):
+            q1 = math.cos(longitudes[i] - longitudes[j])
+            q2 = math.cos(latitudes[i] - latitudes[j])
+            q3 = math.cos(latitudes[i] + latitudes[j])
+            matrix[i][j] = matrix[j][i] = int(RRR * math.acos(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3)) + 1.0)
+    return matrix
+
+
+REFERENCE_METHODS: dict[str, Callable] = {
+    "EUC_2D": reference_euclidean,
+    "CEIL_2D": reference_ceil_euclidean,
+    "ATT": reference_att,
+    "GEO": reference_geographical,
+}
+
+
+def benchmark_instance(file_path: str, skip_reference: bool) -> None:
+    """
+    Times the NumPy engine and the reference loops on one instance and checks that the results are identical.
+
+    :param file_path: Path to the .tsp file.
+    :param skip_reference: Whether to time only the NumPy engine.
+    :return: None
+    """
+    parser = TSPLIBParser()
+    parser.validate_file(file_path)
+    if parser.edge_weight_type not in REFERENCE_METHODS:
+        print(f"{os.path.basename(file_path)}: skipped ({parser.edge_weight_type})")
+        return
+
+    start = time.perf_counter()
+    parser.generate_distance_matrix()
+    engine_time = time.perf_counter() - start
+    matrix = parser.get_distance_matrix()
+
+    line = f"{os.path.basename(file_path):<16} {parser.edge_weight_type:<8} n={len(matrix):<6} numpy={engine_time:8.3f}s"
+    if not skip_reference:
+        start = time.perf_counter()
+        reference = REFERENCE_METHODS[parser.edge_weight_type](parser.coordinates.tolist())
+        reference_time = time.perf_counter() - start
+        identical = np.array_equal(matrix, np.array(reference, dtype=np.int64))
+        line += f" loops={reference_time:8.3f}s speedup={reference_time / max(engine_time, 1e-9):7.1f}x"
+        line += f" identical={identical}"
+    print(line)
+
+
+def main() -> None:
+    """
+    Benchmarks distance matrix generation for the given TSPLIB instances.
+
+    :return: None
+    """
+    argument_parser = argparse.ArgumentParser(description="Benchmark distance matrix generation.")
+    argument_parser.add_argument("instances", nargs="*", default=["berlin52", "att532", "gr666", "dsj1000", "d2103"],
+                                 help="Instance names from data/tsplib or paths to .tsp files.")
+    argument_parser.add_argument("--skip-reference", action="store_true",
+                                 help="Time only the NumPy engine (useful for very large instances).")
+    args = argument_parser.parse_args()
+
+    for instance in args.instances:
+        file_path = instance if instance.endswith(".tsp") else get_path(f"data/tsplib/{instance}.tsp")
+        benchmark_instance(file_path, args.skip_reference)
+
+
+if __name__ == "__main__":
+    main()
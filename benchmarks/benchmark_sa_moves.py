@@ -0,0 +1,85 @@
+# benchmarks/benchmark_sa_moves.py
+
+import os
+import sys
+import argparse
+
+import pynng
+
+# Append the project directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import compiled_binaries.tsp_sa as sa
+from src.backend.tsp_management.tsplib_parser import TSPLIBParser
+from src.backend.tsp_management.tsp_file import TSPFile
+from src.backend.tsp_management.distance_source import DistanceSource
+from src.utils.path_config import get_path
+
+# Port of the NNG listener the engines send their progress to
+PORT: int = 5598
+
+NEIGHBOR_SELECTION_METHODS: dict[str, sa.NeighborSelectionMethodSA] = {
+    "SWAP": sa.NeighborSelectionMethodSA.SWAP,
+    "INSERT": sa.NeighborSelectionMethodSA.INSERT,
+    "INVERT": sa.NeighborSelectionMethodSA.INVERT,
+}
+
+
+def benchmark_instance(file_path: str, methods: list[str], duration_ms: int) -> None:
+    """
+    Runs the Simulated Annealing engine on one instance for every move type and reports the number of evaluated
+    moves per second.
+
+    :param file_path: Path to the .tsp file.
+    :param methods: Names of the neighbor selection methods to run.
+    :param duration_ms: Duration of every run in milliseconds.
+    :return: None
+    """
+    tsp_file = TSPFile(file_path, get_path("data/metadata/optimal_results.json"), TSPLIBParser())
+    tsp_file.ensure_loaded()
+    tsp_file.load_distance_matrix()
+    distance_kwargs = DistanceSource(distance_matrix=tsp_file.get_distance_matrix()).to_binding_kwargs()
+
+    line = f"{os.path.basename(file_path):<16} n={tsp_file.dimension:<6}"
+    for method in methods:
+        sa_instance = sa.SimulatedAnnealing(
+            port=PORT,
+            data_frequency_ms=duration_ms,
+            **distance_kwargs,
+            duration_ms=duration_ms,
+            initial_temp_method=sa.InitialTempMethodSA.SAMPLING,
+            initial_solution_method=sa.InitialSolutionMethodSA.RANDOM,
+            neighbor_selection_method=NEIGHBOR_SELECTION_METHODS[method],
+            steps_per_temp=100,
+            alpha=0.999,
+        )
+        result = sa_instance.run()
+        moves_per_second = result.iteration_count / (duration_ms / 1000)
+        line += f" {method}={moves_per_second / 1e6:7.2f}M moves/s"
+    print(line)
+
+
+def main() -> None:
+    """
+    Benchmarks the move throughput of the Simulated Annealing engine for the given TSPLIB instances.
+
+    :return: None
+    """
+    argument_parser = argparse.ArgumentParser(description="Benchmark Simulated Annealing moves per second.")
+    argument_parser.add_argument("instances", nargs="*", default=["berlin52", "d2103", "fnl4461"],
+                                 help="Instance names from data/tsplib or paths to .tsp files.")
+    argument_parser.add_argument("--methods", nargs="+", default=list(NEIGHBOR_SELECTION_METHODS),
+                                 choices=list(NEIGHBOR_SELECTION_METHODS), help="Move types to run.")
+    argument_parser.add_argument("--duration-ms", type=int, default=2000, help="Duration of every run.")
+    args = argument_parser.parse_args()
+
+    file_paths = [instance if instance.endswith(".tsp") else get_path(f"data/tsplib/{instance}.tsp")
+                  for instance in args.instances]
+
+    with pynng.Pair1(listen=f"tcp://127.0.0.1:{PORT}"):
+        for file_path in file_paths:
+            benchmark_instance(file_path, args.methods, args.duration_ms)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,84 +1,229 @@
 # src/backend/components/algorithm_manager.py
 
-from typing import Optional, Type, Callable
-from multiprocessing import Queue, Process, Barrier
+import os
+import time
+from typing import Optional, Type, Callable, Union
+from multiprocessing import Process, Barrier
 
+from src.backend.components.algorithm_result import AlgorithmResult
+from src.backend.components.telemetry_receiver import TelemetryBatch, TelemetryReceiver
 from src.backend.processes.base_algorithm_process import BaseAlgorithmProcess
+from src.backend.processes.worker_pool import WorkerJob, WorkerPool
+from src.backend.tsp_management.distance_source import DistanceSource
 
 
 class AlgorithmManager:
+    # Time in seconds the algorithm process gets to save its result after the end of the run
+    RESULT_TIMEOUT_S: float = 5.0
+    # Time in seconds the end of the run may still arrive after the algorithm process has exited
+    EXIT_GRACE_S: float = 1.0
+
     def __init__(self, algorithm_process_class: Type[BaseAlgorithmProcess], port: int, data_frequency: int,
-                 distance_matrix: list[list[int]], start_barrier: Barrier, config_params) -> None:
+                 distance_source: DistanceSource, start_barrier: Barrier, config_params,
+                 worker_pool: Optional[WorkerPool] = None) -> None:
         """
         Initializes the manager (handler) for an algorithm process, setting up required resources
-        such as the inter-process communication queue, process instances, and synchronization barriers.
+        such as the receiver of its telemetry, process instances, and synchronization barriers.
+        The algorithm runs on a worker of the given pool, or in a new process without one.
 
         :param algorithm_process_class: The class used to create the algorithm process.
         :param port: The communication port for socket communication.
         :param data_frequency: The frequency for data updates.
-        :param distance_matrix: The distance matrix for the TSP problem.
+        :param distance_source: The distances (dense matrix or coordinates) for the TSP problem.
         :param start_barrier: The barrier for synchronizing the start of processes.
         :param config_params: Configuration parameters for the algorithm.
+        :param worker_pool: The pool of warm worker processes the algorithm is dispatched to, if any; its start
+            barrier must then come from WorkerPool.create_barrier().
         :return: None
         """
-        self.queue: Queue = Queue()
         self.algorithm_process_instance: BaseAlgorithmProcess = algorithm_process_class(
-            port, data_frequency, distance_matrix, self.queue, start_barrier, config_params
+            port, data_frequency, distance_source, start_barrier, config_params
         )
-        self.receiver_process: Optional[Process] = None
-        self.algorithm_process: Optional[Process] = None
+        # Reads the engine's socket on a background thread of this process
+        self.receiver: TelemetryReceiver = TelemetryReceiver(port)
+        self.worker_pool: Optional[WorkerPool] = worker_pool
+        # The process running the algorithm, or the handle of its job on a pooled worker
+        self.algorithm_process: Optional[Union[Process, WorkerJob]] = None
         self.is_receiving: bool = False
+        # Best solution of the run: the latest snapshot while it runs, the result returned by the engine after it
+        self.result: Optional[AlgorithmResult] = None
+        # Times (time.perf_counter()) at which start() was called and the algorithm process was started
+        self.start_time: Optional[float] = None
+        self.process_start_time: Optional[float] = None
+        # Whether the startup timings have been printed once the engine was ready
+        self.startup_reported: bool = False
+        # Time (time.perf_counter()) at which the algorithm process was found to have exited before the end of the run
+        self.exit_time: Optional[float] = None
 
     def start(self) -> None:
         """
-        Starts the algorithm and receiver processes, enabling data communication and processing.
+        Starts receiving the telemetry, then the algorithm (on an idle pooled worker or in a new process) as soon
+        as the socket is bound; the engine signals when it is connected and set up (see get_startup_timings). If
+        the telemetry socket cannot be set up, the algorithm is not started and is_receiving stays False.
 
         :return: None
         """
-        self.receiver_process, self.algorithm_process = self.algorithm_process_instance.start()
+        self.start_time = time.perf_counter()
+        if not self.receiver.start():
+            print("Telemetry receiver could not be started, the algorithm is not run.")
+            return
+        if self.worker_pool is not None:
+            self.algorithm_process = self.worker_pool.submit(self.algorithm_process_instance)
+        else:
+            self.algorithm_process = self.algorithm_process_instance.start()
+        self.process_start_time = time.perf_counter()
         self.is_receiving = True
 
-    def check_queue(self, handle_data_callback: Callable) -> None:
+    def check_messages(self, handle_data_callback: Callable[[TelemetryBatch], None],
+                       handle_snapshot_callback: Optional[Callable[[], None]] = None) -> None:
         """
-        Checks the queue for new data messages and processes each message using a callback function.
+        Takes the telemetry received since the last check in one batch and passes it to a callback function if
+        it holds new cost samples; the batch keeps every sample but only the newest tour. Snapshots of the best
+        solution are stored in result; at the end of the run, result is loaded from the result file. If the
+        algorithm process (or its pooled job) exits without sending the end of the run, e.g. because it failed,
+        the run is ended all the same once the end could no longer be in transit.
 
-        :param handle_data_callback: The callback function to handle the data received in the queue.
+        :param handle_data_callback: The callback function to handle the batch of samples and the newest tour.
+        :param handle_snapshot_callback: The callback function called when a requested snapshot of the best
+            solution has been received.
         :return: None
         """
-        while not self.queue.empty():
-            current_data = self.queue.get()
-            if current_data == 'EOF':
+        batch = self.receiver.drain()
+        if not self.startup_reported and self.receiver.ready_frame is not None:
+            self.startup_reported = True
+            timings = ", ".join(f"{phase}={ms:.1f}" for phase, ms in self.get_startup_timings().items())
+            print(f"Algorithm on port {self.receiver.port} ready: {timings}")
+        if batch.snapshot is not None:
+            self.result = AlgorithmResult(batch.snapshot.tour, batch.snapshot.best_cost, {})
+            if handle_snapshot_callback:
+                handle_snapshot_callback()
+        if batch.elapsed_times:
+            handle_data_callback(batch)
+        if batch.end_frame is not None:
+            self.is_receiving = False
+            self._load_result()
+            self.terminate_processes()
+        elif self.algorithm_process and not self.algorithm_process.is_alive():
+            if self.exit_time is None:
+                self.exit_time = time.perf_counter()
+            elif time.perf_counter() - self.exit_time >= self.EXIT_GRACE_S:
+                print(f"Algorithm on port {self.receiver.port} exited without ending its run.")
                 self.is_receiving = False
+                self._load_result()
                 self.terminate_processes()
-                return
-            handle_data_callback(current_data)
+
+    def _load_result(self) -> None:
+        """
+        Waits for the algorithm process to save the result returned by the engine and loads it. The result file
+        only passes the result to this process, so it is deleted once loaded.
+
+        :return: None
+        """
+        if self.algorithm_process:
+            self.algorithm_process.join(self.RESULT_TIMEOUT_S)
+        result_path = self.algorithm_process_instance.result_path
+        try:
+            self.result = AlgorithmResult.load(result_path)
+        except OSError:
+            print(f"Result file {os.path.basename(result_path)} not found.")
+            return
+        self._remove_result_file()
+
+    def _remove_result_file(self) -> None:
+        """
+        Deletes the result file of the run if it exists, so that the results directory does not grow across runs.
+
+        :return: None
+        """
+        try:
+            os.remove(self.algorithm_process_instance.result_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Result file could not be deleted: {e}")
+
+    def request_stop(self) -> None:
+        """
+        Asks the running algorithm to stop. It returns its best solution and sends the end of the run, after which the
+        result is loaded and the processes are terminated as on normal completion.
+
+        :return: None
+        """
+        self.algorithm_process_instance.request_stop()
+
+    def pause(self) -> None:
+        """
+        Asks the running algorithm to pause.
+
+        :return: None
+        """
+        self.algorithm_process_instance.pause()
+
+    def resume(self) -> None:
+        """
+        Asks the paused algorithm to resume.
+
+        :return: None
+        """
+        self.algorithm_process_instance.resume()
+
+    def request_snapshot(self) -> None:
+        """
+        Asks the running algorithm to send its best solution so far.
+
+        :return: None
+        """
+        self.algorithm_process_instance.request_snapshot()
 
     def terminate_processes(self) -> None:
         """
-        Terminates both the receiver and algorithm processes if they are active.
+        Closes the telemetry receiver and terminates the algorithm process if it is active. Used after the
+        algorithm has finished, or if it does not finish in time after a stop request. A result file the process
+        left behind without it being loaded is deleted.
 
         :return: None
         """
-        if self.receiver_process and self.receiver_process.is_alive():
-            self.receiver_process.terminate()
+        self.receiver.close()
         if self.algorithm_process and self.algorithm_process.is_alive():
             self.algorithm_process.terminate()
+            self.algorithm_process.join()
+        self._remove_result_file()
 
-    def parse_message(self, data: str) -> tuple[int, int, int, list[int]]:
+    def get_telemetry_statistics(self) -> dict[str, int]:
         """
-        Parses an incoming data message string to extract algorithm metrics such as elapsed time,
-        best cost, current cost, and the current solution route.
+        Returns the counters of the telemetry of the run that was not delivered: tours replaced by newer ones
+        while the GUI was busy, cost samples dropped beyond the pending limit and frames lost in transport.
 
-        :param data: The data string containing elapsed time, best cost, current cost, and current solution route.
-        :return: A tuple containing the parsed values for elapsed time, best cost, current cost, and the current solution route.
+        :return: The counters by name.
         """
-        try:
-            parts = data.split(' ', 3)
-            elapsed_time = int(parts[0])
-            best_cost = int(parts[1])
-            current_cost = int(parts[2])
-            current_solution = list(map(int, parts[3].split(',')))
-            return elapsed_time, best_cost, current_cost, current_solution
-        except (ValueError, IndexError) as e:
-            print(f"Error parsing message: {data}, {e}")
-            return 0, 0, 0, []
+        return self.receiver.get_statistics()
+
+    def get_startup_timings(self) -> dict[str, float]:
+        """
+        Returns the durations of the startup phases reached so far, in milliseconds:
+        - bind_ms: binding the telemetry socket (the listener is ready),
+        - process_start_ms: starting the algorithm process, or dispatching it to a pooled worker,
+        - engine_launch_ms: from the process start until the engine began its setup (interpreter start, waiting
+          for the other algorithms at the start barrier and connecting),
+        - engine_setup_ms: the setup of the engine (initial solution), reported by it when it is ready,
+        - first_sample_ms: from the engine being ready until its first sample arrived,
+        - total_ms: from start() until the engine was ready.
+
+        :return: The durations of the completed phases by name.
+        """
+        bound_time, ready_time, first_data_time, ready_frame = self.receiver.get_startup_times()
+        timings = {}
+        if self.start_time is None or bound_time is None:
+            return timings
+        timings["bind_ms"] = (bound_time - self.start_time) * 1000
+        if self.process_start_time is None:
+            return timings
+        timings["process_start_ms"] = (self.process_start_time - bound_time) * 1000
+        if ready_time is None:
+            return timings
+        timings["engine_launch_ms"] = max((ready_time - self.process_start_time) * 1000 - ready_frame.elapsed_ms, 0)
+        timings["engine_setup_ms"] = float(ready_frame.elapsed_ms)
+        if first_data_time is not None:
+            timings["first_sample_ms"] = (first_data_time - ready_time) * 1000
+        timings["total_ms"] = (ready_time - self.start_time) * 1000
+        return timings
@@ -0,0 +1,80 @@
+# src/backend/components/algorithm_result.py
+
+import os
+import uuid
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+
+from src.utils.path_config import get_path
+
+
+class AlgorithmResult:
+    # Directory the results of the runs are saved to, relative to the project root
+    RESULTS_DIRECTORY: str = "data/best_solutions"
+
+    def __init__(self, best_solution: np.ndarray, best_cost: int, statistics: dict[str, Any]) -> None:
+        """
+        Initializes the result of an algorithm run: the best tour, its cost, and statistics of the run such as the
+        iteration count and the final temperature or tabu list statistics.
+
+        :param best_solution: The best tour found, as an array of city indices.
+        :param best_cost: The cost of the best tour.
+        :param statistics: Further values reported by the engine, by name.
+        :return: None
+        """
+        self.best_solution: np.ndarray = best_solution
+        self.best_cost: int = best_cost
+        self.statistics: dict[str, Any] = statistics
+
+    @classmethod
+    def from_engine_result(cls, engine_result) -> "AlgorithmResult":
+        """
+        Creates the result from the ResultSA or ResultTS object returned by the run() method of an engine.
+
+        :param engine_result: The result object returned by the C++ engine.
+        :return: The algorithm result.
+        """
+        fields = engine_result.to_dict()
+        best_solution = np.asarray(fields.pop("best_solution"), dtype=np.int32)
+        best_cost = int(fields.pop("best_cost"))
+        return cls(best_solution, best_cost, fields)
+
+    @classmethod
+    def unique_path(cls, algorithm: str) -> str:
+        """
+        Returns a new path for the result of a run of the given algorithm, so that concurrent runs never overwrite
+        each other's results.
+
+        :param algorithm: Name of the algorithm ("SA" or "TS").
+        :return: Absolute path of a not yet existing .npz file.
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        file_name = f"{algorithm.lower()}_{timestamp}_{uuid.uuid4().hex[:8]}.npz"
+        return get_path(os.path.join(cls.RESULTS_DIRECTORY, file_name))
+
+    def save(self, path: str) -> None:
+        """
+        Saves the result in the binary NumPy .npz format: the tour as an int32 array and every other value as a
+        scalar or small array.
+
+        :param path: Path of the .npz file.
+        :return: None
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        np.savez(path, best_solution=self.best_solution, best_cost=self.best_cost, **self.statistics)
+
+    @classmethod
+    def load(cls, path: str) -> "AlgorithmResult":
+        """
+        Loads a result saved by save().
+
+        :param path: Path of the .npz file.
+        :return: The algorithm result.
+        :raises OSError: If the file cannot be read.
+        """
+        with np.load(path) as data:
+            statistics = {name: data[name].item() if data[name].ndim == 0 else data[name].tolist()
+                          for name in data.files if name not in ("best_solution", "best_cost")}
+            return cls(data["best_solution"], int(data["best_cost"]), statistics)
@@ -16,7 +16,8 @@ class ReportGenerator:
 
         :param instance_name: Name of the TSP instance.
         :param instance_data: Dictionary containing instance data (e.g., number of cities).
-        :param algorithm_results: Dictionary with results for each algorithm (e.g., SA, TS).
+        :param algorithm_results: Dictionary with results for each algorithm (e.g., SA, TS), including the best
+            route and the statistics of the run when they are available.
         :param plots: Dictionary containing cost and route plots for each algorithm.
         :param output_path: Destination path where the report will be saved.
         """
@@ -26,40 +27,12 @@ class ReportGenerator:
         self.plots: dict = plots
         self.output_path: str = output_path  # Destination path for the report
 
-        # Paths to the best solution files for each algorithm
-        self.best_solution_path_sa: str = get_path("data/best_solutions/best_solution_sa.txt")
-        self.best_solution_path_ts: str = get_path("data/best_solutions/best_solution_ts.txt")
-
         # Temporary directory for storing plot images
         self.temp_image_directory: str = get_path("data/temp_images")
 
         # Ensure the temporary image directory exists
         os.makedirs(self.temp_image_directory, exist_ok=True)
 
-    def _load_best_route(self, algorithm: str) -> list[int]:
-        """
-        Loads the best route from a text file corresponding to the specified algorithm.
-
-        :param algorithm: Name of the algorithm ("SA" for Simulated Annealing or "TS" for Tabu Search).
-        :return: List of city indices in the optimal route order.
-        """
-        try:
-            # Determine file path based on the algorithm type
-            file_path = self.best_solution_path_sa if algorithm == "SA" else self.best_solution_path_ts
-            best_route: list[int] = []
-
-            # Open and read each line in the best solution file
-            with open(file_path, 'r') as file:
-                for line in file:
-                    if line.strip() == "EOF":  # End of file marker
-                        break
-                    best_route.append(int(line.strip()))
-
-            return best_route
-        except FileNotFoundError:
-            print(f"Best solution file for {algorithm} not found.")
-            return []
-
     def generate_report(self) -> None:
         """
         Generates a PDF report containing TSP instance details, algorithm parameters, and results.
@@ -118,10 +91,12 @@ class ReportGenerator:
                     for index, (param, value) in enumerate(params):
                         doc.append(f"{param}: {value}\n" if index < len(params) - 1 else f"{param}: {value}")
 
-                # Add Results subsection
+                # Add Results subsection, followed by the statistics reported by the engine
                 with doc.create(Subsection("Results")):
                     doc.append(f"Best Cost: {results['best_cost']}\n")
                     doc.append(f"Relative Error: {results['relative_error']}")
+                    for statistic, value in results.get('statistics', {}).items():
+                        doc.append(f"\n{statistic.replace('_', ' ').capitalize()}: {value}")
 
         # Separate section for plots, ensuring page break
         doc.append(NoEscape(r"\newpage"))
@@ -165,16 +140,16 @@ class ReportGenerator:
 
         # Check if route coordinates are available before adding route plot
         coordinates = self.instance_data.get('coordinates') or self.instance_data.get('display_coordinates')
-        if coordinates:
+        best_route = self.algorithm_results[algorithm].get('best_route', [])
+        if coordinates and best_route:
             with doc.create(Figure(position='h!')) as route_plot:
-                # Load the best route and save the route plot as a PDF file
-                best_route = self._load_best_route(algorithm)
+                # Save the route plot of the best route as a PDF file
                 plot_path = self._save_route_plot(best_route, f"{algorithm}_route_plot.pdf")
                 # Add the saved route plot to the document
                 route_plot.add_image(plot_path, width=NoEscape(r'0.8\textwidth'))
                 route_plot.add_caption(f"Best route for {full_name}")
         else:
-            print(f"No coordinates available for {algorithm}; skipping route plot.")
+            print(f"No coordinates or best route available for {algorithm}; skipping route plot.")
 
     def _save_cost_plot(self, plot_data: dict[str, list[float]], filename: str) -> str:
         """
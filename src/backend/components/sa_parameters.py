@@ -18,6 +18,10 @@ class InitialSolutionMethodSA(Enum):
     RANDOM = "RANDOM"
     GREEDY = "GREEDY"
 
+class MultiChainStrategySA(Enum):
+    MULTISTART = "MULTISTART"
+    PARALLEL_TEMPERING = "PARALLEL_TEMPERING"
+
 
 def map_initial_temp_method(method: InitialTempMethodSA) -> sa.InitialTempMethodSA:
     """
@@ -69,10 +73,27 @@ def map_initial_solution_method(method: InitialSolutionMethodSA) -> sa.InitialSo
     else:
         raise ValueError(f"Unknown InitialSolutionMethodSA: {method}")
 
+def map_multi_chain_strategy(strategy: MultiChainStrategySA) -> sa.MultiChainStrategySA:
+    """
+    Maps the MultiChainStrategySA enumeration to the corresponding C++ enum.
+
+    :param strategy: A MultiChainStrategySA enum instance.
+    :return: The corresponding sa.MultiChainStrategySA enum value.
+    :raises ValueError: If an unknown strategy is provided.
+    """
+    if strategy == MultiChainStrategySA.MULTISTART:
+        return sa.MultiChainStrategySA.MULTISTART
+    elif strategy == MultiChainStrategySA.PARALLEL_TEMPERING:
+        return sa.MultiChainStrategySA.PARALLEL_TEMPERING
+    else:
+        raise ValueError(f"Unknown MultiChainStrategySA: {strategy}")
+
 class SAParameters:
     def __init__(self, duration_ms: int, initial_temp_method: InitialTempMethodSA,
                  alpha: float, steps_per_temp: int, neighbor_selection_method: NeighborSelectionMethodSA,
-                 initial_solution_method: InitialSolutionMethodSA) -> None:
+                 initial_solution_method: InitialSolutionMethodSA, chains: int = 1,
+                 multi_chain_strategy: MultiChainStrategySA = MultiChainStrategySA.MULTISTART,
+                 exchange_interval: int = 10) -> None:
         """
         Initializes the parameters for the Simulated Annealing algorithm.
 
@@ -82,6 +103,9 @@ class SAParameters:
         :param steps_per_temp: Number of iterations at each temperature level.
         :param neighbor_selection_method: Method for neighbor selection.
         :param initial_solution_method: Method for generating the initial solution.
+        :param chains: Number of annealing chains, each running on its own thread.
+        :param multi_chain_strategy: Whether the chains run independently or as a parallel tempering ladder.
+        :param exchange_interval: Number of temperature levels between replica exchanges of parallel tempering.
         :return: None
         """
         self.duration_ms: int = duration_ms
@@ -90,6 +114,9 @@ class SAParameters:
         self.steps_per_temp: int = steps_per_temp
         self.neighbor_selection_method: NeighborSelectionMethodSA = neighbor_selection_method
         self.initial_solution_method: InitialSolutionMethodSA = initial_solution_method
+        self.chains: int = chains
+        self.multi_chain_strategy: MultiChainStrategySA = multi_chain_strategy
+        self.exchange_interval: int = exchange_interval
 
     def to_dict(self) -> dict:
         """
@@ -104,4 +131,7 @@ class SAParameters:
             "neighbor_selection_method": self.neighbor_selection_method.value,
             "steps_per_temp": self.steps_per_temp,
             "alpha": self.alpha,
+            "chains": self.chains,
+            "multi_chain_strategy": self.multi_chain_strategy.value,
+            "exchange_interval": self.exchange_interval,
         }
@@ -0,0 +1,134 @@
+# src/backend/components/telemetry_frame.py
+
+from typing import Optional
+
+import numpy as np
+
+
+class TelemetryFrame:
+    # Bytes starting every binary frame (see TelemetryFrame.h), text messages never start with them
+    MAGIC: bytes = b"TSPT"
+    # Version of the binary frame layout understood by the decoder
+    VERSION: int = 1
+
+    # Message types
+    DATA: int = 0
+    SNAPSHOT: int = 1
+    END: int = 2
+    READY: int = 3
+
+    # Layout of the fixed header of a binary frame, followed by the tour as raw int32 values
+    HEADER_DTYPE: np.dtype = np.dtype([
+        ("magic", "S4"),
+        ("version", "<u2"),
+        ("type", "<u2"),
+        ("header_size", "<u4"),
+        ("tour_length", "<u4"),
+        ("sequence", "<u8"),
+        ("elapsed_ms", "<i8"),
+        ("best_cost", "<i8"),
+        ("current_cost", "<i8"),
+        ("iteration_count", "<u8"),
+    ])
+    # Data type of the city indices of the tour
+    TOUR_DTYPE: np.dtype = np.dtype("<i4")
+
+    # Messages of the text format used for debugging
+    TEXT_END: bytes = b"EOF"
+    TEXT_SNAPSHOT_PREFIX: bytes = b"SNAPSHOT "
+    TEXT_READY_PREFIX: bytes = b"READY "
+
+    def __init__(self, message_type: int, elapsed_ms: int, best_cost: int, current_cost: int,
+                 iteration_count: Optional[int], sequence: Optional[int], tour: np.ndarray) -> None:
+        """
+        Initializes a decoded telemetry message of a running algorithm.
+
+        :param message_type: DATA, SNAPSHOT, END or READY.
+        :param elapsed_ms: Time since the start of the run in milliseconds (the setup time of the engine in READY
+            messages).
+        :param best_cost: Cost of the best solution found so far.
+        :param current_cost: Cost of the current solution (the best one in snapshots).
+        :param iteration_count: Number of iterations so far, None for text messages.
+        :param sequence: Number of messages sent before this one, None for text messages.
+        :param tour: The current solution (the best one in snapshots) as an int32 array, empty in READY and END
+            messages.
+        :return: None
+        """
+        self.message_type: int = message_type
+        self.elapsed_ms: int = elapsed_ms
+        self.best_cost: int = best_cost
+        self.current_cost: int = current_cost
+        self.iteration_count: Optional[int] = iteration_count
+        self.sequence: Optional[int] = sequence
+        self.tour: np.ndarray = tour
+
+    @classmethod
+    def decode(cls, message: bytes) -> "TelemetryFrame":
+        """
+        Decodes a binary frame or a text message sent by an engine.
+
+        :param message: The received message.
+        :return: The decoded message.
+        :raises ValueError: If the message is malformed or has an unsupported version.
+        """
+        if message[:len(cls.MAGIC)] == cls.MAGIC:
+            return cls._decode_binary(message)
+        return cls._decode_text(message)
+
+    @classmethod
+    def _decode_binary(cls, message: bytes) -> "TelemetryFrame":
+        """
+        Decodes a binary frame. The tour is a read-only view of the message, so it is not copied.
+
+        :param message: The received frame.
+        :return: The decoded message.
+        :raises ValueError: If the frame is truncated or has an unsupported version.
+        """
+        if len(message) < cls.HEADER_DTYPE.itemsize:
+            raise ValueError(f"Telemetry frame of {len(message)} bytes is shorter than its header.")
+        header = np.frombuffer(message, dtype=cls.HEADER_DTYPE, count=1)[0]
+        if header["version"] != cls.VERSION:
+            raise ValueError(f"Unsupported telemetry frame version {header['version']}.")
+        tour = np.frombuffer(message, dtype=cls.TOUR_DTYPE, count=int(header["tour_length"]),
+                             offset=int(header["header_size"]))
+        return cls(int(header["type"]), int(header["elapsed_ms"]), int(header["best_cost"]),
+                   int(header["current_cost"]), int(header["iteration_count"]), int(header["sequence"]), tour)
+
+    @classmethod
+    def _decode_text(cls, message: bytes) -> "TelemetryFrame":
+        """
+        Decodes a text message: 'elapsed best current a,b,c,...', 'READY setup best', 'SNAPSHOT best a,b,c,...'
+        or 'EOF'.
+
+        :param message: The received message.
+        :return: The decoded message.
+        :raises ValueError: If the message is malformed.
+        """
+        if message == cls.TEXT_END:
+            return cls(cls.END, 0, 0, 0, None, None, np.empty(0, dtype=cls.TOUR_DTYPE))
+        if message.startswith(cls.TEXT_READY_PREFIX):
+            try:
+                setup_ms, best_cost = message[len(cls.TEXT_READY_PREFIX):].split(b" ")
+            except ValueError:
+                raise ValueError(f"Malformed telemetry message: {message[:64]!r}") from None
+            return cls(cls.READY, int(setup_ms), int(best_cost), int(best_cost), None, None,
+                       np.empty(0, dtype=cls.TOUR_DTYPE))
+        if message.startswith(cls.TEXT_SNAPSHOT_PREFIX):
+            best_cost, tour = message[len(cls.TEXT_SNAPSHOT_PREFIX):].split(b" ", 1)
+            return cls(cls.SNAPSHOT, 0, int(best_cost), int(best_cost), None, None, cls._parse_tour(tour))
+        try:
+            elapsed_ms, best_cost, current_cost, tour = message.split(b" ", 3)
+        except ValueError:
+            raise ValueError(f"Malformed telemetry message: {message[:64]!r}") from None
+        return cls(cls.DATA, int(elapsed_ms), int(best_cost), int(current_cost), None, None,
+                   cls._parse_tour(tour))
+
+    @classmethod
+    def _parse_tour(cls, tour: bytes) -> np.ndarray:
+        """
+        Parses a comma-separated tour of a text message.
+
+        :param tour: The comma-separated city indices.
+        :return: The tour as an int32 array.
+        """
+        return np.array(tour.split(b","), dtype=cls.TOUR_DTYPE)
@@ -0,0 +1,208 @@
+# src/backend/components/telemetry_receiver.py
+
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+import pynng
+
+from src.backend.components.telemetry_frame import TelemetryFrame
+
+
+class TelemetryBatch:
+    def __init__(self, elapsed_times: list[int], best_costs: list[int], current_costs: list[int],
+                 latest_frame: Optional[TelemetryFrame], snapshot: Optional[TelemetryFrame],
+                 end_frame: Optional[TelemetryFrame]) -> None:
+        """
+        Initializes the telemetry received since the last drain: every cost sample, but only the newest tour.
+
+        :param elapsed_times: Elapsed times of the samples in milliseconds, in the order they were sent.
+        :param best_costs: Best costs of the samples.
+        :param current_costs: Current costs of the samples.
+        :param latest_frame: The newest data frame, whose tour is the current solution, or None if there is none.
+        :param snapshot: The newest snapshot of the best solution, or None if none was received.
+        :param end_frame: The frame marking the end of the run, or None if the run goes on.
+        :return: None
+        """
+        self.elapsed_times: list[int] = elapsed_times
+        self.best_costs: list[int] = best_costs
+        self.current_costs: list[int] = current_costs
+        self.latest_frame: Optional[TelemetryFrame] = latest_frame
+        self.snapshot: Optional[TelemetryFrame] = snapshot
+        self.end_frame: Optional[TelemetryFrame] = end_frame
+
+
+class TelemetryReceiver:
+    # Time in seconds close() waits for the receiving thread to finish
+    JOIN_TIMEOUT_S: float = 1.0
+    # Largest number of cost samples kept until they are drained, the oldest ones are dropped beyond it
+    MAX_PENDING_SAMPLES: int = 100000
+
+    def __init__(self, port: int) -> None:
+        """
+        Initializes the receiver of the telemetry sent by an engine. A background thread of the calling (GUI)
+        process reads the engine's socket directly and conflates the messages until they are drained: cost
+        samples are all kept, but only the newest tour and snapshot are, so a slow consumer renders the newest
+        state and the memory used stays bounded.
+
+        :param port: The port the engine sends its telemetry to.
+        :return: None
+        """
+        self.port: int = port
+        self.socket: Optional[pynng.Pair1] = None
+        self.thread: Optional[threading.Thread] = None
+        # Guards the pending telemetry and the counters, shared by the receiving thread and the consumer
+        self.lock: threading.Lock = threading.Lock()
+
+        # Telemetry received but not drained yet
+        self.samples: deque[tuple[int, int, int]] = deque(maxlen=self.MAX_PENDING_SAMPLES)
+        self.latest_frame: Optional[TelemetryFrame] = None
+        self.snapshot: Optional[TelemetryFrame] = None
+        self.end_frame: Optional[TelemetryFrame] = None
+
+        # Counters of the telemetry that was not delivered
+        self.conflated_tours: int = 0      # Tours replaced by a newer one before being drained
+        self.dropped_samples: int = 0      # Cost samples dropped because MAX_PENDING_SAMPLES were pending
+        self.lost_frames: int = 0          # Frames missing from the sequence numbers, lost in transport
+        self.next_sequence: Optional[int] = None
+
+        # Startup handshake: times (time.perf_counter()) at which the socket was bound, the engine signalled that
+        # it is connected and set up, and its first sample arrived, and the READY frame with its setup time
+        self.bound_time: Optional[float] = None
+        self.ready_time: Optional[float] = None
+        self.first_data_time: Optional[float] = None
+        self.ready_frame: Optional[TelemetryFrame] = None
+
+    def start(self) -> bool:
+        """
+        Binds the socket to the port and starts the receiving thread. The socket is bound when this returns, so
+        the engine can connect to it right away; this is the listener's side of the startup handshake.
+
+        :return: True if the socket is listening, False if it could not be set up.
+        """
+        try:
+            self.socket = pynng.Pair1()
+            self.socket.listen(f'tcp://127.0.0.1:{self.port}')
+        except pynng.AddressInUse:
+            print(f"Address already in use on port {self.port}.")
+            self.close()
+            return False
+        except pynng.NNGException as e:
+            print(f"Failed to open NNG socket on port {self.port}: {e}")
+            self.close()
+            return False
+        self.bound_time = time.perf_counter()
+
+        self.thread = threading.Thread(target=self._receive, name=f"TelemetryReceiver-{self.port}", daemon=True)
+        self.thread.start()
+        return True
+
+    def _receive(self) -> None:
+        """
+        Receives and decodes messages until the end of the run or until the socket is closed.
+
+        :return: None
+        """
+        socket = self.socket
+        while True:
+            try:
+                message = socket.recv()
+            except pynng.Closed:
+                break
+            except pynng.NNGException as e:
+                print(f"Error receiving message: {e}")
+                break
+            try:
+                frame = TelemetryFrame.decode(message)
+            except ValueError as e:
+                print(f"Error parsing message: {e}")
+                continue
+            self._store(frame)
+            if frame.message_type == TelemetryFrame.END:
+                break
+
+    def _store(self, frame: TelemetryFrame) -> None:
+        """
+        Adds a frame to the pending telemetry, replacing the older tour or snapshot, and records the times of the
+        startup handshake.
+
+        :param frame: The decoded frame.
+        :return: None
+        """
+        with self.lock:
+            if frame.sequence is not None:
+                if self.next_sequence is not None and frame.sequence > self.next_sequence:
+                    self.lost_frames += frame.sequence - self.next_sequence
+                self.next_sequence = frame.sequence + 1
+
+            if frame.message_type == TelemetryFrame.READY:
+                self.ready_time = time.perf_counter()
+                self.ready_frame = frame
+            elif frame.message_type == TelemetryFrame.DATA:
+                if self.first_data_time is None:
+                    self.first_data_time = time.perf_counter()
+                if len(self.samples) == self.samples.maxlen:
+                    self.dropped_samples += 1
+                self.samples.append((frame.elapsed_ms, frame.best_cost, frame.current_cost))
+                if self.latest_frame is not None:
+                    self.conflated_tours += 1
+                self.latest_frame = frame
+            elif frame.message_type == TelemetryFrame.SNAPSHOT:
+                self.snapshot = frame
+            else:
+                self.end_frame = frame
+
+    def drain(self) -> TelemetryBatch:
+        """
+        Takes the telemetry received since the last call: all cost samples, the newest tour and snapshot, and the
+        end of the run if it has been received.
+
+        :return: The pending telemetry, possibly empty.
+        """
+        with self.lock:
+            samples = list(self.samples)
+            batch = TelemetryBatch([sample[0] for sample in samples], [sample[1] for sample in samples],
+                                   [sample[2] for sample in samples], self.latest_frame, self.snapshot,
+                                   self.end_frame)
+            self.samples.clear()
+            self.latest_frame = None
+            self.snapshot = None
+            self.end_frame = None
+        return batch
+
+    def get_statistics(self) -> dict[str, int]:
+        """
+        Returns the counters of the telemetry that was not delivered to the consumer.
+
+        :return: Numbers of conflated tours, dropped samples and frames lost in transport, by name.
+        """
+        with self.lock:
+            return {
+                "conflated_tours": self.conflated_tours,
+                "dropped_samples": self.dropped_samples,
+                "lost_frames": self.lost_frames,
+            }
+
+    def get_startup_times(self) -> tuple[Optional[float], Optional[float], Optional[float], Optional[TelemetryFrame]]:
+        """
+        Returns the times of the startup handshake recorded so far.
+
+        :return: The times (time.perf_counter()) at which the socket was bound, the engine was ready and its first
+            sample arrived, each None if it has not happened yet, and the READY frame of the engine.
+        """
+        with self.lock:
+            return self.bound_time, self.ready_time, self.first_data_time, self.ready_frame
+
+    def close(self) -> None:
+        """
+        Closes the socket, which ends the receiving thread, and waits for the thread to finish.
+
+        :return: None
+        """
+        if self.socket is not None:
+            self.socket.close()
+            self.socket = None
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join(self.JOIN_TIMEOUT_S)
+        self.thread = None
@@ -8,6 +8,10 @@ class NeighborSelectionMethodTS(Enum):
     SWAP = "SWAP"
     OPT_2 = "OPT_2"
 
+class NeighborhoodScanMethodTS(Enum):
+    SAMPLED = "SAMPLED"
+    EXHAUSTIVE = "EXHAUSTIVE"
+
 class TabuListLimitMethodTS(Enum):
     N = "N"
     SQRT_N = "SQRT_N"
@@ -38,6 +42,21 @@ def map_neighbor_selection_method(method: NeighborSelectionMethodTS) -> ts.Neigh
     else:
         raise ValueError(f"Unknown MoveTypeTS: {method}")
 
+def map_neighborhood_scan_method(method: NeighborhoodScanMethodTS) -> ts.NeighborhoodScanMethodTS:
+    """
+    Maps the NeighborhoodScanMethodTS enum to the corresponding C++ enum.
+
+    :param method: An instance of NeighborhoodScanMethodTS.
+    :return: The corresponding ts.NeighborhoodScanMethodTS enum value.
+    :raises ValueError: If the method is unknown.
+    """
+    if method == NeighborhoodScanMethodTS.SAMPLED:
+        return ts.NeighborhoodScanMethodTS.SAMPLED
+    elif method == NeighborhoodScanMethodTS.EXHAUSTIVE:
+        return ts.NeighborhoodScanMethodTS.EXHAUSTIVE
+    else:
+        raise ValueError(f"Unknown NeighborhoodScanMethodTS: {method}")
+
 def map_tabu_list_limit_method(method: TabuListLimitMethodTS) -> ts.TabuListLimitMethodTS:
     """
     Maps the TabuListLimitMethodTS enum to the corresponding C++ enum.
@@ -93,7 +112,9 @@ class TSParameters:
     def __init__(self, duration_ms: int, tenure_type: TenureTypeTS, constant_tenure: int,
                  random_tenure_range: tuple[int, int], tabu_list_limit_method: TabuListLimitMethodTS,
                  tabu_list_custom_limit: int, max_neighbors: int, neighbor_selection_method: NeighborSelectionMethodTS,
-                 initial_solution_method: InitialSolutionMethodTS) -> None:
+                 initial_solution_method: InitialSolutionMethodTS,
+                 neighborhood_scan_method: NeighborhoodScanMethodTS = NeighborhoodScanMethodTS.SAMPLED,
+                 threads: int = 1) -> None:
         """
         Initializes the parameters for the Tabu Search algorithm.
 
@@ -106,6 +127,8 @@ class TSParameters:
         :param max_neighbors: Maximum number of neighbors to explore.
         :param neighbor_selection_method: Method for neighbor selection.
         :param initial_solution_method: Method for generating the initial solution.
+        :param neighborhood_scan_method: Whether to sample max_neighbors moves or scan the whole neighborhood.
+        :param threads: Number of threads evaluating the neighborhood.
         :return: None
         """
         self.duration_ms: int = duration_ms
@@ -117,6 +140,8 @@ class TSParameters:
         self.max_neighbors: int = max_neighbors
         self.neighbor_selection_method: NeighborSelectionMethodTS = neighbor_selection_method
         self.initial_solution_method: InitialSolutionMethodTS = initial_solution_method
+        self.neighborhood_scan_method: NeighborhoodScanMethodTS = neighborhood_scan_method
+        self.threads: int = threads
 
     def to_dict(self) -> dict:
         """
@@ -128,7 +153,9 @@ class TSParameters:
             "duration_ms": self.duration_ms,
             "initial_solution_method": self.initial_solution_method.value,
             "neighbor_selection_method": self.neighbor_selection_method.value,
+            "neighborhood_scan_method": self.neighborhood_scan_method.value,
             "max_neighbors": self.max_neighbors,
+            "threads": self.threads,
             "tabu_list_limit_method": self.tabu_list_limit_method.value,
             "tabu_list_custom_limit": self.tabu_list_custom_limit,
             "tenure_type": self.tenure_type.value,
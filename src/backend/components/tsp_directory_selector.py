@@ -16,12 +16,12 @@ class TSPDirectorySelector:
         """
         self.catalog: TSPCatalog = catalog  # Injected TSPCatalog
 
-    def select_directory_and_load_files(self) -> None:
+    def select_directory_and_load_files(self) -> bool:
         """
-        Opens a directory selection dialog and loads .tsp files from the selected directory into the catalog.
-        Clears previously loaded files in the catalog before loading new files.
+        Opens a directory selection dialog and starts loading .tsp files from the selected directory into the
+        catalog. Clears previously loaded files in the catalog before loading new files.
 
-        :return: None
+        :return: True if a directory was selected and loading has started, False otherwise.
         """
         file_dialog: QFileDialog = QFileDialog()
 
@@ -39,5 +39,7 @@ class TSPDirectorySelector:
             # Clear any previously loaded files in the catalog
             self.catalog.clear_files()
 
-            # Load files from the selected directory into the catalog
-            self.catalog.load_files(selected_directory)
\ No newline at end of file
+            # Start loading files from the selected directory into the catalog
+            self.catalog.start_loading(selected_directory)
+            return True
+        return False
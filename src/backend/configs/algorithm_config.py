@@ -5,7 +5,8 @@ from typing import Any
 
 class AlgorithmConfig:
     def __init__(self, algorithms: list[str], file_name: str, sa_params: Any, sa_port: int,
-                 ts_params: Any, ts_port: int, data_frequency: int):
+                 ts_params: Any, ts_port: int, data_frequency: int, distance_memory_limit_mb: int = 512,
+                 candidate_list_size: int = 0, worker_max_runs: int = 50):
         self.algorithms = algorithms
         self.file_name = file_name
         self.sa_params = sa_params
@@ -13,3 +14,6 @@ class AlgorithmConfig:
         self.ts_params = ts_params
         self.ts_port = ts_port
         self.data_frequency = data_frequency
+        self.distance_memory_limit_mb = distance_memory_limit_mb
+        self.candidate_list_size = candidate_list_size
+        self.worker_max_runs = worker_max_runs
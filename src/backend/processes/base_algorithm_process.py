@@ -1,91 +1,105 @@
 # src/backend/processes/algorithms_process.py
 
-import time
-import pynng
-from typing import Optional
-from multiprocessing import Process, Queue, Barrier
+from ctypes import Array
+from multiprocessing import Process, Barrier, RawArray
+
+from src.backend.components.algorithm_result import AlgorithmResult
+from src.backend.tsp_management.distance_source import DistanceSource
 
 
 class BaseAlgorithmProcess:
-    def __init__(self, port: int, data_frequency: int, distance_matrix: list[list[int]],
-                 queue: Queue, start_barrier: Barrier, config_params) -> None:
+    # Name of the algorithm, used in the paths of its results; set by the subclasses
+    ALGORITHM_NAME: str = ""
+
+    # Bits of the control word polled by the running engine (see ControlWord.h), the bits above the pause bit
+    # count the requested snapshots of the best solution
+    CONTROL_STOP: int = 1
+    CONTROL_PAUSE: int = 2
+    CONTROL_SNAPSHOT: int = 4
+    # Mask keeping the control word within its 32 bits
+    CONTROL_WORD_MASK: int = 0xFFFFFFFF
+
+    # Whether the engines send their data as text instead of binary frames, for debugging the telemetry
+    TEXT_TELEMETRY: bool = False
+
+    def __init__(self, port: int, data_frequency: int, distance_source: DistanceSource,
+                 start_barrier: Barrier, config_params) -> None:
         """
-        Initializes the BaseAlgorithmProcess class, setting up communication ports, data frequency, and synchronization.
+        Initializes the BaseAlgorithmProcess class, setting up communication ports, data frequency, synchronization,
+        the shared-memory control word of the engine, and the unique path its result is saved to.
 
-        :param port: The port used for NNG socket communication between processes.
+        :param port: The port the engine sends its telemetry to over an NNG socket.
         :param data_frequency: Frequency (in ms) for data updates.
-        :param distance_matrix: Distance matrix for the TSP problem.
-        :param queue: Queue for inter-process communication.
+        :param distance_source: Distances (dense matrix or coordinates) for the TSP problem.
         :param start_barrier: Barrier for synchronizing start of algorithm processes.
         :param config_params: Configuration parameters for the algorithm.
         :return: None
         """
         self.port: int = port
         self.data_frequency: int = data_frequency
-        self.distance_matrix: list[list[int]] = distance_matrix
-        self.queue: Queue = queue
+        self.distance_source: DistanceSource = distance_source
         self.start_barrier: Barrier = start_barrier
         self.config_params = config_params
+        # Shared-memory word through which the engine is asked to stop, pause or take a snapshot; it is only
+        # written by the process that created it and read by the engine
+        self.control_word: Array = RawArray("I", 1)
+        # Path the result of the run is saved to, unique so that concurrent runs do not overwrite each other
+        self.result_path: str = AlgorithmResult.unique_path(self.ALGORITHM_NAME)
 
-    def start(self) -> tuple[Process, Process]:
+    def start(self) -> Process:
         """
-        Starts two separate processes: one for receiving data, and one for running the algorithm.
+        Starts the process running the algorithm. Its telemetry is received by the caller, which must be listening
+        on the port already (see TelemetryReceiver), so the engine connects right away and signals when it is
+        ready with a READY message.
 
-        :return: A tuple containing the receiver and algorithm processes.
+        :return: The algorithm process.
         """
-        # Creating a process for receiving data and starting it
-        receiver_process = Process(target=self.receive_data)
-        receiver_process.start()
-
-        # Synchronizing the start of the algorithm process
-        time.sleep(1)
-
         # Creating a process for running the algorithm and starting it
         algorithm_process = Process(target=self.run_algorithm)
         algorithm_process.start()
 
-        return receiver_process, algorithm_process
+        return algorithm_process
+
+    def request_stop(self) -> None:
+        """
+        Asks the engine to stop; it returns its best solution as if its duration had elapsed.
+
+        :return: None
+        """
+        self.control_word[0] |= self.CONTROL_STOP
+
+    def pause(self) -> None:
+        """
+        Asks the engine to pause. The pause does not count towards the duration of the run.
+
+        :return: None
+        """
+        self.control_word[0] |= self.CONTROL_PAUSE
 
-    def setup_socket(self) -> Optional[pynng.Pair1]:
+    def resume(self) -> None:
         """
-        Configures an NNG socket for inter-process communication over the specified port.
+        Asks the paused engine to resume.
 
-        :return: NNG socket object if successfully set up, otherwise None.
+        :return: None
+        """
+        self.control_word[0] &= ~self.CONTROL_PAUSE & self.CONTROL_WORD_MASK
+
+    def request_snapshot(self) -> None:
+        """
+        Asks the engine to send its best solution so far in a 'SNAPSHOT' message.
+
+        :return: None
         """
-        try:
-            sock = pynng.Pair1()
-            sock.listen(f'tcp://127.0.0.1:{self.port}')
-            return sock
-        except pynng.AddressInUse:
-            print(f"Address already in use on port {self.port}.")
-        except pynng.NNGException as e:
-            print(f"Failed to open NNG socket on port {self.port}: {e}")
-        return None
+        self.control_word[0] = (self.control_word[0] + self.CONTROL_SNAPSHOT) & self.CONTROL_WORD_MASK
 
-    def receive_data(self) -> None:
+    def save_result(self, engine_result) -> None:
         """
-        Receives data messages from the algorithm through the configured socket and places them in the queue.
+        Saves the result returned by the run() method of the engine to the result path of the process.
 
+        :param engine_result: The ResultSA or ResultTS object returned by the C++ engine.
         :return: None
         """
-        try:
-            # Initializing the NNG socket
-            with self.setup_socket() as sock:
-                while True:
-                    try:
-                        # Receiving a message from the algorithm
-                        msg = sock.recv()
-                        message = msg.decode()
-                        if message == 'EOF':
-                            self.queue.put('EOF')
-                            break
-                        # Placing the message in the queue
-                        self.queue.put(message)
-                    except Exception as e:
-                        print(f"Error receiving message: {e}")
-                        break
-        except Exception as e:
-            print(f"Failed to set up NNG socket on port {self.port}: {e}")
+        AlgorithmResult.from_engine_result(engine_result).save(self.result_path)
 
     def run_algorithm(self) -> None:
         """
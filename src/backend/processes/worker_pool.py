@@ -0,0 +1,282 @@
+# src/backend/processes/worker_pool.py
+
+import copy
+import importlib
+import os
+from ctypes import Array
+from multiprocessing import Process, Pipe, RawArray, Manager, resource_tracker
+from multiprocessing.connection import Connection
+from multiprocessing.managers import SyncManager
+from typing import Optional
+
+from src.backend.processes.base_algorithm_process import BaseAlgorithmProcess
+
+# Modules loaded by every worker when it starts, so that its jobs do not pay for importing the engines
+ENGINE_MODULES: tuple[str, ...] = (
+    "src.backend.processes.simulated_annealing_process",
+    "src.backend.processes.tabu_search_process",
+)
+
+
+def run_worker(connection: Connection, control_word: Array) -> None:
+    """
+    Runs the jobs received from the pool one after another until the pool retires the worker or is closed. Each
+    job is an algorithm process object whose run_algorithm() is called in this process, with the control word of
+    the worker through which the pool's caller stops, pauses or snapshots it. The completion of every job is
+    reported to the pool, with the error if the job could not be received (e.g. the shared distance matrix could
+    not be attached while unpickling it) or failed.
+
+    :param connection: The worker's end of the pipe to the pool: jobs are received, their completion is sent.
+    :param control_word: The shared-memory control word of the worker, inherited from the pool.
+    :return: None
+    """
+    for module_name in ENGINE_MODULES:
+        importlib.import_module(module_name)
+
+    while True:
+        job = None
+        error = None
+        try:
+            job = connection.recv()
+            if job is None:
+                break
+            job.control_word = control_word
+            job.run_algorithm()
+        except EOFError:
+            break
+        except Exception as e:
+            error = f"Algorithm job failed in worker {os.getpid()}: {e}"
+        # Drop the job before reporting its completion, releasing its views of the shared distance matrix
+        job = None
+        connection.send(error)
+
+
+class EngineWorker:
+    def __init__(self) -> None:
+        """
+        Starts a long-lived worker process with its own control word and the pipe jobs are sent through.
+
+        :return: None
+        """
+        # Shared-memory word through which the running job is controlled (see BaseAlgorithmProcess), inherited by
+        # the worker because it cannot be sent with the jobs
+        self.control_word: Array = RawArray("I", 1)
+        self.connection, worker_connection = Pipe()
+        self.process: Process = Process(target=run_worker, args=(worker_connection, self.control_word), daemon=True)
+        self.process.start()
+        worker_connection.close()
+        # Number of jobs dispatched to the worker
+        self.job_count: int = 0
+        # The job running on the worker, None while it is idle
+        self.current_job: Optional["WorkerJob"] = None
+
+    def stop(self, timeout: float) -> None:
+        """
+        Asks the idle worker to exit and waits for it, terminating it if it does not exit in time.
+
+        :param timeout: Time in seconds the worker gets to exit.
+        :return: None
+        """
+        if self.process.is_alive():
+            try:
+                self.connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.connection.close()
+
+
+class WorkerJob:
+    def __init__(self, pool: "WorkerPool", worker: EngineWorker) -> None:
+        """
+        Initializes the handle of a job dispatched to a pooled worker. It is used like the Process running the
+        algorithm would be: join() waits for the job, is_alive() tells whether it runs, terminate() kills it.
+
+        :param pool: The pool the job was submitted to.
+        :param worker: The worker running the job.
+        :return: None
+        """
+        self.pool: WorkerPool = pool
+        self.worker: EngineWorker = worker
+        self.is_finished: bool = False
+        # Error reported by the worker if the job could not be received or failed
+        self.error: Optional[str] = None
+
+    def is_alive(self) -> bool:
+        """
+        Checks whether the job is still running.
+
+        :return: True until the job has finished or its worker has exited.
+        """
+        return not self._poll(0)
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """
+        Waits for the job to finish.
+
+        :param timeout: Longest time to wait in seconds, None to wait until it finishes.
+        :return: None
+        """
+        self._poll(timeout)
+
+    def terminate(self) -> None:
+        """
+        Terminates the job by terminating its worker, which the pool replaces.
+
+        :return: None
+        """
+        if self.is_finished:
+            return
+        self.worker.process.terminate()
+        self.worker.process.join()
+        self._finish()
+
+    def _poll(self, timeout: Optional[float]) -> bool:
+        """
+        Checks whether the worker has reported the completion of the job, or has exited. An error reported by the
+        worker is stored and printed.
+
+        :param timeout: Longest time to wait in seconds, None to wait until it finishes.
+        :return: True if the job has finished.
+        """
+        if not self.is_finished and self.worker.connection.poll(timeout):
+            try:
+                self.error = self.worker.connection.recv()
+            except EOFError:
+                self.error = f"Worker {self.worker.process.pid} exited while running the job."
+            if self.error is not None:
+                print(self.error)
+            self._finish()
+        return self.is_finished
+
+    def _finish(self) -> None:
+        """
+        Marks the job as finished and hands its worker back to the pool.
+
+        :return: None
+        """
+        self.is_finished = True
+        self.pool.job_finished(self.worker)
+
+
+class WorkerPool:
+    # Time in seconds a retired worker gets to exit before it is terminated
+    STOP_TIMEOUT_S: float = 1.0
+
+    def __init__(self, size: int, max_jobs_per_worker: int) -> None:
+        """
+        Initializes a pool of long-lived worker processes running the algorithms. The workers are started right
+        away and keep the engines loaded and the distance matrix of the current instance attached between runs,
+        so a run only sends its parameters to an idle worker. A worker is replaced by a fresh one once it has run
+        max_jobs_per_worker jobs, or if it exits.
+
+        :param size: Number of workers kept running, e.g. one per algorithm run side by side.
+        :param max_jobs_per_worker: Number of jobs after which a worker is recycled.
+        :return: None
+        """
+        # Start the resource tracker before forking the workers, so that they share it instead of starting their
+        # own: a tracker of a worker would unlink the shared distance matrices it attached to once the worker exits
+        resource_tracker.ensure_running()
+        self.size: int = size
+        self.max_jobs_per_worker: int = max_jobs_per_worker
+        self.workers: list[EngineWorker] = [EngineWorker() for _ in range(size)]
+        # Server process of the start barriers, which unlike multiprocessing.Barrier can be sent to the workers
+        self.manager: Optional[SyncManager] = None
+
+    def create_barrier(self, parties: int):
+        """
+        Creates a barrier synchronizing the start of the given number of jobs.
+
+        :param parties: Number of jobs waiting at the barrier.
+        :return: A proxy of a threading.Barrier that can be sent to the workers with the jobs.
+        """
+        if self.manager is None:
+            self.manager = Manager()
+        return self.manager.Barrier(parties)
+
+    def submit(self, job: BaseAlgorithmProcess) -> WorkerJob:
+        """
+        Dispatches a job to an idle worker, starting an additional worker if all of them are busy. The control
+        word of the job is replaced by the worker's, so that its stop, pause and snapshot requests reach the
+        worker.
+
+        :param job: The algorithm process object whose run_algorithm() is run by the worker.
+        :return: The handle of the dispatched job.
+        """
+        # Collect the jobs that have finished and replace used-up or exited workers
+        for worker in list(self.workers):
+            if worker.current_job is not None:
+                worker.current_job.is_alive()
+            elif self._needs_recycling(worker):
+                self._recycle(worker)
+
+        worker = next((worker for worker in self.workers if worker.current_job is None), None)
+        if worker is None:
+            worker = EngineWorker()
+            self.workers.append(worker)
+
+        worker.control_word[0] = 0
+        job.control_word = worker.control_word
+        # The control word cannot be pickled, the worker uses the one it inherited
+        payload = copy.copy(job)
+        payload.control_word = None
+        worker.connection.send(payload)
+
+        worker.job_count += 1
+        worker.current_job = WorkerJob(self, worker)
+        return worker.current_job
+
+    def job_finished(self, worker: EngineWorker) -> None:
+        """
+        Marks a worker as idle after its job has finished. Workers that have run max_jobs_per_worker jobs or have
+        exited are replaced by fresh ones; workers started beyond the size of the pool are retired.
+
+        :param worker: The worker whose job has finished.
+        :return: None
+        """
+        worker.current_job = None
+        if self._needs_recycling(worker):
+            self._recycle(worker)
+
+    def _needs_recycling(self, worker: EngineWorker) -> bool:
+        """
+        Checks whether an idle worker has to be replaced or retired.
+
+        :param worker: The idle worker.
+        :return: True if it has run max_jobs_per_worker jobs, has exited or was started beyond the pool size.
+        """
+        return (worker.job_count >= self.max_jobs_per_worker or not worker.process.is_alive()
+                or len(self.workers) > self.size)
+
+    def _recycle(self, worker: EngineWorker) -> None:
+        """
+        Stops an idle worker and replaces it with a fresh one, or retires it if the pool has more workers than its
+        size.
+
+        :param worker: The idle worker.
+        :return: None
+        """
+        worker.stop(self.STOP_TIMEOUT_S)
+        index = self.workers.index(worker)
+        if len(self.workers) > self.size:
+            del self.workers[index]
+        else:
+            self.workers[index] = EngineWorker()
+
+    def close(self) -> None:
+        """
+        Stops all workers, terminating running jobs, and the server of the start barriers.
+
+        :return: None
+        """
+        for worker in self.workers:
+            if worker.current_job is not None:
+                worker.process.terminate()
+            worker.stop(self.STOP_TIMEOUT_S)
+        self.workers = []
+        if self.manager is not None:
+            self.manager.shutdown()
+            self.manager = None
@@ -1,48 +1,111 @@
 # src/backend/task_manager.py
 
-from typing import Dict
+from typing import Dict, Optional
 from PySide6.QtCore import QObject, Signal, QTimer
-from multiprocessing import Barrier
 
 from src.backend.components.report_directory_selector import ReportDirectorySelector
 from src.backend.components.report_generator import ReportGenerator
 from src.backend.components.tsp_directory_selector import TSPDirectorySelector
 from src.backend.components.algorithm_manager import AlgorithmManager
+from src.backend.components.telemetry_receiver import TelemetryBatch
 from src.backend.configs.algorithm_config import AlgorithmConfig
 from src.backend.processes.simulated_annealing_process import SimulatedAnnealingProcess
 from src.backend.processes.tabu_search_process import TabuSearchProcess
+from src.backend.processes.worker_pool import WorkerPool
+from src.backend.tsp_management.distance_source import DistanceSource
 from src.backend.tsp_management.tsp_catalog import TSPCatalog
+from src.backend.tsp_management.tsp_file import TSPFile
 
 
 class TaskManager(QObject):
-    # Signal emitted when new data is available for the SA algorithm
-    current_data_signal_sa: Signal = Signal(int, int, int, list)
-    # Signal emitted when new data is available for the TS algorithm
-    current_data_signal_ts: Signal = Signal(int, int, int, list)
+    # Signal emitted when new data is available for the SA algorithm: the elapsed times of the new samples, the
+    # latest best cost, the current costs of the samples, and the newest current solution as an int32 array
+    current_data_signal_sa: Signal = Signal(list, object, list, object)
+    # Signal emitted when new data is available for the TS algorithm, with the same arguments
+    current_data_signal_ts: Signal = Signal(list, object, list, object)
     # Signal emitted when the SA algorithm finishes
     sa_finished_signal: Signal = Signal()
     # Signal emitted when the TS algorithm finishes
     ts_finished_signal: Signal = Signal()
+    # Signal emitted when a requested snapshot of the best solution of the SA algorithm has been received
+    sa_snapshot_signal: Signal = Signal()
+    # Signal emitted when a requested snapshot of the best solution of the TS algorithm has been received
+    ts_snapshot_signal: Signal = Signal()
+    # Signal emitted with table rows of newly loaded TSP files
+    files_loaded_signal: Signal = Signal(list)
+    # Signal emitted when all TSP files of the selected directory are loaded
+    files_loading_finished_signal: Signal = Signal()
+
+    # Largest size of a single distance matrix entry (int32, smaller weights are stored as uint16)
+    MATRIX_ENTRY_BYTES: int = 4
+    # Fraction of the memory limit used for cached distance rows in matrix-free mode
+    ROW_CACHE_FRACTION: float = 0.125
+    # Interval in milliseconds between checks for newly loaded TSP files
+    FILE_LOADING_POLL_MS: int = 50
+    # Time in milliseconds the algorithms get to return their best solutions after a stop request before they are
+    # terminated
+    STOP_TIMEOUT_MS: int = 5000
+    # Number of warm worker processes running the algorithms, one per algorithm run side by side
+    WORKER_POOL_SIZE: int = 2
+    # Number of runs after which a worker is restarted, until the settings of a run set it
+    WORKER_MAX_RUNS: int = 50
 
     def __init__(self) -> None:
         """
-        Initializes the TaskManager class with the TSP catalog, selectors, and algorithm manager dictionary.
+        Initializes the TaskManager class with the TSP catalog, selectors, algorithm manager dictionary, and the
+        pool of worker processes the algorithms run on.
 
         :return: None
         """
         super().__init__()
-        self.catalog: TSPCatalog = TSPCatalog("data/metadata/optimal_results.json")
+        self.catalog: TSPCatalog = TSPCatalog("data/metadata/optimal_results.json", "data/cache")
         self.directory_selector: TSPDirectorySelector = TSPDirectorySelector(self.catalog)
         self.report_selector: ReportDirectorySelector = ReportDirectorySelector("data/reports")
         self.algorithms_manager_dict: Dict[str, AlgorithmManager] = {}
+        # Distances of the last run, whose matrix stays shared while the same instance is solved, so that the
+        # pooled workers keep it attached
+        self.distance_source: Optional[DistanceSource] = None
+        self.worker_pool: WorkerPool = WorkerPool(self.WORKER_POOL_SIZE, self.WORKER_MAX_RUNS)
 
-    def select_tsp_directory(self) -> None:
+    def select_tsp_directory(self) -> bool:
         """
-        Invokes TSPDirectorySelector to select a directory and automatically load TSP files.
+        Invokes TSPDirectorySelector to select a directory and starts loading its TSP files in the background.
+        Rows of loaded files are streamed through files_loaded_signal.
+
+        :return: True if loading has started, False if no directory was selected.
+        """
+        if not self.directory_selector.select_directory_and_load_files():
+            return False
+        QTimer.singleShot(self.FILE_LOADING_POLL_MS, self._check_loaded_files)
+        return True
+
+    def load_last_tsp_directory(self) -> bool:
+        """
+        Starts loading the TSP directory that was loaded last, mostly restored from the catalog index.
+        Rows of loaded files are streamed through files_loaded_signal.
+
+        :return: True if loading has started, False if there is no directory to restore.
+        """
+        if not self.catalog.start_loading_last_directory():
+            return False
+        QTimer.singleShot(0, self._check_loaded_files)
+        return True
+
+    def _check_loaded_files(self) -> None:
+        """
+        Emits the table rows of files loaded since the last check, and schedules the next check until all files
+        of the catalog are loaded.
 
         :return: None
         """
-        self.directory_selector.select_directory_and_load_files()
+        loaded_files = self.catalog.collect_loaded_files()
+        if loaded_files:
+            self.files_loaded_signal.emit(self._table_rows(loaded_files))
+
+        if self.catalog.is_loading:
+            QTimer.singleShot(self.FILE_LOADING_POLL_MS, self._check_loaded_files)
+        else:
+            self.files_loading_finished_signal.emit()
 
     def get_files_data_for_table(self) -> list[tuple[str, str, str]]:
         """
@@ -50,15 +113,39 @@ class TaskManager(QObject):
 
         :return: List of tuples (name, dimension, edge_weight_type, has_coordinates).
         """
+        return self._table_rows(self.catalog.tsp_files)
+
+    @staticmethod
+    def _table_rows(tsp_files: list[TSPFile]) -> list[tuple[str, str, str]]:
+        """
+        Converts TSP files to rows of the instance table.
+
+        :param tsp_files: The TSP files to convert.
+        :return: List of tuples (name, dimension, has_coordinates).
+        """
         return [
             (
                 file.name,
                 str(file.dimension),
-                "Yes" if file.coordinates or file.display_coordinates else "No"
+                "Yes" if file.has_coordinates else "No"
             )
-            for file in self.catalog.tsp_files
+            for file in tsp_files
         ]
 
+    def get_loaded_file(self, file_name: str) -> Optional[TSPFile]:
+        """
+        Retrieves a TSP file from the catalog and loads its coordinates (and, for EXPLICIT instances, its distance
+        matrix) if only the header has been loaded so far.
+
+        :param file_name: Name of the TSP file.
+        :return: The loaded TSPFile, or None if it is not in the catalog or cannot be loaded.
+        """
+        try:
+            return self.catalog.load_file(file_name)
+        except Exception as e:
+            print(f"Error loading file {file_name}: {e}")
+            return None
+
     def start_algorithm_for_file(self, config: AlgorithmConfig) -> None:
         """
         Launches processes for the selected algorithm(s) on a given TSP file.
@@ -67,15 +154,15 @@ class TaskManager(QObject):
         :return: None
         """
         num_algorithms: int = len(config.algorithms)
-        start_barrier: Barrier = Barrier(num_algorithms)
+        self.worker_pool.max_jobs_per_worker = config.worker_max_runs
+        start_barrier = self.worker_pool.create_barrier(num_algorithms)
 
-        tsp_file = self.catalog.get_file_by_name(config.file_name)
+        tsp_file = self.get_loaded_file(config.file_name)
         if tsp_file:
-            if not tsp_file.has_loaded:
-                tsp_file.load_distance_matrix()
-
-            distance_matrix = tsp_file.get_distance_matrix()
-            if distance_matrix:
+            distance_source = self._create_distance_source(tsp_file, config.distance_memory_limit_mb,
+                                                           config.candidate_list_size)
+            if distance_source is not None:
+                self._share_distance_source(distance_source)
                 self.algorithms_manager_dict = {}
                 for algorithm_name in config.algorithms:
                     if algorithm_name == "SA" and config.sa_params:
@@ -83,24 +170,26 @@ class TaskManager(QObject):
                             SimulatedAnnealingProcess,
                             config.sa_port,
                             config.data_frequency,
-                            distance_matrix,
+                            distance_source,
                             start_barrier,
-                            config.sa_params
+                            config.sa_params,
+                            self.worker_pool
                         )
                         self.algorithms_manager_dict["SA"].start()
-                        self._check_queue_sa(config.data_frequency)
+                        self._check_messages_sa(config.data_frequency)
 
                     elif algorithm_name == "TS" and config.ts_params:
                         self.algorithms_manager_dict["TS"] = AlgorithmManager(
                             TabuSearchProcess,
                             config.ts_port,
                             config.data_frequency,
-                            distance_matrix,
+                            distance_source,
                             start_barrier,
-                            config.ts_params
+                            config.ts_params,
+                            self.worker_pool
                         )
                         self.algorithms_manager_dict["TS"].start()
-                        self._check_queue_ts(config.data_frequency)
+                        self._check_messages_ts(config.data_frequency)
                     else:
                         print(f"Algorithm {algorithm_name} not recognized.")
             else:
@@ -108,9 +197,44 @@ class TaskManager(QObject):
         else:
             print("Selected file not found.")
 
-    def _check_queue_sa(self, frequency: int) -> None:
+    def _create_distance_source(self, tsp_file: TSPFile, memory_limit_mb: int,
+                                candidate_list_size: int = 0) -> Optional[DistanceSource]:
+        """
+        Selects how the algorithms obtain distances for the given file. Symmetric instances whose dense distance
+        matrix would exceed the memory limit store only its upper triangle. Coordinate-based instances for which
+        even that is too large are solved in matrix-free mode, where distances are computed on demand from the
+        coordinates; all other instances use the (cached) compact distance matrix.
+
+        :param tsp_file: The TSP file to solve.
+        :param memory_limit_mb: Maximum size of the dense distance matrix in megabytes.
+        :param candidate_list_size: Number of nearest neighbors moves are restricted to, 0 disables candidate lists.
+        :return: The distance source, or None if no distances are available.
+        """
+        limit_bytes = memory_limit_mb * 1024 ** 2
+        matrix_bytes = tsp_file.dimension ** 2 * self.MATRIX_ENTRY_BYTES
+        packed_bytes = tsp_file.dimension * (tsp_file.dimension - 1) // 2 * self.MATRIX_ENTRY_BYTES
+        candidate_lists = tsp_file.load_candidate_lists(candidate_list_size) if candidate_list_size > 0 else None
+
+        if tsp_file.edge_weight_type != "EXPLICIT" and tsp_file.coordinates and packed_bytes > limit_bytes:
+            row_bytes = tsp_file.dimension * self.MATRIX_ENTRY_BYTES
+            row_cache_size = min(tsp_file.dimension, int(limit_bytes * self.ROW_CACHE_FRACTION) // row_bytes)
+            print(f"Distance matrix of {tsp_file.name} exceeds {memory_limit_mb} MB, "
+                  f"computing distances from coordinates.")
+            return DistanceSource(coordinates=tsp_file.coordinates, edge_weight_type=tsp_file.edge_weight_type,
+                                  row_cache_size=row_cache_size, candidate_lists=candidate_lists)
+
+        packed = matrix_bytes > limit_bytes
+        if not tsp_file.has_loaded or tsp_file.get_distance_matrix().packed != packed:
+            tsp_file.load_distance_matrix(packed=packed)
+
+        distance_matrix = tsp_file.get_distance_matrix()
+        if distance_matrix is None:
+            return None
+        return DistanceSource(distance_matrix=distance_matrix, candidate_lists=candidate_lists)
+
+    def _check_messages_sa(self, frequency: int) -> None:
         """
-        Periodically checks the data queue for the SA algorithm.
+        Periodically processes the messages received from the SA algorithm.
 
         :param frequency: Update frequency in milliseconds.
         :return: None
@@ -118,16 +242,17 @@ class TaskManager(QObject):
         try:
             if "SA" in self.algorithms_manager_dict:
                 algorithm_manager = self.algorithms_manager_dict["SA"]
-                algorithm_manager.check_queue(lambda data: self._handle_data_sa(data))
+                algorithm_manager.check_messages(lambda batch: self._handle_data_sa(batch),
+                                                 self.sa_snapshot_signal.emit)
         finally:
             if "SA" in self.algorithms_manager_dict and not self.algorithms_manager_dict["SA"].is_receiving:
                 self.sa_finished_signal.emit()
             else:
-                QTimer.singleShot(frequency, lambda: self._check_queue_sa(frequency))
+                QTimer.singleShot(frequency, lambda: self._check_messages_sa(frequency))
 
-    def _check_queue_ts(self, frequency: int) -> None:
+    def _check_messages_ts(self, frequency: int) -> None:
         """
-        Periodically checks the data queue for the TS algorithm.
+        Periodically processes the messages received from the TS algorithm.
 
         :param frequency: Update frequency in milliseconds.
         :return: None
@@ -135,54 +260,136 @@ class TaskManager(QObject):
         try:
             if "TS" in self.algorithms_manager_dict:
                 algorithm_manager = self.algorithms_manager_dict["TS"]
-                algorithm_manager.check_queue(lambda data: self._handle_data_ts(data))
+                algorithm_manager.check_messages(lambda batch: self._handle_data_ts(batch),
+                                                 self.ts_snapshot_signal.emit)
         finally:
             if "TS" in self.algorithms_manager_dict and not self.algorithms_manager_dict["TS"].is_receiving:
                 self.ts_finished_signal.emit()
             else:
-                QTimer.singleShot(frequency, lambda: self._check_queue_ts(frequency))
+                QTimer.singleShot(frequency, lambda: self._check_messages_ts(frequency))
+
+    def _share_distance_source(self, distance_source: DistanceSource) -> None:
+        """
+        Publishes the distance matrix and the candidate lists of a run in shared memory once for all algorithm
+        processes. The shared arrays of the previous run are reused if they are the same, as the pooled workers
+        keep them attached; the others are released.
+
+        :param distance_source: The distances of the run.
+        :return: None
+        """
+        previous = self.distance_source
+        if previous is not None and previous is not distance_source:
+            if previous.shared_matrix is not None and previous.distance_matrix is distance_source.distance_matrix:
+                distance_source.shared_matrix = previous.shared_matrix
+                previous.shared_matrix = None
+            if (previous.shared_candidate_lists is not None
+                    and previous.candidate_lists is distance_source.candidate_lists):
+                distance_source.shared_candidate_lists = previous.shared_candidate_lists
+                previous.shared_candidate_lists = None
+            previous.release()
+        distance_source.share()
+        self.distance_source = distance_source
+
+    def _release_distance_source(self) -> None:
+        """
+        Releases the shared distance matrix and candidate lists of the last run, if any.
+
+        :return: None
+        """
+        if self.distance_source is not None:
+            self.distance_source.release()
+            self.distance_source = None
 
-    def _handle_data_sa(self, data: str) -> None:
+    def shutdown(self) -> None:
         """
-        Handles data received from the SA algorithm and emits a signal for the GUI.
+        Stops the worker processes, terminating running algorithms, and releases the shared distances.
+        Called when the application quits.
 
-        :param data: Data string received from SA.
         :return: None
         """
-        elapsed_time, best_cost, current_cost, current_solution = self.algorithms_manager_dict["SA"].parse_message(data)
+        self.worker_pool.close()
+        self._release_distance_source()
+
+    def _handle_data_sa(self, batch: TelemetryBatch) -> None:
+        """
+        Handles a batch of data received from the SA algorithm and emits a signal for the GUI.
 
-        if elapsed_time == 0 and current_cost == 0 and best_cost == 0 and not current_solution:
+        :param batch: Cost samples and the newest data frame received from SA.
+        :return: None
+        """
+        frame = batch.latest_frame
+        if frame.tour.size == 0:
             print("Received invalid data for SA. Skipping update.")
             return
-        self.current_data_signal_sa.emit(elapsed_time, best_cost, current_cost, current_solution)
+        self.current_data_signal_sa.emit(batch.elapsed_times, frame.best_cost, batch.current_costs, frame.tour)
 
-    def _handle_data_ts(self, data: str) -> None:
+    def _handle_data_ts(self, batch: TelemetryBatch) -> None:
         """
-        Handles data received from the TS algorithm and emits a signal for the GUI.
+        Handles a batch of data received from the TS algorithm and emits a signal for the GUI.
 
-        :param data: Data string received from TS.
+        :param batch: Cost samples and the newest data frame received from TS.
         :return: None
         """
-        elapsed_time, best_cost, current_cost, current_solution = self.algorithms_manager_dict["TS"].parse_message(data)
-
-        if elapsed_time == 0 and current_cost == 0 and best_cost == 0 and not current_solution:
+        frame = batch.latest_frame
+        if frame.tour.size == 0:
             print("Received invalid data for TS. Skipping update.")
             return
-        self.current_data_signal_ts.emit(elapsed_time, best_cost, current_cost, current_solution)
+        self.current_data_signal_ts.emit(batch.elapsed_times, frame.best_cost, batch.current_costs, frame.tour)
 
     def stop_algorithms(self) -> None:
         """
-        Stops all running algorithms and clears the algorithm manager dictionary.
+        Asks all running algorithms to stop. They return their best solutions and finish as on normal completion,
+        emitting their finished signals; algorithms that have not finished after STOP_TIMEOUT_MS are terminated.
 
         :return: None
         """
-        for algorithm_name, manager in self.algorithms_manager_dict.items():
-            manager.terminate_processes()
-            if algorithm_name == "SA":
-                self.sa_finished_signal.emit()
-            elif algorithm_name == "TS":
-                self.ts_finished_signal.emit()
-        self.algorithms_manager_dict.clear()
+        algorithm_managers = list(self.algorithms_manager_dict.values())
+        for manager in algorithm_managers:
+            manager.request_stop()
+        QTimer.singleShot(self.STOP_TIMEOUT_MS, lambda: self._terminate_unfinished_algorithms(algorithm_managers))
+
+    @staticmethod
+    def _terminate_unfinished_algorithms(algorithm_managers: list[AlgorithmManager]) -> None:
+        """
+        Terminates the processes of algorithms that did not finish after a stop request. Marking them as no longer
+        receiving lets the message checks emit their finished signals.
+
+        :param algorithm_managers: The managers of the algorithms asked to stop.
+        :return: None
+        """
+        for manager in algorithm_managers:
+            if manager.is_receiving:
+                print("Algorithm did not stop in time, terminating its processes.")
+                manager.terminate_processes()
+                manager.is_receiving = False
+
+    def pause_algorithms(self) -> None:
+        """
+        Asks all running algorithms to pause.
+
+        :return: None
+        """
+        for manager in self.algorithms_manager_dict.values():
+            manager.pause()
+
+    def resume_algorithms(self) -> None:
+        """
+        Asks all paused algorithms to resume.
+
+        :return: None
+        """
+        for manager in self.algorithms_manager_dict.values():
+            manager.resume()
+
+    def request_snapshots(self) -> None:
+        """
+        Asks all running algorithms to send their best solutions so far, whose arrival is announced through
+        sa_snapshot_signal and ts_snapshot_signal.
+
+        :return: None
+        """
+        for manager in self.algorithms_manager_dict.values():
+            manager.request_snapshot()
 
     def get_instance_data(self, file_name: str) -> dict:
         """
@@ -191,7 +398,7 @@ class TaskManager(QObject):
         :param file_name: Name of the TSP file.
         :return: Dictionary containing instance details.
         """
-        tsp_file = self.catalog.get_file_by_name(file_name)
+        tsp_file = self.get_loaded_file(file_name)
         if tsp_file:
             return {
                 "name": tsp_file.name,
@@ -206,7 +413,7 @@ class TaskManager(QObject):
 
     def generate_report(self, file_name: str, instance_data: dict, algorithm_results: dict, plots: dict) -> None:
         """
-        Generates a report using the specified data and saves it to the chosen path.
+        Generates a report using the specified data and the results of the last run, and saves it to the chosen path.
 
         :param file_name: Name of the TSP instance.
         :param instance_data: Dictionary containing instance data.
@@ -214,6 +421,15 @@ class TaskManager(QObject):
         :param plots: Dictionary of plot data.
         :return: None
         """
+        # Add the best routes and statistics returned by the algorithms (or their latest snapshots), the counters
+        # of the telemetry that did not reach the GUI and the startup timings
+        for algorithm_name, results in algorithm_results.items():
+            manager = self.algorithms_manager_dict.get(algorithm_name)
+            if manager and manager.result:
+                results["best_route"] = manager.result.best_solution.tolist()
+                results["statistics"] = {**manager.result.statistics, **manager.get_telemetry_statistics(),
+                                         **{phase: round(ms, 1) for phase, ms in manager.get_startup_timings().items()}}
+
         default_report_name = self.report_selector.generate_default_report_name(file_name)
         save_path = self.report_selector.select_report_path(default_report_name)
 
@@ -0,0 +1,192 @@
+# src/backend/tsp_management/array_cache.py
+
+import os
+import json
+import glob
+from typing import Optional
+
+import numpy as np
+
+
+class ArrayCache:
+    # File signature and format version of cache entries
+    MAGIC: bytes = b"TSPARRAY"
+    VERSION: int = 1
+    # Array data starts at a multiple of this many bytes
+    ALIGNMENT: int = 64
+
+    def __init__(self, cache_directory: str, max_size_bytes: int = 2 * 1024 ** 3) -> None:
+        """
+        Initializes the ArrayCache, a persistent on-disk cache of NumPy arrays derived from TSPLIB files.
+
+        Each entry is a single binary file: a small JSON header (format version, dtype, shape and the hash of the
+        source .tsp file) followed by the raw array data, so entries can be memory-mapped without copying.
+        Entries are named "<instance>-<hash>.<kind>", so a changed .tsp file never hits a stale entry.
+
+        :param cache_directory: Directory where the cache entries are stored.
+        :param max_size_bytes: Maximum total size of the cache, least recently used entries are evicted above it.
+        :return: None
+        """
+        self.cache_directory: str = cache_directory
+        self.max_size_bytes: int = max_size_bytes
+
+    def load(self, name: str, kind: str, source_hash: str) -> Optional[np.ndarray]:
+        """
+        Memory-maps a cached array if an entry for the given instance and source hash exists.
+
+        :param name: Name of the TSP instance.
+        :param kind: Kind of the cached array, e.g. "matrix".
+        :param source_hash: SHA-256 hash of the .tsp file content the array was computed from.
+        :return: A read-only memory-mapped array, or None on a cache miss.
+        """
+        entry_path = self._entry_path(name, kind, source_hash)
+        if not os.path.exists(entry_path):
+            return None
+
+        try:
+            header, offset = self._read_header(entry_path)
+            if header.get("version") != self.VERSION or header.get("source_hash") != source_hash:
+                raise ValueError("header does not match the requested entry")
+
+            dtype = np.dtype(header["dtype"])
+            shape = tuple(header["shape"])
+            expected_size = offset + dtype.itemsize * int(np.prod(shape))
+            if os.path.getsize(entry_path) != expected_size:
+                raise ValueError("entry is truncated")
+
+            array = np.memmap(entry_path, dtype=dtype, mode="r", offset=offset, shape=shape)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Discarding invalid cache entry {entry_path}: {e}")
+            self._remove(entry_path)
+            return None
+
+        # Refresh the access time used for LRU eviction
+        os.utime(entry_path)
+        return array
+
+    def store(self, name: str, kind: str, source_hash: str, array: np.ndarray) -> np.ndarray:
+        """
+        Writes an array to the cache, replacing entries of the same instance computed from other file versions,
+        and evicts least recently used entries if the cache grows above its size limit.
+
+        :param name: Name of the TSP instance.
+        :param kind: Kind of the cached array, e.g. "matrix".
+        :param source_hash: SHA-256 hash of the .tsp file content the array was computed from.
+        :param array: The array to store.
+        :return: The stored array, memory-mapped from the cache when possible.
+        """
+        array = np.ascontiguousarray(array)
+        entry_path = self._entry_path(name, kind, source_hash)
+        header = json.dumps({
+            "version": self.VERSION,
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "source_hash": source_hash,
+        }).encode("ascii")
+
+        # Pad the header so the array data is aligned
+        prefix_size = len(self.MAGIC) + 4
+        padded_size = -(-(prefix_size + len(header)) // self.ALIGNMENT) * self.ALIGNMENT
+        header = header.ljust(padded_size - prefix_size, b" ")
+
+        try:
+            os.makedirs(self.cache_directory, exist_ok=True)
+            self._invalidate_other_versions(name, kind, entry_path)
+
+            # Write to a temporary file first, so readers never see a partially written entry
+            temporary_path = f"{entry_path}.{os.getpid()}.tmp"
+            with open(temporary_path, "wb") as file:
+                file.write(self.MAGIC)
+                file.write(len(header).to_bytes(4, "little"))
+                file.write(header)
+                # Write the array through a byte view of its buffer instead of a copy of its bytes
+                file.write(array.reshape(-1).view(np.uint8))
+            os.replace(temporary_path, entry_path)
+        except OSError as e:
+            print(f"Could not write cache entry {entry_path}: {e}")
+            return array
+
+        self.evict(keep=entry_path)
+        return self.load(name, kind, source_hash) if os.path.exists(entry_path) else array
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """
+        Removes least recently used entries until the total cache size is within the limit.
+
+        :param keep: Path of an entry that must not be evicted.
+        :return: None
+        """
+        entries = []
+        for entry_path in glob.glob(os.path.join(self.cache_directory, "*-*.*")):
+            if entry_path.endswith(".tmp"):
+                continue
+            try:
+                stat = os.stat(entry_path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry_path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries):
+            if total_size <= self.max_size_bytes:
+                break
+            if entry_path == keep:
+                continue
+            if self._remove(entry_path):
+                total_size -= size
+
+    def _entry_path(self, name: str, kind: str, source_hash: str) -> str:
+        """
+        Builds the path of the cache entry for the given instance, kind and source hash.
+
+        :return: The path of the cache entry.
+        """
+        return os.path.join(self.cache_directory, f"{self._safe_name(name)}-{source_hash[:32]}.{kind}")
+
+    def _invalidate_other_versions(self, name: str, kind: str, entry_path: str) -> None:
+        """
+        Removes entries of the same instance and kind that were computed from a different file version.
+
+        :return: None
+        """
+        pattern = os.path.join(self.cache_directory, f"{glob.escape(self._safe_name(name))}-*.{kind}")
+        for stale_path in glob.glob(pattern):
+            if stale_path != entry_path:
+                self._remove(stale_path)
+
+    def _read_header(self, entry_path: str) -> tuple[dict, int]:
+        """
+        Reads and decodes the header of a cache entry.
+
+        :param entry_path: Path of the cache entry.
+        :return: A tuple of the decoded header and the byte offset of the array data.
+        :raises ValueError: If the file is not a valid cache entry.
+        """
+        with open(entry_path, "rb") as file:
+            if file.read(len(self.MAGIC)) != self.MAGIC:
+                raise ValueError("invalid file signature")
+            header_size = int.from_bytes(file.read(4), "little")
+            header = json.loads(file.read(header_size).decode("ascii"))
+        return header, len(self.MAGIC) + 4 + header_size
+
+    @staticmethod
+    def _safe_name(name: str) -> str:
+        """
+        Replaces characters that are not safe in file names.
+
+        :return: The sanitized name.
+        """
+        return "".join(char if char.isalnum() or char in "._" else "_" for char in name)
+
+    @staticmethod
+    def _remove(entry_path: str) -> bool:
+        """
+        Removes a cache entry, ignoring entries that are already gone or still in use.
+
+        :return: True if the entry was removed, False otherwise.
+        """
+        try:
+            os.remove(entry_path)
+            return True
+        except OSError:
+            return False
@@ -0,0 +1,202 @@
+# src/backend/tsp_management/candidate_lists.py
+
+import math
+from typing import Optional
+
+import numpy as np
+
+from src.backend.tsp_management.distance_engine import DistanceEngine
+from src.backend.tsp_management.distance_matrix import DistanceMatrix
+
+
+class CandidateListBuilder:
+    # Edge weight types whose distances grow monotonically with the planar Euclidean distance
+    PLANAR_TYPES: tuple[str, ...] = ("EUC_2D", "CEIL_2D", "ATT")
+
+    def __init__(self, distance_engine: Optional[DistanceEngine] = None, points_per_cell: int = 2,
+                 batch_size: int = 16384) -> None:
+        """
+        Initializes the CandidateListBuilder, which computes the k nearest neighbors of every city.
+
+        Planar instances use a uniform grid (a spatial hash), so only nearby cells are searched. GEO instances and
+        explicit distance matrices use a partial sort of the distance rows.
+
+        :param distance_engine: Engine used to compute GEO distance rows.
+        :param points_per_cell: Average number of cities per grid cell.
+        :param batch_size: Number of cities processed together, bounding the size of temporary arrays.
+        :return: None
+        """
+        self.distance_engine: DistanceEngine = distance_engine or DistanceEngine()
+        self.points_per_cell: int = points_per_cell
+        self.batch_size: int = batch_size
+
+    def from_coordinates(self, coordinates: np.ndarray, edge_weight_type: str, k: int) -> np.ndarray:
+        """
+        Computes candidate lists from city coordinates.
+
+        :param coordinates: Array of shape (n, 2) with city coordinates.
+        :param edge_weight_type: The TSPLIB edge weight type of the instance.
+        :param k: Number of nearest neighbors per city.
+        :return: An int32 array of shape (n, min(k, n - 1)), each row sorted from the nearest neighbor.
+        :raises ValueError: If the edge weight type is not supported or k is not positive.
+        """
+        coordinates = np.asarray(coordinates, dtype=np.float64)
+        k = self._validate_size(k, len(coordinates))
+
+        if edge_weight_type in self.PLANAR_TYPES:
+            return self._grid_neighbors(coordinates, k)
+        if edge_weight_type == "GEO":
+            return self._row_neighbors(
+                lambda start, end: self.distance_engine.compute_rows(coordinates, "GEO", start, end),
+                len(coordinates), k)
+        raise ValueError(f"Unsupported EDGE_WEIGHT_TYPE for candidate lists: {edge_weight_type}")
+
+    def from_distance_matrix(self, distance_matrix: DistanceMatrix, k: int) -> np.ndarray:
+        """
+        Computes candidate lists from a distance matrix (used for EXPLICIT instances).
+
+        :param distance_matrix: The compact distance matrix.
+        :param k: Number of nearest neighbors per city.
+        :return: An int32 array of shape (n, min(k, n - 1)), each row sorted from the nearest neighbor.
+        :raises ValueError: If k is not positive.
+        """
+        k = self._validate_size(k, len(distance_matrix))
+        return self._row_neighbors(distance_matrix.rows, len(distance_matrix), k)
+
+    @staticmethod
+    def _validate_size(k: int, num_cities: int) -> int:
+        """
+        Validates the requested list size and clamps it to the number of other cities.
+
+        :return: The effective list size.
+        :raises ValueError: If k is not positive or there are fewer than two cities.
+        """
+        if k <= 0:
+            raise ValueError(f"Candidate list size must be positive, got {k}.")
+        if num_cities < 2:
+            raise ValueError("Candidate lists require at least two cities.")
+        return min(k, num_cities - 1)
+
+    def _row_neighbors(self, get_rows, num_cities: int, k: int) -> np.ndarray:
+        """
+        Selects the k nearest neighbors of every city by partially sorting blocks of distance rows.
+
+        :param get_rows: Function returning the distance rows [start, end) as an array of shape (end - start, n).
+        :param num_cities: The number of cities.
+        :param k: Number of nearest neighbors per city.
+        :return: An int32 array of shape (n, k).
+        """
+        candidates = np.empty((num_cities, k), dtype=np.int32)
+        rows_per_block = max(1, self.batch_size * 64 // num_cities)
+
+        for start in range(0, num_cities, rows_per_block):
+            end = min(start + rows_per_block, num_cities)
+            # Integer keys ordering by distance, with ties broken by city index
+            keys = np.asarray(get_rows(start, end), dtype=np.int64) * num_cities + np.arange(num_cities)
+            # Exclude the city itself
+            keys[np.arange(end - start), np.arange(start, end)] = np.iinfo(np.int64).max
+
+            nearest = np.argpartition(keys, k - 1, axis=1)[:, :k]
+            order = np.argsort(np.take_along_axis(keys, nearest, axis=1), axis=1)
+            candidates[start:end] = np.take_along_axis(nearest, order, axis=1)
+
+        return candidates
+
+    def _grid_neighbors(self, points: np.ndarray, k: int) -> np.ndarray:
+        """
+        Selects the k nearest neighbors of every city (by planar Euclidean distance) using a uniform grid.
+
+        Each city first searches the cells within a small radius around its own cell. A result is exact when the
+        k-th neighbor is closer than the nearest border of the searched window; otherwise the radius is doubled
+        for the remaining cities.
+
+        :param points: Array of shape (n, 2) with city coordinates.
+        :param k: Number of nearest neighbors per city.
+        :return: An int32 array of shape (n, k).
+        """
+        num_cities = len(points)
+        minimum = points.min(axis=0)
+        extent = np.maximum(points.max(axis=0) - minimum, 1e-12)
+
+        # Square cells, sized for the requested average occupancy
+        cell_size = max(math.sqrt(extent[0] * extent[1] * self.points_per_cell / num_cities),
+                        max(extent) / 4096, 1e-12)
+        grid_shape = np.minimum((extent // cell_size).astype(np.int64) + 1, 4096)
+        cells = np.minimum(((points - minimum) // cell_size).astype(np.int64), grid_shape - 1)
+
+        # Cities sorted by cell, with the index range of every cell
+        cell_ids = cells[:, 0] * grid_shape[1] + cells[:, 1]
+        order = np.argsort(cell_ids, kind="stable")
+        cell_starts = np.searchsorted(cell_ids[order], np.arange(grid_shape[0] * grid_shape[1] + 1))
+
+        candidates = np.empty((num_cities, k), dtype=np.int32)
+        pending = np.arange(num_cities)
+        radius = max(1, math.ceil(math.sqrt(k / self.points_per_cell) / 2))
+
+        while len(pending):
+            unresolved = []
+            for batch_start in range(0, len(pending), self.batch_size):
+                batch = pending[batch_start:batch_start + self.batch_size]
+                exhaustive = radius >= max(grid_shape)
+                resolved, neighbors = self._search_window(points, cells, grid_shape, order, cell_starts, batch,
+                                                          radius, cell_size, k, exhaustive)
+                candidates[batch[resolved]] = neighbors[resolved]
+                unresolved.append(batch[~resolved])
+            pending = np.concatenate(unresolved)
+            radius *= 2
+
+        return candidates
+
+    @staticmethod
+    def _search_window(points: np.ndarray, cells: np.ndarray, grid_shape: np.ndarray, order: np.ndarray,
+                       cell_starts: np.ndarray, batch: np.ndarray, radius: int, cell_size: float, k: int,
+                       exhaustive: bool) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the k nearest neighbors of a batch of cities among the cells within the given radius.
+
+        :return: A tuple of a boolean mask of cities with an exact result and their (len(batch), k) neighbors.
+        """
+        batch_cells = cells[batch]
+        pair_cities, pair_others = [], []
+
+        # Collect (city, other city) pairs for every cell offset of the search window
+        for dx in range(-radius, radius + 1):
+            for dy in range(-radius, radius + 1):
+                neighbor_cells = batch_cells + (dx, dy)
+                inside = np.all((neighbor_cells >= 0) & (neighbor_cells < grid_shape), axis=1)
+                cell_ids = neighbor_cells[inside, 0] * grid_shape[1] + neighbor_cells[inside, 1]
+                starts = cell_starts[cell_ids]
+                counts = cell_starts[cell_ids + 1] - starts
+                if not counts.sum():
+                    continue
+                owners = np.repeat(np.flatnonzero(inside), counts)
+                offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+                pair_cities.append(owners)
+                pair_others.append(order[np.repeat(starts, counts) + offsets])
+
+        owners = np.concatenate(pair_cities) if pair_cities else np.empty(0, dtype=np.int64)
+        others = np.concatenate(pair_others) if pair_others else np.empty(0, dtype=np.int64)
+        keep = others != batch[owners]
+        owners, others = owners[keep], others[keep]
+        squared = np.sum((points[others] - points[batch[owners]]) ** 2, axis=1)
+
+        # Sort pairs by owner, then distance, then city index, and take the first k of every owner
+        pair_order = np.lexsort((others, squared, owners))
+        owners, others, squared = owners[pair_order], others[pair_order], squared[pair_order]
+        group_starts = np.searchsorted(owners, np.arange(len(batch) + 1))
+        found = np.diff(group_starts)
+
+        neighbors = np.zeros((len(batch), k), dtype=np.int32)
+        kth_squared = np.full(len(batch), np.inf)
+        complete = found >= k
+        take = group_starts[:-1][complete, None] + np.arange(k)
+        neighbors[complete] = others[take]
+        kth_squared[complete] = squared[take[:, -1]]
+
+        if exhaustive:
+            return complete, neighbors
+
+        # The window is guaranteed to contain every city closer than the distance to its nearest border
+        local = (points[batch] - (batch_cells * cell_size + points.min(axis=0))) / cell_size
+        border = (radius + np.min(np.minimum(local, 1.0 - local), axis=1)) * cell_size
+        return complete & (kth_squared <= np.maximum(border, 0.0) ** 2), neighbors
@@ -0,0 +1,160 @@
+# src/backend/tsp_management/catalog_index.py
+
+import os
+import json
+import sqlite3
+from typing import Optional, Dict, Tuple, Iterable, Any
+
+
+class CatalogIndex:
+    # Schema version, an index with another version is rebuilt from scratch
+    VERSION: int = 1
+
+    def __init__(self, index_path: str) -> None:
+        """
+        Initializes the CatalogIndex, a persistent SQLite index of the TSPLIB files known to the catalog.
+
+        For every file the index stores its size and modification time, its header fields, its optimal result and
+        the content hash under which its arrays are stored in the ArrayCache. A file whose size and modification
+        time still match its entry does not have to be read again.
+
+        :param index_path: Path to the SQLite database file.
+        :return: None
+        """
+        self.index_path: str = index_path
+        self.connection: Optional[sqlite3.Connection] = None
+
+    def lookup(self, file_path: str, signature: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+        """
+        Returns the entry of a file if it was indexed with the given size and modification time.
+
+        :param file_path: Path to the .tsp file.
+        :param signature: Current (size, mtime in nanoseconds) of the file.
+        :return: A dictionary with header, optimal_result and content_hash, or None if the entry is missing or stale.
+        """
+        row = self._execute("SELECT size, mtime_ns, header, optimal_result, content_hash FROM files "
+                            "WHERE file_path = ?", (file_path,), fetch=True)
+        if not row or tuple(row[0][:2]) != tuple(signature):
+            return None
+        _, _, header, optimal_result, content_hash = row[0]
+        return {"header": json.loads(header), "optimal_result": optimal_result, "content_hash": content_hash}
+
+    def store(self, file_path: str, signature: Tuple[int, int], header: Dict[str, str],
+              optimal_result: Optional[int]) -> None:
+        """
+        Stores or replaces the entry of a file. The content hash is unknown until the file is fully loaded.
+
+        :param file_path: Path to the .tsp file.
+        :param signature: (size, mtime in nanoseconds) of the file the header was read from.
+        :param header: Header fields of the file.
+        :param optimal_result: The optimal result of the instance, or None if unknown.
+        :return: None
+        """
+        self._execute("INSERT OR REPLACE INTO files (file_path, size, mtime_ns, header, optimal_result, content_hash) "
+                      "VALUES (?, ?, ?, ?, ?, NULL)",
+                      (file_path, signature[0], signature[1], json.dumps(header), optimal_result))
+
+    def set_content_hash(self, file_path: str, signature: Tuple[int, int], content_hash: str) -> None:
+        """
+        Records the content hash of a fully loaded file, which locates its cached arrays.
+
+        :param file_path: Path to the .tsp file.
+        :param signature: (size, mtime in nanoseconds) of the file the hash was computed from.
+        :param content_hash: SHA-256 hash of the file content.
+        :return: None
+        """
+        self._execute("UPDATE files SET content_hash = ? WHERE file_path = ? AND size = ? AND mtime_ns = ?",
+                      (content_hash, file_path, signature[0], signature[1]))
+
+    def set_optimal_results(self, optimal_results: Iterable[Tuple[str, Optional[int]]]) -> None:
+        """
+        Updates the optimal results of indexed files.
+
+        :param optimal_results: Pairs of (file path, optimal result).
+        :return: None
+        """
+        self._execute("UPDATE files SET optimal_result = ? WHERE file_path = ?",
+                      [(optimal_result, file_path) for file_path, optimal_result in optimal_results], many=True)
+
+    def remove_missing(self, directory_path: str, file_paths: Iterable[str]) -> None:
+        """
+        Removes the entries of files in the directory that no longer exist.
+
+        :param directory_path: The directory that was listed.
+        :param file_paths: Paths of the .tsp files currently in the directory.
+        :return: None
+        """
+        existing = set(file_paths)
+        rows = self._execute("SELECT file_path FROM files", fetch=True) or []
+        removed = [(file_path,) for file_path, in rows
+                   if os.path.dirname(file_path) == directory_path and file_path not in existing]
+        self._execute("DELETE FROM files WHERE file_path = ?", removed, many=True)
+
+    def get_value(self, key: str) -> Optional[str]:
+        """
+        Returns a stored setting of the catalog, e.g. the last loaded directory.
+
+        :param key: Name of the setting.
+        :return: The stored value, or None if it is not set.
+        """
+        row = self._execute("SELECT value FROM settings WHERE key = ?", (key,), fetch=True)
+        return row[0][0] if row else None
+
+    def set_value(self, key: str, value: str) -> None:
+        """
+        Stores a setting of the catalog.
+
+        :param key: Name of the setting.
+        :param value: Value of the setting.
+        :return: None
+        """
+        self._execute("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", (key, value))
+
+    def _execute(self, statement: str, parameters: Any = (), fetch: bool = False, many: bool = False) -> Optional[list]:
+        """
+        Executes a statement in its own transaction. Errors are reported and ignored, since the index only
+        speeds up loading and the catalog works without it.
+
+        :param statement: The SQL statement.
+        :param parameters: Parameters of the statement, or a list of parameter tuples if many is True.
+        :param fetch: Whether to return the resulting rows.
+        :param many: Whether to execute the statement once per parameter tuple.
+        :return: The resulting rows if fetch is True, otherwise None.
+        """
+        try:
+            connection = self._connect()
+            with connection:
+                if many:
+                    connection.executemany(statement, parameters)
+                    return None
+                cursor = connection.execute(statement, parameters)
+                return cursor.fetchall() if fetch else None
+        except (sqlite3.Error, OSError) as e:
+            print(f"Catalog index error in {self.index_path}: {e}")
+            return None
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Opens the database on first use, creating or rebuilding its tables if the schema version differs.
+
+        :return: The open connection.
+        """
+        if self.connection is not None:
+            return self.connection
+
+        directory = os.path.dirname(self.index_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self.index_path)
+
+        with connection:
+            if connection.execute("PRAGMA user_version").fetchone()[0] != self.VERSION:
+                connection.execute("DROP TABLE IF EXISTS files")
+                connection.execute("DROP TABLE IF EXISTS settings")
+                connection.execute(f"PRAGMA user_version = {self.VERSION}")
+            connection.execute("CREATE TABLE IF NOT EXISTS files (file_path TEXT PRIMARY KEY, size INTEGER, "
+                               "mtime_ns INTEGER, header TEXT, optimal_result INTEGER, content_hash TEXT)")
+            connection.execute("CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT)")
+
+        self.connection = connection
+        return connection
@@ -0,0 +1,308 @@
+# src/backend/tsp_management/distance_engine.py
+
+import math
+from typing import Callable, Tuple
+
+import numpy as np
+
+
+class DistanceEngine:
+    # Geographical constants used by the TSPLIB GEO metric
+    GEO_PI: float = 3.141592
+    GEO_RRR: float = 6378.388
+
+    # Distances closer than this (relative) to a rounding boundary are recomputed with the scalar formula
+    BOUNDARY_TOLERANCE: float = 1e-9
+
+    def __init__(self, block_elements: int = 1 << 22) -> None:
+        """
+        Initializes the DistanceEngine, which computes TSPLIB distance matrices from city coordinates with NumPy.
+        The matrix is computed in row blocks so that temporary arrays stay bounded in size.
+
+        :param block_elements: Approximate number of matrix entries computed per block.
+        :return: None
+        """
+        self.block_elements: int = block_elements
+        self.metrics: dict[str, Tuple[Callable, Callable]] = {
+            "EUC_2D": (self._euclidean_block, self._euclidean_scalar),
+            "CEIL_2D": (self._ceil_euclidean_block, self._ceil_euclidean_scalar),
+            "ATT": (self._att_block, self._att_scalar),
+            "GEO": (self._geographical_block, self._geographical_scalar),
+        }
+
+    def compute(self, coordinates: np.ndarray, edge_weight_type: str) -> np.ndarray:
+        """
+        Computes the full distance matrix for the given coordinates using TSPLIB rounding rules.
+
+        Only the upper triangle (i < j) is evaluated, exactly as in the TSPLIB reference formulas, and mirrored
+        into the lower triangle. Values lying numerically on a rounding boundary are recomputed with the scalar
+        reference formula, so the result is bit-identical to a pure-Python evaluation.
+
+        :param coordinates: Array of shape (n, 2) with city coordinates.
+        :param edge_weight_type: One of EUC_2D, CEIL_2D, ATT or GEO.
+        :return: C-contiguous int32 array of shape (n, n).
+        :raises ValueError: If the edge weight type is not supported or coordinates are missing.
+        """
+        num_cities = len(coordinates)
+        distance_matrix = np.zeros((num_cities, num_cities), dtype=np.int32)
+
+        for row_start, row_end, block in self._upper_blocks(coordinates, edge_weight_type):
+            # Keep only the strict upper triangle of the square part and mirror it
+            size = row_end - row_start
+            square = np.triu(block[:, :size], 1)
+            distance_matrix[row_start:row_end, row_start:row_end] = square + square.T
+            distance_matrix[row_start:row_end, row_end:] = block[:, size:]
+            distance_matrix[row_end:, row_start:row_end] = block[:, size:].T
+
+        return distance_matrix
+
+    def compute_packed(self, coordinates: np.ndarray, edge_weight_type: str) -> np.ndarray:
+        """
+        Computes the strict upper triangle of the distance matrix, stored row by row, with the same values as
+        compute(). It needs half the memory of the full matrix, which is never built.
+
+        :param coordinates: Array of shape (n, 2) with city coordinates.
+        :param edge_weight_type: One of EUC_2D, CEIL_2D, ATT or GEO.
+        :return: int32 array of shape (n * (n - 1) / 2,).
+        :raises ValueError: If the edge weight type is not supported or coordinates are missing.
+        """
+        num_cities = len(coordinates)
+        upper_triangle = np.empty(num_cities * (num_cities - 1) // 2, dtype=np.int32)
+
+        for row_start, row_end, block in self._upper_blocks(coordinates, edge_weight_type):
+            # Row i of the block holds the distances to cities row_start..n-1, of which only those after i are kept
+            above_diagonal = np.arange(block.shape[1])[None, :] > np.arange(row_end - row_start)[:, None]
+            offset = row_start * num_cities - row_start * (row_start + 1) // 2
+            values = block[above_diagonal]
+            upper_triangle[offset:offset + len(values)] = values
+
+        return upper_triangle
+
+    def _upper_blocks(self, coordinates: np.ndarray, edge_weight_type: str):
+        """
+        Yields row blocks of the upper part of the distance matrix: the distances from the rows of each block to
+        every city with an index >= the first row of the block.
+
+        :param coordinates: Array of shape (n, 2) with city coordinates.
+        :param edge_weight_type: One of EUC_2D, CEIL_2D, ATT or GEO.
+        :return: Generator of (row_start, row_end, block) tuples, block being an int32 array.
+        :raises ValueError: If the edge weight type is not supported or coordinates are missing.
+        """
+        if edge_weight_type not in self.metrics:
+            raise ValueError(f"Unsupported EDGE_WEIGHT_TYPE for distance engine: {edge_weight_type}")
+
+        coordinates = np.asarray(coordinates, dtype=np.float64)
+        if coordinates.ndim != 2 or coordinates.shape[0] == 0 or coordinates.shape[1] < 2:
+            raise ValueError(f"Coordinates are required for {edge_weight_type} distance calculation.")
+
+        block_function, scalar_function = self.metrics[edge_weight_type]
+        x, y = self._prepare_coordinates(coordinates, edge_weight_type)
+
+        for row_start, row_end in self._row_blocks(x.shape[0]):
+            values = block_function(x[row_start:row_end, None], y[row_start:row_end, None],
+                                    x[None, row_start:], y[None, row_start:])
+            block = self._round_block(values, edge_weight_type)
+            if edge_weight_type == "GEO":
+                # sqrt is correctly rounded everywhere, cos/arccos are not
+                self._fix_boundary_values(block, values, scalar_function, coordinates, row_start)
+            yield row_start, row_end, block
+
+    def compute_rows(self, coordinates: np.ndarray, edge_weight_type: str, row_start: int,
+                     row_end: int) -> np.ndarray:
+        """
+        Computes the full distance rows [row_start, row_end) without building the whole matrix. Unlike compute(),
+        boundary values are not recomputed with the scalar formula, so entries may differ from the reference by
+        one unit in rare cases; this is intended for ranking neighbors, not for tour costs.
+
+        :param coordinates: Array of shape (n, 2) with city coordinates.
+        :param edge_weight_type: One of EUC_2D, CEIL_2D, ATT or GEO.
+        :param row_start: Index of the first row.
+        :param row_end: Index after the last row.
+        :return: int32 array of shape (row_end - row_start, n).
+        :raises ValueError: If the edge weight type is not supported.
+        """
+        if edge_weight_type not in self.metrics:
+            raise ValueError(f"Unsupported EDGE_WEIGHT_TYPE for distance engine: {edge_weight_type}")
+
+        block_function, _ = self.metrics[edge_weight_type]
+        x, y = self._prepare_coordinates(np.asarray(coordinates, dtype=np.float64), edge_weight_type)
+        values = block_function(x[row_start:row_end, None], y[row_start:row_end, None], x[None, :], y[None, :])
+        block = self._round_block(values, edge_weight_type)
+        block[np.arange(row_end - row_start), np.arange(row_start, row_end)] = 0
+        return block
+
+    def _row_blocks(self, num_cities: int):
+        """
+        Yields (start, end) row ranges so that each block holds roughly `block_elements` entries.
+
+        :param num_cities: The number of cities.
+        :return: Generator of (row_start, row_end) tuples.
+        """
+        rows_per_block = max(1, self.block_elements // max(num_cities, 1))
+        for row_start in range(0, num_cities, rows_per_block):
+            yield row_start, min(row_start + rows_per_block, num_cities)
+
+    def _prepare_coordinates(self, coordinates: np.ndarray, edge_weight_type: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Splits coordinates into x/y vectors, converting them to radians for the GEO metric.
+
+        :param coordinates: Array of shape (n, 2) with city coordinates.
+        :param edge_weight_type: The edge weight type.
+        :return: A tuple (x, y) of float64 vectors.
+        """
+        x = np.ascontiguousarray(coordinates[:, 0])
+        y = np.ascontiguousarray(coordinates[:, 1])
+        if edge_weight_type == "GEO":
+            return self._to_radians(x), self._to_radians(y)
+        return x, y
+
+    def _to_radians(self, deg_min: np.ndarray) -> np.ndarray:
+        """
+        Converts coordinates from DDD.MM format to radians, following the TSPLIB definition.
+
+        :param deg_min: Coordinates in DDD.MM format.
+        :return: Coordinates in radians.
+        """
+        deg = np.trunc(deg_min)
+        minutes = deg_min - deg
+        return self.GEO_PI * (deg + 5.0 * minutes / 3.0) / 180.0
+
+    @staticmethod
+    def _round_block(values: np.ndarray, edge_weight_type: str) -> np.ndarray:
+        """
+        Applies the TSPLIB rounding rule of the given metric to a block of raw distances.
+
+        :param values: Raw floating point distances (before rounding).
+        :param edge_weight_type: The edge weight type.
+        :return: Block of int32 distances.
+        """
+        if edge_weight_type == "CEIL_2D":
+            return np.ceil(values).astype(np.int32)
+        if edge_weight_type == "ATT":
+            rounded = np.trunc(values + 0.5)
+            return np.where(rounded < values, rounded + 1, rounded).astype(np.int32)
+        # EUC_2D and GEO values already include the rounding offset, only truncation is left
+        return values.astype(np.int32)
+
+    def _fix_boundary_values(self, block: np.ndarray, values: np.ndarray, scalar_function: Callable,
+                             coordinates: np.ndarray, row_start: int) -> None:
+        """
+        Recomputes entries lying on a truncation boundary with the scalar reference formula. Vectorized
+        transcendental functions may differ from libm by an ulp, which only matters at these boundaries.
+
+        :param block: Block of rounded distances, updated in place.
+        :param values: Raw floating point distances of the block.
+        :param scalar_function: Scalar reference implementation of the metric.
+        :param coordinates: Original (n, 2) coordinates.
+        :param row_start: Index of the first row (and first column) of the block.
+        :return: None
+        """
+        tolerance = self.BOUNDARY_TOLERANCE * np.maximum(np.abs(values), 1.0)
+        near_boundary = np.abs(values - np.rint(values)) < tolerance
+
+        for row, column in zip(*np.nonzero(near_boundary)):
+            i, j = row_start + row, row_start + column
+            if i < j:
+                block[row, column] = scalar_function(coordinates[i], coordinates[j])
+
+    # --- Vectorized metrics ---
+
+    @staticmethod
+    def _euclidean_block(x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray) -> np.ndarray:
+        """
+        Computes raw EUC_2D distances (with the +0.5 rounding offset) between two sets of points.
+
+        :return: Array of raw distances.
+        """
+        xd = x1 - x2
+        yd = y1 - y2
+        return np.sqrt(xd * xd + yd * yd) + 0.5
+
+    @staticmethod
+    def _ceil_euclidean_block(x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray) -> np.ndarray:
+        """
+        Computes raw CEIL_2D distances between two sets of points.
+
+        :return: Array of raw distances.
+        """
+        xd = x1 - x2
+        yd = y1 - y2
+        return np.sqrt(xd * xd + yd * yd)
+
+    @staticmethod
+    def _att_block(x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray) -> np.ndarray:
+        """
+        Computes raw pseudo-Euclidean ATT distances between two sets of points.
+
+        :return: Array of raw distances.
+        """
+        xd = x1 - x2
+        yd = y1 - y2
+        return np.sqrt((xd * xd + yd * yd) / 10.0)
+
+    def _geographical_block(self, lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray,
+                            lon2: np.ndarray) -> np.ndarray:
+        """
+        Computes raw GEO distances (with the +1.0 offset) between two sets of points given in radians.
+
+        :return: Array of raw distances.
+        """
+        q1 = np.cos(lon1 - lon2)
+        q2 = np.cos(lat1 - lat2)
+        q3 = np.cos(lat1 + lat2)
+        return self.GEO_RRR * np.arccos(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3)) + 1.0
+
+    # --- Scalar reference metrics ---
+
+    @staticmethod
+    def _euclidean_scalar(p1: np.ndarray, p2: np.ndarray) -> int:
+        """
+        Scalar TSPLIB EUC_2D distance between two points.
+
+        :return: The rounded distance.
+        """
+        x1, y1 = float(p1[0]), float(p1[1])
+        x2, y2 = float(p2[0]), float(p2[1])
+        return int(math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2) + 0.5)
+
+    @staticmethod
+    def _ceil_euclidean_scalar(p1: np.ndarray, p2: np.ndarray) -> int:
+        """
+        Scalar TSPLIB CEIL_2D distance between two points.
+
+        :return: The rounded distance.
+        """
+        x1, y1 = float(p1[0]), float(p1[1])
+        x2, y2 = float(p2[0]), float(p2[1])
+        return math.ceil(math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2))
+
+    @staticmethod
+    def _att_scalar(p1: np.ndarray, p2: np.ndarray) -> int:
+        """
+        Scalar TSPLIB ATT distance between two points.
+
+        :return: The rounded distance.
+        """
+        xd = float(p1[0]) - float(p2[0])
+        yd = float(p1[1]) - float(p2[1])
+        rij = math.sqrt((xd ** 2 + yd ** 2) / 10.0)
+        tij = int(rij + 0.5)
+        return tij + 1 if tij < rij else tij
+
+    def _geographical_scalar(self, p1: np.ndarray, p2: np.ndarray) -> int:
+        """
+        Scalar TSPLIB GEO distance between two points given in DDD.MM format.
+
+        :return: The rounded distance.
+        """
+        def to_radians(deg_min: float) -> float:
+            deg = int(deg_min)
+            minutes = deg_min - deg
+            return self.GEO_PI * (deg + 5.0 * minutes / 3.0) / 180.0
+
+        lat1, lon1 = to_radians(float(p1[0])), to_radians(float(p1[1]))
+        lat2, lon2 = to_radians(float(p2[0])), to_radians(float(p2[1]))
+        q1 = math.cos(lon1 - lon2)
+        q2 = math.cos(lat1 - lat2)
+        q3 = math.cos(lat1 + lat2)
+        return int(self.GEO_RRR * math.acos(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3)) + 1.0)
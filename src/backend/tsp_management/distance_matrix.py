@@ -0,0 +1,162 @@
+# src/backend/tsp_management/distance_matrix.py
+
+import math
+
+import numpy as np
+
+
+class DistanceMatrix:
+    # Largest weight that can be stored in the compact uint16 representation
+    UINT16_MAX: int = int(np.iinfo(np.uint16).max)
+    # Approximate number of entries expanded at a time by rows()
+    BLOCK_ELEMENTS: int = 1 << 22
+
+    def __init__(self, values: np.ndarray, dimension: int, packed: bool) -> None:
+        """
+        Initializes the DistanceMatrix, the single compact representation of a distance matrix used by TSPFile,
+        the algorithm processes and the C++ bindings.
+
+        Weights are stored as uint16 when they fit, otherwise as int32. The dense layout stores all n * n entries
+        row by row; the packed layout of symmetric matrices with a zero diagonal stores only the strict upper
+        triangle row by row, n * (n - 1) / 2 entries.
+
+        :param values: The stored entries, of shape (n, n) in the dense layout or (n * (n - 1) / 2,) when packed.
+        :param dimension: The number of cities.
+        :param packed: Whether the values hold the packed upper triangle.
+        :return: None
+        :raises ValueError: If the shape of the values does not match the layout.
+        """
+        expected_shape = (dimension * (dimension - 1) // 2,) if packed else (dimension, dimension)
+        if values.shape != expected_shape:
+            raise ValueError(f"Distance matrix values of shape {values.shape} do not match "
+                             f"the {'packed' if packed else 'dense'} layout of {dimension} cities.")
+        if values.dtype not in (np.uint16, np.int32):
+            raise ValueError(f"Unsupported distance matrix dtype: {values.dtype}")
+
+        self.values: np.ndarray = values
+        self.dimension: int = dimension
+        self.packed: bool = packed
+
+    @classmethod
+    def from_dense(cls, matrix: np.ndarray, pack_symmetric: bool = False) -> "DistanceMatrix":
+        """
+        Creates a compact matrix from a full square matrix, selecting the smallest dtype that holds all weights.
+
+        :param matrix: Square matrix of integer weights.
+        :param pack_symmetric: Whether to store only the upper triangle if the matrix is symmetric with a zero
+            diagonal; other matrices always use the dense layout.
+        :return: The compact distance matrix.
+        """
+        matrix = np.asarray(matrix)
+        dimension = matrix.shape[0]
+        if pack_symmetric and np.array_equal(matrix, matrix.T) and not np.diagonal(matrix).any():
+            return cls.from_packed(matrix[np.triu_indices(dimension, k=1)])
+        return cls(cls._compact(matrix), dimension, packed=False)
+
+    @classmethod
+    def from_packed(cls, upper_triangle: np.ndarray) -> "DistanceMatrix":
+        """
+        Creates a compact matrix from the strict upper triangle of a symmetric matrix, stored row by row.
+
+        :param upper_triangle: Flat array of n * (n - 1) / 2 integer weights.
+        :return: The compact distance matrix in the packed layout.
+        """
+        upper_triangle = np.asarray(upper_triangle)
+        return cls(cls._compact(upper_triangle), cls.packed_dimension(len(upper_triangle)), packed=True)
+
+    @classmethod
+    def from_array(cls, values: np.ndarray) -> "DistanceMatrix":
+        """
+        Wraps already compact values without copying them, e.g. an array memory-mapped from the cache. The layout
+        is taken from the number of dimensions: a square array is dense, a flat array is packed.
+
+        :param values: A uint16 or int32 array in the dense or packed layout.
+        :return: The distance matrix backed by the given array.
+        :raises ValueError: If the array does not hold a valid layout.
+        """
+        if values.ndim == 1:
+            return cls(values, cls.packed_dimension(len(values)), packed=True)
+        return cls(values, values.shape[0], packed=False)
+
+    @staticmethod
+    def packed_dimension(length: int) -> int:
+        """
+        Returns the number of cities of a packed upper triangle with the given number of entries.
+
+        :param length: Number of packed entries.
+        :return: The number of cities.
+        :raises ValueError: If the length is not a triangular number.
+        """
+        dimension = (1 + math.isqrt(1 + 8 * length)) // 2
+        if dimension * (dimension - 1) // 2 != length:
+            raise ValueError(f"{length} entries do not form the upper triangle of a square matrix.")
+        return dimension
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns the memory used by the stored entries.
+
+        :return: Size in bytes.
+        """
+        return self.values.nbytes
+
+    def __len__(self) -> int:
+        """
+        Returns the number of cities.
+
+        :return: The dimension of the matrix.
+        """
+        return self.dimension
+
+    def rows(self, start: int, end: int) -> np.ndarray:
+        """
+        Expands the full distance rows [start, end) of the matrix.
+
+        :param start: Index of the first row.
+        :param end: Index after the last row.
+        :return: int32 array of shape (end - start, n).
+        """
+        if not self.packed:
+            return self.values[start:end].astype(np.int32)
+
+        row_ids = np.arange(start, end)[:, None]
+        column_ids = np.arange(self.dimension)[None, :]
+        low = np.minimum(row_ids, column_ids)
+        high = np.maximum(row_ids, column_ids)
+        # Position of (low, high) in the packed upper triangle; the diagonal is masked below
+        indices = low * self.dimension - low * (low + 1) // 2 + high - low - 1
+        block = self.values[np.maximum(indices, 0)].astype(np.int32)
+        block[low == high] = 0
+        return block
+
+    def to_dense(self) -> np.ndarray:
+        """
+        Expands the matrix to a full square int32 array.
+
+        :return: int32 array of shape (n, n).
+        """
+        if not self.packed:
+            return self.values.astype(np.int32)
+
+        dense = np.empty((self.dimension, self.dimension), dtype=np.int32)
+        rows_per_block = max(1, self.BLOCK_ELEMENTS // max(self.dimension, 1))
+        for start in range(0, self.dimension, rows_per_block):
+            end = min(start + rows_per_block, self.dimension)
+            dense[start:end] = self.rows(start, end)
+        return dense
+
+    @classmethod
+    def _compact(cls, values: np.ndarray) -> np.ndarray:
+        """
+        Converts weights to uint16 if all of them fit, otherwise to int32.
+
+        :param values: Array of integer weights.
+        :return: A C-contiguous uint16 or int32 array.
+        :raises ValueError: If a weight does not fit into int32.
+        """
+        if values.size == 0 or (values.min() >= 0 and values.max() <= cls.UINT16_MAX):
+            return np.ascontiguousarray(values, dtype=np.uint16)
+        if values.min() < np.iinfo(np.int32).min or values.max() > np.iinfo(np.int32).max:
+            raise ValueError("Distance matrix weights do not fit into 32-bit integers.")
+        return np.ascontiguousarray(values, dtype=np.int32)
@@ -0,0 +1,134 @@
+# src/backend/tsp_management/distance_source.py
+
+from typing import Optional, List, Tuple
+
+import numpy as np
+
+from src.backend.tsp_management.distance_matrix import DistanceMatrix
+from src.backend.tsp_management.shared_array import SharedArray
+
+
+class DistanceSource:
+    def __init__(self, distance_matrix: Optional[DistanceMatrix] = None,
+                 coordinates: Optional[List[Tuple[float, float]]] = None,
+                 edge_weight_type: Optional[str] = None, row_cache_size: int = 0,
+                 candidate_lists: Optional[np.ndarray] = None) -> None:
+        """
+        Initializes the DistanceSource, which describes how the algorithms obtain distances between cities:
+        either from a compact distance matrix, or computed on demand from coordinates (matrix-free mode).
+
+        :param distance_matrix: The compact distance matrix, or None in matrix-free mode.
+        :param coordinates: City coordinates used in matrix-free mode.
+        :param edge_weight_type: The TSPLIB edge weight type used to compute distances in matrix-free mode.
+        :param row_cache_size: Number of full distance rows cached by the algorithms in matrix-free mode.
+        :param candidate_lists: Optional (n, k) int32 array of nearest neighbors; if given, the algorithms only
+            generate moves that create an edge from a city to one of its candidates.
+        :return: None
+        :raises ValueError: If neither a distance matrix nor coordinates are provided.
+        """
+        if distance_matrix is None and not coordinates:
+            raise ValueError("Either a distance matrix or coordinates must be provided.")
+
+        self.distance_matrix: Optional[DistanceMatrix] = distance_matrix
+        self.coordinates: List[Tuple[float, float]] = coordinates or []
+        self.edge_weight_type: Optional[str] = edge_weight_type
+        self.row_cache_size: int = row_cache_size
+        self.candidate_lists: Optional[np.ndarray] = candidate_lists
+        # The distance matrix and the candidate lists published in shared memory for the worker processes, see share()
+        self.shared_matrix: Optional[SharedArray] = None
+        self.shared_candidate_lists: Optional[SharedArray] = None
+
+    @property
+    def is_matrix_free(self) -> bool:
+        """
+        Checks whether distances are computed on demand from coordinates.
+
+        :return: True in matrix-free mode, False if a distance matrix is used.
+        """
+        return self.distance_matrix is None
+
+    def share(self) -> None:
+        """
+        Publishes the distance matrix and the candidate lists in shared memory, so that all worker processes
+        solving the instance attach to a single copy instead of receiving their own. Pickling the source then
+        passes only the descriptors of the shared arrays. The matrix is not published in matrix-free mode; arrays
+        that are already shared are not published again.
+
+        :return: None
+        """
+        if not self.is_matrix_free and self.shared_matrix is None:
+            self.shared_matrix = SharedArray.publish(self.distance_matrix.values)
+        if self.candidate_lists is not None and self.shared_candidate_lists is None:
+            self.shared_candidate_lists = SharedArray.publish(
+                np.ascontiguousarray(self.candidate_lists, dtype=np.int32))
+
+    def release(self) -> None:
+        """
+        Releases the shared copies of the distance matrix and the candidate lists once the worker processes no
+        longer need them.
+
+        :return: None
+        """
+        if self.shared_matrix is not None:
+            self.shared_matrix.release()
+            self.shared_matrix = None
+        if self.shared_candidate_lists is not None:
+            self.shared_candidate_lists.release()
+            self.shared_candidate_lists = None
+
+    def to_binding_kwargs(self) -> dict:
+        """
+        Returns the distance-related keyword arguments of the C++ algorithm constructors. The matrix is passed
+        as its compact NumPy array (square when dense, flat when packed), the candidate lists as a C-contiguous
+        int32 (n, k) array, so the engines view both in place; shared arrays are passed as read-only views of the
+        shared memory. In matrix-free mode the matrix is empty, and so are the candidate lists if there are none.
+
+        :return: A dictionary with dist_matrix, coordinates, edge_weight_type, row_cache_size and candidate_lists.
+        """
+        if self.shared_candidate_lists is not None:
+            candidate_lists = self.shared_candidate_lists.attach()
+        elif self.candidate_lists is not None:
+            candidate_lists = np.ascontiguousarray(self.candidate_lists, dtype=np.int32)
+        else:
+            candidate_lists = np.empty((0, 0), dtype=np.int32)
+
+        kwargs = {"candidate_lists": candidate_lists}
+        if self.is_matrix_free:
+            kwargs.update({
+                "dist_matrix": np.empty(0, dtype=np.int32),
+                "coordinates": self.coordinates,
+                "edge_weight_type": self.edge_weight_type,
+                "row_cache_size": self.row_cache_size,
+            })
+        elif self.shared_matrix is not None:
+            kwargs["dist_matrix"] = self.shared_matrix.attach()
+        else:
+            kwargs["dist_matrix"] = self.distance_matrix.values
+        return kwargs
+
+    def __getstate__(self) -> dict:
+        """
+        Returns the pickled state of the source. A shared distance matrix and shared candidate lists are replaced
+        by their descriptors, so worker processes do not receive a copy of them.
+
+        :return: The attributes of the source.
+        """
+        state = self.__dict__.copy()
+        if self.shared_matrix is not None:
+            state["distance_matrix"] = None
+        if self.shared_candidate_lists is not None:
+            state["candidate_lists"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restores an unpickled source; a shared distance matrix and shared candidate lists are attached to again.
+
+        :param state: The attributes of the source.
+        :return: None
+        """
+        self.__dict__.update(state)
+        if self.shared_matrix is not None:
+            self.distance_matrix = DistanceMatrix.from_array(self.shared_matrix.attach())
+        if self.shared_candidate_lists is not None:
+            self.candidate_lists = self.shared_candidate_lists.attach()
@@ -0,0 +1,135 @@
+# src/backend/tsp_management/shared_array.py
+
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+
+
+class SharedArray:
+    # Number of segments a process keeps attached: the distance matrix and the candidate lists of the instance it
+    # solves. A pooled worker keeps them attached across its jobs instead of mapping them again for every run; the
+    # least recently used segment is closed when it attaches to another one
+    MAX_ATTACHED_SEGMENTS: int = 2
+    # Segments attached by this process, by name, from the least to the most recently used
+    attached_segments: dict[str, shared_memory.SharedMemory] = {}
+
+    def __init__(self, name: str, dtype: str, shape: tuple[int, ...]) -> None:
+        """
+        Initializes the descriptor of an array published in shared memory (e.g. a distance matrix or candidate
+        lists): the name of the segment and the dtype and shape of the array. Only the descriptor is pickled when it
+        is passed to a worker process, which attaches to the segment instead of receiving its own copy of the array.
+
+        :param name: Name of the shared memory segment.
+        :param dtype: The dtype of the array, e.g. uint16 or int32.
+        :param shape: The shape of the array.
+        :return: None
+        """
+        self.name: str = name
+        self.dtype: str = dtype
+        self.shape: tuple[int, ...] = shape
+        # Handle of the segment in this process: the created segment in the owner, the attached one in a worker
+        self.shared_memory: Optional[shared_memory.SharedMemory] = None
+        # Whether this process created the segment and has to unlink it
+        self.is_owner: bool = False
+
+    @classmethod
+    def publish(cls, values: np.ndarray) -> "SharedArray":
+        """
+        Copies an array into a new shared memory segment, once for all worker processes.
+
+        :param values: The array to publish.
+        :return: The owning descriptor of the segment; release() must be called when the workers are done.
+        """
+        segment = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        shared = cls(segment.name, values.dtype.str, values.shape)
+        shared.shared_memory = segment
+        shared.is_owner = True
+        np.ndarray(values.shape, dtype=values.dtype, buffer=segment.buf)[...] = values
+        return shared
+
+    def attach(self) -> np.ndarray:
+        """
+        Attaches to the segment and returns a read-only, C-contiguous view of the array without copying it. The
+        C++ engines view such arrays in place (see DistanceMatrixConversion.h and CandidateListsConversion.h).
+
+        :return: The array backed by the shared memory segment.
+        :raises FileNotFoundError: If the segment has already been released by its owner.
+        """
+        if self.shared_memory is None:
+            self.shared_memory = self._attach_segment(self.name)
+        values = np.ndarray(self.shape, dtype=np.dtype(self.dtype), buffer=self.shared_memory.buf)
+        values.flags.writeable = False
+        return values
+
+    @classmethod
+    def _attach_segment(cls, name: str) -> shared_memory.SharedMemory:
+        """
+        Returns the segment with the given name, attaching to it unless it is attached already. Beyond
+        MAX_ATTACHED_SEGMENTS, the least recently used segments are closed, so a process keeps only the segments of
+        its current instance mapped. Attaching registers the segment with the resource tracker again; the worker
+        processes must share the tracker of the owner (see WorkerPool), where the segment is already registered, so
+        that only the owner's release() unlinks it.
+
+        :param name: Name of the shared memory segment.
+        :return: The attached segment.
+        :raises FileNotFoundError: If the segment has already been released by its owner.
+        """
+        segment = cls.attached_segments.pop(name, None)
+        if segment is None:
+            while len(cls.attached_segments) >= cls.MAX_ATTACHED_SEGMENTS:
+                cls._close_segment(cls.attached_segments.pop(next(iter(cls.attached_segments))))
+            segment = shared_memory.SharedMemory(name=name)
+        cls.attached_segments[name] = segment
+        return segment
+
+    @staticmethod
+    def _close_segment(segment: shared_memory.SharedMemory) -> None:
+        """
+        Closes a segment in this process.
+
+        :param segment: The segment to close.
+        :return: None
+        """
+        try:
+            segment.close()
+        except BufferError:
+            # An array returned by attach() is still alive; the mapping is closed when it is garbage collected
+            pass
+
+    def release(self) -> None:
+        """
+        Unlinks the segment in its owner, after which no process can attach to it anymore. Processes that are
+        still attached keep their mapping until they close it or exit. Arrays returned by attach() in the owner
+        must no longer be used. A segment that has already been unlinked is ignored.
+
+        :return: None
+        """
+        if self.shared_memory is None:
+            return
+        if self.is_owner:
+            self._close_segment(self.shared_memory)
+            try:
+                self.shared_memory.unlink()
+            except FileNotFoundError:
+                print(f"Shared array {self.name} was already unlinked.")
+            self.is_owner = False
+        self.shared_memory = None
+
+    def __getstate__(self) -> dict:
+        """
+        Returns the pickled state of the descriptor, without the handle of the segment, so that a worker process
+        attaches to the segment itself and never unlinks it.
+
+        :return: The name, dtype and shape of the segment.
+        """
+        return {"name": self.name, "dtype": self.dtype, "shape": self.shape}
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restores an unpickled descriptor, not attached to the segment yet.
+
+        :param state: The name, dtype and shape of the segment.
+        :return: None
+        """
+        self.__init__(state["name"], state["dtype"], tuple(state["shape"]))
@@ -1,48 +1,234 @@
 # src/backend/tsp_management/tsp_catalog.py
 
 import os
-from typing import Optional, List
+import json
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from typing import Optional, List, Dict, Tuple
 
+from src.backend.tsp_management.array_cache import ArrayCache
+from src.backend.tsp_management.catalog_index import CatalogIndex
 from src.backend.tsp_management.tsplib_parser import TSPLIBParser
 from src.backend.tsp_management.tsp_file import TSPFile
 
 
+def read_tsp_header(file_path: str) -> Dict[str, str]:
+    """
+    Reads the header of a .tsp file. Defined at module level so it can be executed in a worker process.
+
+    :param file_path: Path to the .tsp file.
+    :return: A dictionary with all header fields of the file.
+    """
+    return TSPLIBParser().read_header(file_path)
+
+
 class TSPCatalog:
-    def __init__(self, optimal_results_path: str) -> None:
+    # File name of the persistent catalog index inside the cache directory
+    INDEX_FILE_NAME: str = "catalog_index.sqlite"
+
+    def __init__(self, optimal_results_path: str, cache_directory: Optional[str] = None,
+                 max_workers: Optional[int] = None) -> None:
         """
         Initializes the TSPCatalog class, which manages a collection of TSP files.
 
         :param optimal_results_path: Path to the JSON file containing optimal results for all problems.
+        :param cache_directory: Optional directory for the on-disk distance matrix cache and the catalog index.
+        :param max_workers: Maximum number of worker processes reading file headers, defaults to the CPU count.
         :return: None
         """
         self.tsp_files: List[TSPFile] = []  # List to store loaded TSP files
+        self.files_by_name: Dict[str, TSPFile] = {}  # Loaded TSP files by instance name
         self.optimal_results_path: str = optimal_results_path  # Path to optimal results file
+        self.cache: Optional[ArrayCache] = ArrayCache(cache_directory) if cache_directory else None
+        self.index: Optional[CatalogIndex] = (
+            CatalogIndex(os.path.join(cache_directory, self.INDEX_FILE_NAME)) if cache_directory else None)
+        self.max_workers: int = max_workers or os.cpu_count() or 1
+        self.pending_files: Dict[Future, Tuple[str, Tuple[int, int]]] = {}  # Header reads still running
+        self.indexed_files: List[TSPFile] = []  # Files restored from the index, not collected yet
+        self.optimal_data: Optional[Dict] = None  # optimal_results.json decoded once per loaded directory
+
+    @property
+    def is_loading(self) -> bool:
+        """
+        Checks whether files of the catalog are still being loaded.
+
+        :return: True if some files have not been collected yet, False otherwise.
+        """
+        return bool(self.pending_files or self.indexed_files)
 
     def clear_files(self) -> None:
         """
-        Clears the list of loaded TSP files.
+        Clears the list of loaded TSP files and cancels loading that is still in progress.
 
         :return: None
         """
+        for future in self.pending_files:
+            future.cancel()
+        self.pending_files.clear()
+        self.indexed_files.clear()
         self.tsp_files.clear()
+        self.files_by_name.clear()
 
     def load_files(self, directory_path: str) -> None:
         """
-        Loads .tsp files from the specified directory and stores them in the catalog.
+        Loads .tsp files from the specified directory and stores them in the catalog, waiting until all headers
+        have been read.
 
         :param directory_path: Path to the directory containing .tsp files.
         :return: None
         """
-        for filename in os.listdir(directory_path):
-            if filename.endswith(".tsp"):
-                try:
-                    file_path = os.path.join(directory_path, filename)
-                    parser = TSPLIBParser() # Create a new parser for each file
-                    tsp_file = TSPFile(file_path, self.optimal_results_path, parser)
-                    tsp_file.load_metadata()  # Load only metadata
-                    self.tsp_files.append(tsp_file)
-                except Exception as e:
-                    print(f"Error loading file {filename}: {e}")
+        self.start_loading(directory_path)
+        wait(self.pending_files)
+        self.collect_loaded_files()
+
+    def start_loading(self, directory_path: str) -> None:
+        """
+        Starts loading the .tsp files in the specified directory. Files whose size and modification time match
+        their entry in the catalog index are restored from it, the headers of all other files are read in a pool
+        of worker processes. Coordinates and distance matrices are loaded when an instance is selected.
+        Loaded files are added to the catalog by collect_loaded_files().
+
+        :param directory_path: Path to the directory containing .tsp files.
+        :return: None
+        """
+        directory_path = os.path.abspath(directory_path)
+        file_paths = [os.path.join(directory_path, filename) for filename in sorted(os.listdir(directory_path))
+                      if filename.endswith(".tsp")]
+        self.optimal_data = None
+
+        # Optimal results stored in the index are only valid for the same version of the JSON file
+        optimal_results_signature = str(self._read_signature(self.optimal_results_path))
+        optimal_results_changed = (self.index is None or
+                                   self.index.get_value("optimal_results_signature") != optimal_results_signature)
+
+        unindexed_files = []
+        for file_path in file_paths:
+            signature = self._read_signature(file_path)
+            entry = self.index.lookup(file_path, signature) if self.index and signature else None
+            if entry is None:
+                unindexed_files.append((file_path, signature))
+                continue
+
+            tsp_file = TSPFile(file_path, self.optimal_results_path, TSPLIBParser(), self.cache)
+            tsp_file.load_header(entry["header"])
+            tsp_file.file_signature = signature
+            tsp_file.content_hash = entry["content_hash"]
+            if optimal_results_changed:
+                tsp_file.load_optimal_results(self._get_optimal_data())
+            else:
+                tsp_file.optimal_result = entry["optimal_result"]
+            self.indexed_files.append(tsp_file)
+
+        if self.index is not None:
+            if optimal_results_changed:
+                self.index.set_optimal_results((tsp_file.file_path, tsp_file.optimal_result)
+                                               for tsp_file in self.indexed_files)
+                self.index.set_value("optimal_results_signature", optimal_results_signature)
+            self.index.remove_missing(directory_path, file_paths)
+            self.index.set_value("last_directory", directory_path)
+
+        if not unindexed_files:
+            return
+
+        executor = ProcessPoolExecutor(max_workers=min(self.max_workers, len(unindexed_files)))
+        for file_path, signature in unindexed_files:
+            self.pending_files[executor.submit(read_tsp_header, file_path)] = (file_path, signature)
+        # Submitted reads still complete, the workers exit once they are done
+        executor.shutdown(wait=False)
+
+    def start_loading_last_directory(self) -> bool:
+        """
+        Starts loading the directory that was loaded last, as recorded in the catalog index.
+
+        :return: True if loading has started, False if no directory is recorded or it no longer exists.
+        """
+        directory_path = self.index.get_value("last_directory") if self.index else None
+        if not directory_path or not os.path.isdir(directory_path):
+            return False
+        self.clear_files()
+        self.start_loading(directory_path)
+        return True
+
+    def collect_loaded_files(self) -> List[TSPFile]:
+        """
+        Adds the files restored from the index and the files whose headers have been read since the last call
+        to the catalog, without blocking. Newly read headers are stored in the index.
+
+        :return: The newly added TSP files.
+        """
+        loaded_files = self.indexed_files
+        self.indexed_files = []
+
+        for future in [future for future in self.pending_files if future.done()]:
+            file_path, signature = self.pending_files.pop(future)
+            try:
+                parser = TSPLIBParser() # Create a new parser for each file
+                tsp_file = TSPFile(file_path, self.optimal_results_path, parser, self.cache)
+                header = future.result()
+                tsp_file.load_header(header)  # Load only the header
+                tsp_file.file_signature = signature
+                tsp_file.load_optimal_results(self._get_optimal_data())
+                loaded_files.append(tsp_file)
+            except Exception as e:
+                print(f"Error loading file {os.path.basename(file_path)}: {e}")
+                continue
+
+            if self.index is not None and signature is not None:
+                self.index.store(file_path, signature, header, tsp_file.optimal_result)
+
+        self.tsp_files.extend(loaded_files)
+        for tsp_file in loaded_files:
+            self.files_by_name.setdefault(tsp_file.name, tsp_file)
+        return loaded_files
+
+    def load_file(self, name: str) -> Optional[TSPFile]:
+        """
+        Retrieves a TSP file by its name and loads its full metadata if only the header has been loaded,
+        recording its content hash (the key of its cached arrays) in the index.
+
+        :param name: The name of the .tsp file.
+        :return: The loaded TSPFile object, or None if not found.
+        :raises ValueError: If the file cannot be parsed.
+        """
+        tsp_file = self.get_file_by_name(name)
+        if tsp_file is None or tsp_file.has_metadata:
+            return tsp_file
+
+        tsp_file.ensure_loaded()
+        if self.index is not None and tsp_file.file_signature is not None:
+            self.index.set_content_hash(tsp_file.file_path, tsp_file.file_signature, tsp_file.content_hash)
+        return tsp_file
+
+    def _get_optimal_data(self) -> Dict:
+        """
+        Returns the decoded optimal results, reading the JSON file only once per loaded directory.
+
+        :return: A dictionary mapping instance names to optimal results, empty if the file cannot be read.
+        """
+        if self.optimal_data is None:
+            try:
+                with open(self.optimal_results_path, 'r') as json_file:
+                    optimal_data = json.load(json_file)
+                if not isinstance(optimal_data, dict):
+                    raise ValueError(f"Invalid JSON format in {self.optimal_results_path}. Expected a dictionary.")
+                self.optimal_data = optimal_data
+            except (OSError, ValueError) as e:
+                print(f"Error loading optimal results: {e}")
+                self.optimal_data = {}
+        return self.optimal_data
+
+    @staticmethod
+    def _read_signature(file_path: str) -> Optional[Tuple[int, int]]:
+        """
+        Returns the size and modification time of a file, used to detect changes on disk.
+
+        :param file_path: Path to the file.
+        :return: A tuple (size, mtime in nanoseconds), or None if the file cannot be accessed.
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
 
     def get_file_by_name(self, name: str) -> Optional[TSPFile]:
         """
@@ -51,7 +237,4 @@ class TSPCatalog:
         :param name: The name of the .tsp file.
         :return: The corresponding TSPFile object, or None if not found.
         """
-        for tsp_file in self.tsp_files:
-            if tsp_file.name == name:
-                return tsp_file
-        return None
+        return self.files_by_name.get(name)
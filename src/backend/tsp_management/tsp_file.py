@@ -2,12 +2,20 @@
 
 import os
 import json
+import hashlib
 from typing import Optional, List, Dict, Tuple
+
+import numpy as np
+
+from src.backend.tsp_management.array_cache import ArrayCache
+from src.backend.tsp_management.candidate_lists import CandidateListBuilder
+from src.backend.tsp_management.distance_matrix import DistanceMatrix
 from src.backend.tsp_management.tsplib_parser import TSPLIBParser
 
 
 class TSPFile:
-    def __init__(self, file_path:  str, optimal_results_path: str, parser: TSPLIBParser) -> None:
+    def __init__(self, file_path:  str, optimal_results_path: str, parser: TSPLIBParser,
+                 cache: Optional[ArrayCache] = None) -> None:
         """
         Initializes a TSPFile instance, representing a Traveling Salesman Problem instance with metadata and distance
         information.
@@ -15,6 +23,7 @@ class TSPFile:
         :param file_path: Path to the .tsp file.
         :param optimal_results_path: Path to the JSON file containing optimal results.
         :param parser: Instance of TSPLIBParser injected through constructor.
+        :param cache: Optional on-disk cache for computed distance matrices and candidate lists.
         """
         self.file_path: str = file_path
         self.name: Optional[str] = None
@@ -22,13 +31,64 @@ class TSPFile:
         self.dimension: Optional[int] = None
         self.edge_weight_type: Optional[str] = None
         self.edge_weight_format: Optional[str] = None
+        self.display_data_type: Optional[str] = None
+        self.has_metadata: bool = False
         self.coordinates: List[Tuple[float, float]] = []
         self.display_coordinates: List[Tuple[float, float]] = []
-        self.distance_matrix: List[List[int]] = []
+        self.distance_matrix: Optional[DistanceMatrix] = None
+        self.candidate_lists: Optional[np.ndarray] = None
         self.has_loaded: bool = False
         self.optimal_result: Optional[int] = None
         self.optimal_results_path: str = optimal_results_path
         self.parser: TSPLIBParser = parser
+        self.cache: Optional[ArrayCache] = cache
+        self.content_hash: Optional[str] = None
+        # Size and modification time of the file version the content hash and optimal result belong to, e.g. as
+        # restored from the catalog index
+        self.file_signature: Optional[Tuple[int, int]] = None
+
+    def load_header(self, header: Optional[Dict[str, str]] = None) -> None:
+        """
+        Loads only the header fields of the .tsp file (name, type, dimension and edge weight type), without reading
+        coordinates or edge weights. The full metadata is loaded later by ensure_loaded(), the optimal result
+        by load_optimal_results().
+
+        :param header: Header fields already read by TSPLIBParser.read_header(), e.g. in a worker process;
+            if None, the header is read from the file.
+        :return: None
+        :raises ValueError: If required fields are missing or contain invalid values.
+        """
+        if header is None:
+            header = self.parser.read_header(self.file_path)
+
+        self.name = header["NAME"]
+        self.type = header["TYPE"]
+        self.dimension = int(header["DIMENSION"])
+        self.edge_weight_type = header["EDGE_WEIGHT_TYPE"]
+        self.edge_weight_format = header.get("EDGE_WEIGHT_FORMAT")
+        self.display_data_type = header.get("DISPLAY_DATA_TYPE")
+
+    def ensure_loaded(self) -> None:
+        """
+        Loads the full metadata (coordinates, display coordinates and, for EXPLICIT instances, the distance matrix)
+        if only the header has been loaded so far.
+
+        :return: None
+        """
+        if not self.has_metadata:
+            self.load_metadata()
+
+    @property
+    def has_coordinates(self) -> bool:
+        """
+        Checks whether the instance has coordinates for city mapping. Before the full metadata is loaded, this is
+        determined from the header fields.
+
+        :return: True if node or display coordinates are available, False otherwise.
+        """
+        if self.has_metadata:
+            return bool(self.coordinates or self.display_coordinates)
+        return self.edge_weight_type != "EXPLICIT" or self.display_data_type == "TWOD_DISPLAY"
 
     def load_metadata(self) -> None:
         """
@@ -37,37 +97,64 @@ class TSPFile:
 
         :return: None
         """
+        self._read_metadata()
+
+        # Load distance matrix if the file has EDGE_WEIGHT_SECTION
+        if self.edge_weight_type == "EXPLICIT":
+            self.load_distance_matrix()
+
+    def _read_metadata(self) -> None:
+        """
+        Reads the metadata, coordinates and display coordinates from the .tsp file, without loading the distance
+        matrix. The distance matrix and candidate lists loaded from a previous version of the file are dropped.
+        The content hash and optimal result, e.g. restored from the catalog index, are only recomputed if the file
+        has changed since they were recorded.
+
+        :return: None
+        """
+        file_signature = self._read_file_signature()
+        is_unchanged = file_signature is not None and file_signature == self.file_signature
+        self.file_signature = file_signature
         self.parser.validate_file(self.file_path)
+        self.distance_matrix = None
+        self.candidate_lists = None
+        self.has_loaded = False
+        if not is_unchanged or self.content_hash is None:
+            self.content_hash = hashlib.sha256(self.parser.content).hexdigest()
         self.name = self.parser.get_field_value("NAME")
         self.type = self.parser.get_field_value("TYPE")
         self.dimension = int(self.parser.get_field_value("DIMENSION"))
         self.edge_weight_type = self.parser.get_field_value("EDGE_WEIGHT_TYPE")
         self.edge_weight_format = self.parser.get_field_value("EDGE_WEIGHT_FORMAT", optional=True)
-        self.load_optimal_results()
+        self.display_data_type = self.parser.get_field_value("DISPLAY_DATA_TYPE", optional=True)
+        if not is_unchanged:
+            self.load_optimal_results()
+        self.has_metadata = True
 
         # Load display coordinates only if the file has DISPLAY_DATA_SECTION
         if self.edge_weight_type != "EXPLICIT":
-            self.coordinates = self.parser.coordinates
-
-        # Load distance matrix if the file has EDGE_WEIGHT_SECTION
-        if self.edge_weight_type == "EXPLICIT":
-            self.load_distance_matrix()
+            self.coordinates = [(x, y) for x, y in self.parser.coordinates.tolist()]
 
         # Load display coordinates if the file has DISPLAY_DATA_SECTION
-        display_data_type = self.parser.get_field_value("DISPLAY_DATA_TYPE", optional=True)
-        if display_data_type == "TWOD_DISPLAY":
+        if self.display_data_type == "TWOD_DISPLAY":
             self.load_display_coordinates()
 
-    def load_optimal_results(self) -> None:
+    def load_optimal_results(self, optimal_data: Optional[Dict] = None) -> None:
         """
         Loads the optimal result for the problem from a local JSON file, handling errors appropriately.
         If the JSON file does not contain optimal data for this instance, sets optimal_result to None.
 
+        :param optimal_data: Content of the JSON file already decoded by the caller, e.g. once for a whole
+            directory; if None, the file is read.
         :return: None
         :raises FileNotFoundError: If the optimal results file cannot be found.
         :raises json.JSONDecodeError: If the JSON file is improperly formatted.
         :raises ValueError: If the JSON content does not match the expected structure.
         """
+        if optimal_data is not None:
+            self.optimal_result = optimal_data.get(os.path.basename(self.file_path).replace('.tsp', ''), None)
+            return
+
         try:
             # Ensure the JSON file exists
             if not self.optimal_results_path or not os.path.exists(self.optimal_results_path):
@@ -107,20 +194,103 @@ class TSPFile:
         """
         self.display_coordinates = self.parser.load_display_coordinates()
 
-    def load_distance_matrix(self) -> None:
+    def load_distance_matrix(self, packed: Optional[bool] = None) -> None:
         """
-        Loads the distance matrix using the parser if it has not already been loaded.
+        Loads the compact distance matrix if it has not already been loaded in the requested layout. The matrix
+        is memory-mapped from the cache when an entry for the current file content exists, without parsing the
+        edge weights of EXPLICIT files; otherwise it is generated by the parser and cached.
 
+        :param packed: Whether to store only the upper triangle of symmetric matrices, or None to accept
+            any layout (the dense one if the matrix is not loaded yet).
         :return: None
         """
-        if not self.has_loaded:
-            self.parser.generate_distance_matrix()
-            self.distance_matrix = self.parser.get_distance_matrix()
-            self.has_loaded = True
-        else:
+        # Read the full metadata if only the header was loaded, or re-read the file if it has changed on disk
+        file_signature = self._read_file_signature()
+        if not self.has_metadata or (file_signature is not None and file_signature != self.file_signature):
+            self._read_metadata()
+
+        if self.has_loaded and (packed is None or self.distance_matrix.packed == packed):
             print("Distance matrix already loaded.")
+            return
+
+        if self.has_loaded:
+            # Convert the loaded matrix, asymmetric matrices always stay dense
+            self.distance_matrix = DistanceMatrix.from_dense(self.distance_matrix.to_dense(), pack_symmetric=packed)
+            return
+
+        packed = bool(packed)
+        kind = "packed_matrix" if packed else "matrix"
+        distance_matrix = None
+        if self.cache is not None:
+            cached_values = self.cache.load(self.name, kind, self.content_hash)
+            if cached_values is not None:
+                distance_matrix = DistanceMatrix.from_array(cached_values)
+
+        if distance_matrix is None:
+            # Coordinate-based matrices are symmetric and can be computed directly in the packed layout
+            self.parser.generate_distance_matrix(packed=packed and self.edge_weight_type != "EXPLICIT")
+            values = self.parser.get_distance_matrix()
+            if values.ndim == 1:
+                distance_matrix = DistanceMatrix.from_packed(values)
+            else:
+                distance_matrix = DistanceMatrix.from_dense(values, pack_symmetric=packed)
+            if self.cache is not None:
+                distance_matrix = DistanceMatrix.from_array(
+                    self.cache.store(self.name, kind, self.content_hash, distance_matrix.values))
+
+        # Release the uncompacted matrix of the parser, whether it was generated or left from an earlier load
+        self.parser.distance_matrix = np.zeros((0, 0), dtype=np.int32)
+        self.distance_matrix = distance_matrix
+        self.has_loaded = True
+
+    def load_candidate_lists(self, k: int) -> np.ndarray:
+        """
+        Loads the k-nearest-neighbor candidate lists of all cities, from the cache when an entry for the current
+        file content exists, otherwise computes and caches them. EXPLICIT instances use the distance matrix,
+        all other instances the coordinates, so no distance matrix is needed for them.
+
+        :param k: Number of nearest neighbors per city.
+        :return: An int32 array of shape (n, min(k, n - 1)), each row sorted from the nearest neighbor.
+        :raises ValueError: If k is not positive or the edge weight type is not supported.
+        """
+        file_signature = self._read_file_signature()
+        if not self.has_metadata or (file_signature is not None and file_signature != self.file_signature):
+            self.load_metadata()
+        if self.candidate_lists is not None and self.candidate_lists.shape[1] == min(k, self.dimension - 1):
+            return self.candidate_lists
+
+        kind = f"knn{k}"
+        candidate_lists = None
+        if self.cache is not None:
+            candidate_lists = self.cache.load(self.name, kind, self.content_hash)
+
+        if candidate_lists is None:
+            builder = CandidateListBuilder()
+            if self.edge_weight_type == "EXPLICIT":
+                if not self.has_loaded:
+                    self.load_distance_matrix()
+                candidate_lists = builder.from_distance_matrix(self.distance_matrix, k)
+            else:
+                candidate_lists = builder.from_coordinates(self.parser.coordinates, self.edge_weight_type, k)
+            if self.cache is not None:
+                candidate_lists = self.cache.store(self.name, kind, self.content_hash, candidate_lists)
+
+        self.candidate_lists = candidate_lists
+        return candidate_lists
+
+    def _read_file_signature(self) -> Optional[Tuple[int, int]]:
+        """
+        Returns the size and modification time of the .tsp file, used to detect changes on disk.
+
+        :return: A tuple (size, mtime in nanoseconds), or None if the file cannot be accessed.
+        """
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
 
-    def get_distance_matrix(self) -> Optional[List[List[int]]]:
+    def get_distance_matrix(self) -> Optional[DistanceMatrix]:
         """
         Retrieves the distance matrix if it has been loaded.
 
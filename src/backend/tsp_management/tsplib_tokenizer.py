@@ -0,0 +1,105 @@
+# src/backend/tsp_management/tsplib_tokenizer.py
+
+import re
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+
+class TSPLIBTokenizer:
+    # Matches every line starting with a TSPLIB keyword, e.g. "DIMENSION : 52" or "NODE_COORD_SECTION"
+    KEYWORD_LINE = re.compile(rb"^[ \t]*([A-Z][A-Z0-9_]*)[ \t]*(?::[ \t]*(.*?))?[ \t]*\r?$", re.MULTILINE)
+
+    def __init__(self) -> None:
+        """
+        Initializes the TSPLIBTokenizer, which indexes a TSPLIB file in a single pass over its content.
+
+        Header fields are stored by name, and every data section is stored as a (start, end) byte range,
+        so sections can later be parsed directly without splitting the whole file again.
+
+        :return: None
+        """
+        self.content: bytes = b""
+        self.fields: Dict[str, str] = {}
+        self.sections: Dict[str, Tuple[int, int]] = {}
+
+    def tokenize(self, content: bytes) -> None:
+        """
+        Indexes header fields and the byte offsets of all sections of the given file content.
+
+        :param content: Raw content of the .tsp file.
+        :return: None
+        """
+        self.content = content
+        self.fields = {}
+        self.sections = {}
+
+        open_section: Optional[str] = None
+        section_start = 0
+
+        for match in self.KEYWORD_LINE.finditer(content):
+            keyword = match.group(1).decode("ascii")
+
+            if keyword.endswith("_SECTION") or keyword == "EOF":
+                # A section keyword closes the previously opened section
+                if open_section is not None:
+                    self.sections[open_section] = (section_start, match.start())
+                if keyword == "EOF":
+                    open_section = None
+                    break
+                open_section = keyword
+                section_start = match.end()
+            elif open_section is None and match.group(2) is not None and keyword not in self.fields:
+                self.fields[keyword] = match.group(2).decode("latin-1").strip()
+
+        if open_section is not None:
+            self.sections[open_section] = (section_start, len(content))
+
+    def get_field(self, field_name: str) -> Optional[str]:
+        """
+        Returns the value of a header field.
+
+        :param field_name: The name of the field, e.g. "DIMENSION".
+        :return: The field value, or None if the field is not present.
+        """
+        return self.fields.get(field_name)
+
+    def has_section(self, section_name: str) -> bool:
+        """
+        Checks whether the file contains the given section.
+
+        :param section_name: The name of the section, e.g. "NODE_COORD_SECTION".
+        :return: True if the section is present, False otherwise.
+        """
+        return section_name in self.sections
+
+    def parse_numbers(self, section_name: str, dtype: type) -> np.ndarray:
+        """
+        Parses all whitespace separated numbers of a section in bulk.
+
+        :param section_name: The name of the section to parse.
+        :param dtype: NumPy dtype of the resulting values.
+        :return: A flat array with the numbers of the section.
+        :raises ValueError: If the section is missing or contains a value that is not a number.
+        """
+        if section_name not in self.sections:
+            raise ValueError(f"{section_name} is missing in the file content.")
+
+        start, end = self.sections[section_name]
+        try:
+            return np.array(self.content[start:end].split(), dtype=dtype)
+        except ValueError as error:
+            raise ValueError(f"Invalid value in {section_name}: {error}") from error
+
+    def parse_node_coordinates(self, section_name: str) -> np.ndarray:
+        """
+        Parses a node section made of "id x y" rows and returns the coordinates.
+
+        :param section_name: NODE_COORD_SECTION or DISPLAY_DATA_SECTION.
+        :return: An array of shape (n, 2) with the coordinates of the nodes.
+        :raises ValueError: If the section is missing or malformed.
+        """
+        values = self.parse_numbers(section_name, np.float64)
+        if values.size % 3 != 0:
+            raise ValueError(f"Malformed {section_name}: expected rows of 'id x y'.")
+        return np.ascontiguousarray(values.reshape(-1, 3)[:, 1:])
@@ -8,7 +8,9 @@ from PySide6.QtGui import QIntValidator
 class SettingsDialog(QDialog):
     def __init__(self, parent: QWidget = None) -> None:
         """
-        Initializes the settings dialog for configuring ports and data transmission frequency.
+        Initializes the settings dialog for configuring ports, data transmission frequency, the memory limit
+        of the distance matrix, the size of the candidate lists and the number of runs after which a worker
+        process is restarted.
 
         :param parent: The parent widget for this dialog.
         """
@@ -44,6 +46,33 @@ class SettingsDialog(QDialog):
         self.data_frequency_input.setText("1")  # Default frequency in milliseconds
         self.data_frequency_input.setAlignment(Qt.AlignCenter)
 
+        # Validator for the distance matrix memory limit (in megabytes)
+        memory_limit_validator: QIntValidator = QIntValidator(1, 1048576, self)
+
+        # Distance matrix memory limit input, larger instances compute distances from coordinates on demand
+        self.distance_memory_limit_input: QLineEdit = QLineEdit()
+        self.distance_memory_limit_input.setValidator(memory_limit_validator)
+        self.distance_memory_limit_input.setText("512")  # Default limit in megabytes
+        self.distance_memory_limit_input.setAlignment(Qt.AlignCenter)
+
+        # Validator for the candidate list size (0 disables candidate lists)
+        candidate_list_validator: QIntValidator = QIntValidator(0, 1000, self)
+
+        # Candidate list size input, moves are restricted to edges between a city and its nearest neighbors
+        self.candidate_list_size_input: QLineEdit = QLineEdit()
+        self.candidate_list_size_input.setValidator(candidate_list_validator)
+        self.candidate_list_size_input.setText("0")  # Candidate lists are off by default
+        self.candidate_list_size_input.setAlignment(Qt.AlignCenter)
+
+        # Validator for the number of runs of a worker process before it is restarted
+        worker_max_runs_validator: QIntValidator = QIntValidator(1, 100000, self)
+
+        # Worker runs input, the algorithms run on warm worker processes that are restarted after this many runs
+        self.worker_max_runs_input: QLineEdit = QLineEdit()
+        self.worker_max_runs_input.setValidator(worker_max_runs_validator)
+        self.worker_max_runs_input.setText("50")  # Default number of runs
+        self.worker_max_runs_input.setAlignment(Qt.AlignCenter)
+
         # Label styling for consistency
         label_style: str = "QLabel { color: white; background: transparent; border: none; }"
 
@@ -60,6 +89,18 @@ class SettingsDialog(QDialog):
         data_frequency_label.setStyleSheet(label_style)
         form_layout.addRow(data_frequency_label, self.data_frequency_input)
 
+        distance_memory_limit_label: QLabel = QLabel("Distance matrix memory limit [MB]:")
+        distance_memory_limit_label.setStyleSheet(label_style)
+        form_layout.addRow(distance_memory_limit_label, self.distance_memory_limit_input)
+
+        candidate_list_size_label: QLabel = QLabel("Candidate list size (0 = off):")
+        candidate_list_size_label.setStyleSheet(label_style)
+        form_layout.addRow(candidate_list_size_label, self.candidate_list_size_input)
+
+        worker_max_runs_label: QLabel = QLabel("Runs before restarting a worker:")
+        worker_max_runs_label.setStyleSheet(label_style)
+        form_layout.addRow(worker_max_runs_label, self.worker_max_runs_input)
+
         # Add form layout to main layout
         layout.addLayout(form_layout)
 
@@ -70,7 +111,8 @@ class SettingsDialog(QDialog):
 
     def save_settings(self) -> None:
         """
-        Validates and saves the settings for SA and TS ports and data transmission frequency.
+        Validates and saves the settings for SA and TS ports, data transmission frequency, memory limit,
+        candidate list size and runs per worker.
 
         :return: None
         """
@@ -79,6 +121,9 @@ class SettingsDialog(QDialog):
             sa_port: int = int(self.sa_port_input.text())
             ts_port: int = int(self.ts_port_input.text())
             data_frequency: int = int(self.data_frequency_input.text())
+            distance_memory_limit: int = int(self.distance_memory_limit_input.text())
+            candidate_list_size: int = int(self.candidate_list_size_input.text())
+            worker_max_runs: int = int(self.worker_max_runs_input.text())
 
             # Validate that ports are distinct and within range
             if sa_port == ts_port:
@@ -93,8 +138,23 @@ class SettingsDialog(QDialog):
                 print("Validation Error: Data frequency must be a positive integer.")
                 return
 
+            # Validate that the memory limit is a positive integer
+            if distance_memory_limit <= 0:
+                print("Validation Error: Distance matrix memory limit must be a positive integer.")
+                return
+
+            # Validate that the candidate list size is not negative
+            if candidate_list_size < 0:
+                print("Validation Error: Candidate list size must be a non-negative integer.")
+                return
+
+            # Validate that the number of runs per worker is a positive integer
+            if worker_max_runs <= 0:
+                print("Validation Error: Runs before restarting a worker must be a positive integer.")
+                return
+
             # Save settings
             self.accept()
 
         except ValueError:
-            print("Validation Error: Please enter valid integer values for the ports and frequency.")
+            print("Validation Error: Please enter valid integer values for all settings.")
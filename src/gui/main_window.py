@@ -1,5 +1,6 @@
 # src/gui/main_window.py
 
+import numpy as np
 from PySide6.QtWidgets import QMainWindow, QWidget, QHBoxLayout, QFrame, QVBoxLayout
 
 from src.backend.configs.algorithm_config import AlgorithmConfig
@@ -120,8 +121,8 @@ class MainWindow(QMainWindow):
         :param file_name: The name of the selected TSP file.
         :return: None
         """
-        # Retrieve the TSP file metadata from the catalog
-        tsp_file = self.task_manager.catalog.get_file_by_name(file_name)
+        # Retrieve the TSP file from the catalog, loading its coordinates on first selection
+        tsp_file = self.task_manager.get_loaded_file(file_name)
         if tsp_file:
             # Set the file_loaded flag to indicate that a file has been successfully loaded
             self.file_loaded = True
@@ -197,32 +198,34 @@ class MainWindow(QMainWindow):
         # Start the algorithm(s) with the given configuration
         self.task_manager.start_algorithm_for_file(config)
 
-    def update_results_sa(self, elapsed_time: int, best_cost: int, current_cost: int,
-                          current_solution: list[int]) -> None:
+    def update_results_sa(self, elapsed_times: list[int], best_cost: int, current_costs: list[int],
+                          current_solution: np.ndarray) -> None:
         """
-        Updates the results and plots for the Simulated Annealing (SA) algorithm.
+        Updates the results and plots for the Simulated Annealing (SA) algorithm with the samples received since the
+        last update.
 
-        :param elapsed_time: Time elapsed since the start of the SA algorithm.
+        :param elapsed_times: Times elapsed since the start of the SA algorithm, one per sample.
         :param best_cost: Best cost found so far by the SA algorithm.
-        :param current_cost: Current cost at this iteration of the SA algorithm.
-        :param current_solution: Current solution path as a list of city indices.
+        :param current_costs: Current costs of the SA algorithm, one per sample.
+        :param current_solution: Newest current solution path as an array of city indices.
         :return: None
         """
         # Update the SA results and plot with the new data
-        self.results_panel.update_sa_results(best_cost, current_cost)
-        self.visualization_panel.update_sa_plots(elapsed_time, current_cost, current_solution)
+        self.results_panel.update_sa_results(best_cost, current_costs[-1])
+        self.visualization_panel.update_sa_plots(elapsed_times, current_costs, current_solution)
 
-    def update_results_ts(self, elapsed_time: int, best_cost: int, current_cost: int,
-                          current_solution: list[int]) -> None:
+    def update_results_ts(self, elapsed_times: list[int], best_cost: int, current_costs: list[int],
+                          current_solution: np.ndarray) -> None:
         """
-        Updates the results and plots for the Tabu Search (TS) algorithm.
+        Updates the results and plots for the Tabu Search (TS) algorithm with the samples received since the
+        last update.
 
-        :param elapsed_time: Time elapsed since the start of the TS algorithm.
+        :param elapsed_times: Times elapsed since the start of the TS algorithm, one per sample.
         :param best_cost: Best cost found so far by the TS algorithm.
-        :param current_cost: Current cost at this iteration of the TS algorithm.
-        :param current_solution: Current solution path as a list of city indices.
+        :param current_costs: Current costs of the TS algorithm, one per sample.
+        :param current_solution: Newest current solution path as an array of city indices.
         :return: None
         """
         # Update the TS results and plot with the new data
-        self.results_panel.update_ts_results(best_cost, current_cost)
-        self.visualization_panel.update_ts_plots(elapsed_time, current_cost, current_solution)
+        self.results_panel.update_ts_results(best_cost, current_costs[-1])
+        self.visualization_panel.update_ts_plots(elapsed_times, current_costs, current_solution)
@@ -135,20 +135,26 @@ class ManagementPanel(QWidget):
         self.algorithm_tab_widget.currentChanged.connect(self.on_tab_changed)
         self.task_manager.sa_finished_signal.connect(self.on_algorithm_finished)
         self.task_manager.ts_finished_signal.connect(self.on_algorithm_finished)
+        self.task_manager.sa_snapshot_signal.connect(self.on_snapshot_received)
+        self.task_manager.ts_snapshot_signal.connect(self.on_snapshot_received)
 
     def setup_additional_buttons(self) -> None:
         """
-        Sets up the RUN, STOP, Clear Plots, Generate Report, and Settings buttons in a responsive layout.
+        Sets up the RUN, PAUSE, SNAPSHOT, STOP, Clear Plots, Generate Report, and Settings buttons in a responsive
+        layout.
 
-        RUN and STOP buttons are styled and disabled by default, while the Clear Plots and Generate Report buttons
-        become enabled after an algorithm finishes running. The Settings button opens a dialog for configuration.
+        RUN, PAUSE, SNAPSHOT and STOP buttons are styled and disabled by default, while the Clear Plots and Generate
+        Report buttons become enabled after an algorithm finishes running (or sends a snapshot of its best solution).
+        The Settings button opens a dialog for configuration.
         """
         additional_buttons_layout: QVBoxLayout = QVBoxLayout()
         additional_buttons_layout.setContentsMargins(0, 5, 0, 5)
 
-        # Layout for RUN and STOP buttons
+        # Layout for RUN, PAUSE, SNAPSHOT and STOP buttons
         run_stop_layout: QHBoxLayout = QHBoxLayout()
         self.run_button: QPushButton = QPushButton("RUN")
+        self.pause_button: QPushButton = QPushButton("PAUSE")
+        self.snapshot_button: QPushButton = QPushButton("SNAPSHOT")
         self.stop_button: QPushButton = QPushButton("STOP")
 
         # RUN button style
@@ -183,13 +189,35 @@ class ManagementPanel(QWidget):
                 background-color: #9A1717;
             }
         """
+        # PAUSE and SNAPSHOT button style
+        control_button_style = """
+            QPushButton {
+                font-size: 12px;
+                color: white;
+                background-color: #3A3A3A; /* Disabled color */
+                padding: 6px 12px;
+                border-radius: 4px;
+            }
+            QPushButton:enabled {
+                background-color: #5A5A5A; /* Enabled color */
+            }
+            QPushButton:enabled:hover {
+                background-color: #4A4A4A;
+            }
+        """
         self.run_button.setStyleSheet(run_button_style)
+        self.pause_button.setStyleSheet(control_button_style)
+        self.snapshot_button.setStyleSheet(control_button_style)
         self.stop_button.setStyleSheet(stop_button_style)
         self.run_button.setEnabled(False)
+        self.pause_button.setEnabled(False)
+        self.snapshot_button.setEnabled(False)
         self.stop_button.setEnabled(False)
 
-        # Add RUN and STOP buttons to layout
+        # Add RUN, PAUSE, SNAPSHOT and STOP buttons to layout
         run_stop_layout.addWidget(self.run_button)
+        run_stop_layout.addWidget(self.pause_button)
+        run_stop_layout.addWidget(self.snapshot_button)
         run_stop_layout.addWidget(self.stop_button)
 
         # Layout for Settings, Clear Plots, and Generate Report buttons in one line
@@ -211,6 +239,8 @@ class ManagementPanel(QWidget):
 
         # Connect button actions to respective methods
         self.run_button.clicked.connect(self.on_run_button_clicked)
+        self.pause_button.clicked.connect(self.on_pause_button_clicked)
+        self.snapshot_button.clicked.connect(self.on_snapshot_button_clicked)
         self.stop_button.clicked.connect(self.on_stop_button_clicked)
         self.clear_plots_and_results_button.clicked.connect(self.on_clear_plots_and_results_clicked)
         self.generate_report_button.clicked.connect(self.on_generate_report_clicked)  # Generate report action
@@ -221,13 +251,17 @@ class ManagementPanel(QWidget):
 
     def disable_controls_during_run(self) -> None:
         """
-        Disables tab switching and 'TSP Instances' button, keeping only the 'STOP' button active.
+        Disables tab switching and 'TSP Instances' button, keeping only the 'PAUSE', 'SNAPSHOT' and 'STOP' buttons
+        active.
 
         :return: None
         """
         self.algorithm_tab_widget.setEnabled(False)
         self.tsp_instances_button.setEnabled(False)
         self.run_button.setEnabled(False)
+        self.pause_button.setText("PAUSE")
+        self.pause_button.setEnabled(True)
+        self.snapshot_button.setEnabled(True)
         self.stop_button.setEnabled(True)
         self.clear_plots_and_results_button.setEnabled(False)
         self.generate_report_button.setEnabled(False)
@@ -241,6 +275,9 @@ class ManagementPanel(QWidget):
         self.algorithm_tab_widget.setEnabled(True)
         self.tsp_instances_button.setEnabled(True)
         self.run_button.setEnabled(True)
+        self.pause_button.setText("PAUSE")
+        self.pause_button.setEnabled(False)
+        self.snapshot_button.setEnabled(False)
         self.stop_button.setEnabled(False)
         self.clear_plots_and_results_button.setEnabled(True)
         self.generate_report_button.setEnabled(True)
@@ -382,12 +419,44 @@ class ManagementPanel(QWidget):
 
     def on_stop_button_clicked(self) -> None:
         """
-        Handles the STOP button click to halt the algorithm.
+        Handles the STOP button click to halt the algorithm. The algorithms return their best solutions and finish,
+        the controls are enabled again once they have.
 
         :return: None
         """
         self.task_manager.stop_algorithms()  # Call TaskManager to stop algorithms
-        self.enable_controls_after_run()
+        self.pause_button.setEnabled(False)
+        self.snapshot_button.setEnabled(False)
+        self.stop_button.setEnabled(False)
+
+    def on_pause_button_clicked(self) -> None:
+        """
+        Handles the PAUSE button click, pausing the running algorithms or resuming the paused ones.
+
+        :return: None
+        """
+        if self.pause_button.text() == "PAUSE":
+            self.task_manager.pause_algorithms()
+            self.pause_button.setText("RESUME")
+        else:
+            self.task_manager.resume_algorithms()
+            self.pause_button.setText("PAUSE")
+
+    def on_snapshot_button_clicked(self) -> None:
+        """
+        Handles the SNAPSHOT button click, asking the running algorithms to send their best solutions so far.
+
+        :return: None
+        """
+        self.task_manager.request_snapshots()
+
+    def on_snapshot_received(self) -> None:
+        """
+        Enables report generation once a snapshot of the best solution of an algorithm arrives during the run.
+
+        :return: None
+        """
+        self.generate_report_button.setEnabled(True)
 
     def on_tab_changed(self) -> None:
         """
@@ -424,6 +493,9 @@ class ManagementPanel(QWidget):
             sa_port = int(self.settings_dialog.sa_port_input.text())
             ts_port = int(self.settings_dialog.ts_port_input.text())
             data_frequency = int(self.settings_dialog.data_frequency_input.text())
+            distance_memory_limit_mb = int(self.settings_dialog.distance_memory_limit_input.text())
+            candidate_list_size = int(self.settings_dialog.candidate_list_size_input.text())
+            worker_max_runs = int(self.settings_dialog.worker_max_runs_input.text())
 
             # Create AlgorithmConfig object with selected parameters
             config = AlgorithmConfig(
@@ -433,7 +505,10 @@ class ManagementPanel(QWidget):
                 sa_port=sa_port,
                 ts_params=ts_params,
                 ts_port=ts_port,
-                data_frequency=data_frequency
+                data_frequency=data_frequency,
+                distance_memory_limit_mb=distance_memory_limit_mb,
+                candidate_list_size=candidate_list_size,
+                worker_max_runs=worker_max_runs
             )
 
             # Emit signal to start the algorithm with the selected configuration
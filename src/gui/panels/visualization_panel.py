@@ -1,6 +1,8 @@
 # src/gui/panels/visualization_panel.py
 
 from typing import Optional
+
+import numpy as np
 from PySide6.QtWidgets import QWidget, QGridLayout, QSpacerItem, QSizePolicy
 
 from src.gui.widgets.visualization.cost_plot_widget import CostPlotWidget
@@ -165,37 +167,39 @@ class VisualizationPanel(QWidget):
             self.layout.addItem(self.horizontal_spacer, 1, 0)
             self.layout.addItem(self.horizontal_spacer, 1, 2)
 
-    def update_sa_plots(self, elapsed_time: int, current_cost: int, current_solution: list[int]) -> None:
+    def update_sa_plots(self, elapsed_times: list[int], current_costs: list[int],
+                        current_solution: np.ndarray) -> None:
         """
         Updates the Simulated Annealing (SA) data visualization.
 
         This method updates the cost over time plot and current route visualization for the SA algorithm.
         It only updates each plot if it is currently visible.
 
-        :param elapsed_time: The elapsed time in milliseconds since the algorithm started.
-        :param current_cost: The current cost of the solution at this time.
-        :param current_solution: The current route solution represented as a list of city indices.
+        :param elapsed_times: The elapsed times in milliseconds since the algorithm started, one per sample.
+        :param current_costs: The current costs of the solution at these times.
+        :param current_solution: The newest route solution represented as an array of city indices.
         :return: None
         """
         if self.cost_plot_widget_sa.isVisible():
-            self.cost_plot_widget_sa.update_plot(elapsed_time, current_cost)
+            self.cost_plot_widget_sa.update_plot(elapsed_times, current_costs)
         if self.city_plot_widget_sa.isVisible():
             self.city_plot_widget_sa.update_route(current_solution)
 
-    def update_ts_plots(self, elapsed_time: int, current_cost: int, current_solution: list[int]) -> None:
+    def update_ts_plots(self, elapsed_times: list[int], current_costs: list[int],
+                        current_solution: np.ndarray) -> None:
         """
         Updates the Tabu Search (TS) data visualization.
 
         This method updates the cost over time plot and current route visualization for the TS algorithm.
         It only updates each plot if it is currently visible.
 
-        :param elapsed_time: The elapsed time in milliseconds since the algorithm started.
-        :param current_cost: The current cost of the solution at this time.
-        :param current_solution: The current route solution represented as a list of city indices.
+        :param elapsed_times: The elapsed times in milliseconds since the algorithm started, one per sample.
+        :param current_costs: The current costs of the solution at these times.
+        :param current_solution: The newest route solution represented as an array of city indices.
         :return: None
         """
         if self.cost_plot_widget_ts.isVisible():
-            self.cost_plot_widget_ts.update_plot(elapsed_time, current_cost)
+            self.cost_plot_widget_ts.update_plot(elapsed_times, current_costs)
         if self.city_plot_widget_ts.isVisible():
             self.city_plot_widget_ts.update_route(current_solution)
 
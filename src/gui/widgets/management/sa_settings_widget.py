@@ -1,12 +1,14 @@
 # src/gui/widgets/management/sa_settings_widget.py
 
+import os
 from typing import Optional
 
 from PySide6.QtCore import Qt, QRegularExpression
 from PySide6.QtGui import QRegularExpressionValidator
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QGridLayout, QLineEdit, QComboBox, QSpinBox, QSlider, QLabel, \
     QGroupBox, QSizePolicy
-from src.backend.components.sa_parameters import SAParameters, InitialTempMethodSA, NeighborSelectionMethodSA, InitialSolutionMethodSA
+from src.backend.components.sa_parameters import SAParameters, InitialTempMethodSA, NeighborSelectionMethodSA, InitialSolutionMethodSA, \
+    MultiChainStrategySA
 
 
 class SASettingsWidget(QWidget):
@@ -24,6 +26,11 @@ class SASettingsWidget(QWidget):
         self.setup_sa_settings()
         self.setup_alpha_settings()
 
+        # Connect signals to dynamically update the multi-chain fields
+        self.chains_input.valueChanged.connect(self.update_multi_chain_fields)
+        self.multi_chain_strategy_input.currentIndexChanged.connect(self.update_multi_chain_fields)
+        self.update_multi_chain_fields()
+
         # Set main layout
         self.setLayout(self.layout)
 
@@ -56,6 +63,20 @@ class SASettingsWidget(QWidget):
         sa_grid_layout.addWidget(self.create_label("Steps per temperature:"), 4, 0)
         sa_grid_layout.addWidget(self.steps_per_temp_input, 4, 1)
 
+        # Multi-chain settings
+        self.chains_input: QSpinBox = self.create_spin_box(1, os.cpu_count() or 1, 1, 120)
+        sa_grid_layout.addWidget(self.create_label("Chains:"), 5, 0)
+        sa_grid_layout.addWidget(self.chains_input, 5, 1)
+
+        self.multi_chain_strategy_input: QComboBox = self.create_combo_box(
+            [strategy.value for strategy in MultiChainStrategySA])
+        sa_grid_layout.addWidget(self.create_label("Multi-chain strategy:"), 6, 0)
+        sa_grid_layout.addWidget(self.multi_chain_strategy_input, 6, 1)
+
+        self.exchange_interval_input: QSpinBox = self.create_spin_box(1, 10000, 10, 120)
+        sa_grid_layout.addWidget(self.create_label("Exchange interval:"), 7, 0)
+        sa_grid_layout.addWidget(self.exchange_interval_input, 7, 1)
+
         # Add grid layout to the main layout
         self.layout.addLayout(sa_grid_layout)
 
@@ -186,6 +207,18 @@ class SASettingsWidget(QWidget):
                 pass
 
 
+    def update_multi_chain_fields(self) -> None:
+        """
+        Updates the editability of the multi-chain fields: the strategy only matters for several chains, and the
+        exchange interval only for parallel tempering.
+
+        :return: None
+        """
+        has_chains: bool = self.chains_input.value() > 1
+        is_tempering: bool = self.multi_chain_strategy_input.currentText() == "PARALLEL_TEMPERING"
+        self.multi_chain_strategy_input.setEnabled(has_chains)
+        self.exchange_interval_input.setEnabled(has_chains and is_tempering)
+
     def collect_sa_parameters(self) -> Optional[SAParameters]:
         """
         Collects and returns the SA parameters as an SAParameters object if valid, otherwise returns None.
@@ -200,6 +233,9 @@ class SASettingsWidget(QWidget):
             steps_per_temp = self.steps_per_temp_input.value()
             neighbor_selection_method = NeighborSelectionMethodSA(self.neighbor_selection_method_input.currentText())
             initial_solution_method = InitialSolutionMethodSA(self.initial_solution_method_input.currentText())
+            chains = self.chains_input.value()
+            multi_chain_strategy = MultiChainStrategySA(self.multi_chain_strategy_input.currentText())
+            exchange_interval = self.exchange_interval_input.value()
 
             return SAParameters(
                 duration_ms=duration_ms,
@@ -207,7 +243,10 @@ class SASettingsWidget(QWidget):
                 alpha=alpha,
                 steps_per_temp=steps_per_temp,
                 neighbor_selection_method=neighbor_selection_method,
-                initial_solution_method=initial_solution_method
+                initial_solution_method=initial_solution_method,
+                chains=chains,
+                multi_chain_strategy=multi_chain_strategy,
+                exchange_interval=exchange_interval
             )
         except ValueError:
             print("Invalid SA parameter values provided.")
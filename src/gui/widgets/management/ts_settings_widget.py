@@ -1,5 +1,6 @@
 # src/gui/widgets/management/ts_settings_widget.py
 
+import os
 from typing import Optional
 from PySide6.QtCore import Qt, QRegularExpression
 from PySide6.QtGui import QRegularExpressionValidator
@@ -7,7 +8,7 @@ from PySide6.QtWidgets import QWidget, QVBoxLayout, QGridLayout, QLineEdit, QCom
     QSizePolicy
 
 from src.backend.components.ts_parameters import TSParameters, TenureTypeTS, TabuListLimitMethodTS, \
-    NeighborSelectionMethodTS, InitialSolutionMethodTS
+    NeighborSelectionMethodTS, InitialSolutionMethodTS, NeighborhoodScanMethodTS
 
 
 class TSSettingsWidget(QWidget):
@@ -26,10 +27,12 @@ class TSSettingsWidget(QWidget):
         # Connect signals for dynamic field updates
         self.tabu_list_limit_method_input.currentIndexChanged.connect(self.update_tabu_list_fields)
         self.tenure_type_input.currentIndexChanged.connect(self.update_tenure_fields)
+        self.neighborhood_scan_method_input.currentIndexChanged.connect(self.update_neighborhood_fields)
 
         # Initial visibility settings for dynamic fields
         self.update_tabu_list_fields()
         self.update_tenure_fields()
+        self.update_neighborhood_fields()
 
         self.setLayout(self.layout)
 
@@ -58,27 +61,36 @@ class TSSettingsWidget(QWidget):
         ts_grid_layout.addWidget(self.create_label("Neighbor selection method:"), 2, 0)
         ts_grid_layout.addWidget(self.neighbor_selection_method_input, 2, 1)
 
+        self.neighborhood_scan_method_input: QComboBox = self.create_combo_box(
+            [scan.value for scan in NeighborhoodScanMethodTS])
+        ts_grid_layout.addWidget(self.create_label("Neighborhood scan:"), 3, 0)
+        ts_grid_layout.addWidget(self.neighborhood_scan_method_input, 3, 1)
+
         self.max_neighbors_input: QSpinBox = self.create_spin_box(1, 10000, 100, 120, 10)
-        ts_grid_layout.addWidget(self.create_label("Max neighbors:"), 3, 0)
-        ts_grid_layout.addWidget(self.max_neighbors_input, 3, 1)
+        ts_grid_layout.addWidget(self.create_label("Max neighbors:"), 4, 0)
+        ts_grid_layout.addWidget(self.max_neighbors_input, 4, 1)
+
+        self.threads_input: QSpinBox = self.create_spin_box(1, os.cpu_count() or 1, 1, 120)
+        ts_grid_layout.addWidget(self.create_label("Threads:"), 5, 0)
+        ts_grid_layout.addWidget(self.threads_input, 5, 1)
 
         # Tabu List settings
         self.tabu_list_limit_method_input: QComboBox = self.create_combo_box([limit.value for limit in TabuListLimitMethodTS])
-        ts_grid_layout.addWidget(self.create_label("Tabu list limit:"), 4, 0)
-        ts_grid_layout.addWidget(self.tabu_list_limit_method_input, 4, 1)
+        ts_grid_layout.addWidget(self.create_label("Tabu list limit:"), 6, 0)
+        ts_grid_layout.addWidget(self.tabu_list_limit_method_input, 6, 1)
 
         self.tabu_list_custom_limit_input: QSpinBox = self.create_spin_box(1, 10000, 100, 120, 10)
-        ts_grid_layout.addWidget(self.create_label("Custom tabu list limit:"), 5, 0)
-        ts_grid_layout.addWidget(self.tabu_list_custom_limit_input, 5, 1)
+        ts_grid_layout.addWidget(self.create_label("Custom tabu list limit:"), 7, 0)
+        ts_grid_layout.addWidget(self.tabu_list_custom_limit_input, 7, 1)
 
         # Tenure settings
         self.tenure_type_input: QComboBox = self.create_combo_box([tenure.value for tenure in TenureTypeTS])
-        ts_grid_layout.addWidget(self.create_label("Tenure type:"), 6, 0)
-        ts_grid_layout.addWidget(self.tenure_type_input, 6, 1)
+        ts_grid_layout.addWidget(self.create_label("Tenure type:"), 8, 0)
+        ts_grid_layout.addWidget(self.tenure_type_input, 8, 1)
 
         self.constant_tenure_input: QSpinBox = self.create_spin_box(1, 10000, 100, 120, 10)
-        ts_grid_layout.addWidget(self.create_label("Constant tenure:"), 7, 0)
-        ts_grid_layout.addWidget(self.constant_tenure_input, 7, 1)
+        ts_grid_layout.addWidget(self.create_label("Constant tenure:"), 9, 0)
+        ts_grid_layout.addWidget(self.constant_tenure_input, 9, 1)
 
         # Random tenure range group
         self.setup_random_tenure_group(ts_grid_layout)
@@ -112,7 +124,7 @@ class TSSettingsWidget(QWidget):
         random_tenure_range_layout.addWidget(self.random_tenure_max_input, 1, 1)
 
         random_tenure_layout.addLayout(random_tenure_range_layout)
-        layout.addWidget(random_tenure_group, 8, 0, 1, 2)
+        layout.addWidget(random_tenure_group, 10, 0, 1, 2)
 
     def create_label(self, text: str) -> QLabel:
         """
@@ -183,6 +195,15 @@ class TSSettingsWidget(QWidget):
         is_custom: bool = self.tabu_list_limit_method_input.currentText() == "CUSTOM"
         self.tabu_list_custom_limit_input.setEnabled(is_custom)
 
+    def update_neighborhood_fields(self) -> None:
+        """
+        Updates the editability of the 'Max neighbors' field, which only limits the sampled neighborhood scan.
+
+        :return: None
+        """
+        is_sampled: bool = self.neighborhood_scan_method_input.currentText() == "SAMPLED"
+        self.max_neighbors_input.setEnabled(is_sampled)
+
     def update_tenure_fields(self) -> None:
         """
         Updates the visibility of 'Constant' and 'Random' tenure fields based on the selected tenure type.
@@ -204,6 +225,7 @@ class TSSettingsWidget(QWidget):
             duration_ms = int(float(self.duration_input.text()) * 1000)
             initial_solution_method = InitialSolutionMethodTS(self.initial_solution_method_input.currentText())
             neighbor_selection_method = NeighborSelectionMethodTS(self.neighbor_selection_method_input.currentText())
+            neighborhood_scan_method = NeighborhoodScanMethodTS(self.neighborhood_scan_method_input.currentText())
             tenure_type = TenureTypeTS(self.tenure_type_input.currentText())
             constant_tenure = self.constant_tenure_input.value() if tenure_type == TenureTypeTS.CONSTANT else 0
             random_tenure_range = (
@@ -213,6 +235,7 @@ class TSSettingsWidget(QWidget):
             tabu_list_limit_method = TabuListLimitMethodTS(self.tabu_list_limit_method_input.currentText())
             tabu_list_custom_limit = self.tabu_list_custom_limit_input.value() if tabu_list_limit_method == TabuListLimitMethodTS.CUSTOM else 0
             max_neighbors = self.max_neighbors_input.value()
+            threads = self.threads_input.value()
 
             return TSParameters(
                 duration_ms=duration_ms,
@@ -223,7 +246,9 @@ class TSSettingsWidget(QWidget):
                 tabu_list_custom_limit=tabu_list_custom_limit,
                 max_neighbors=max_neighbors,
                 neighbor_selection_method=neighbor_selection_method,
-                initial_solution_method=initial_solution_method
+                initial_solution_method=initial_solution_method,
+                neighborhood_scan_method=neighborhood_scan_method,
+                threads=threads
             )
         except ValueError:
             print("Invalid TS parameters")
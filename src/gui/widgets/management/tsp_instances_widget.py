@@ -39,6 +39,14 @@ class TSPInstancesWidget(QWidget):
         self.instance_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.instance_table.cellClicked.connect(self.select_instance)
 
+        # Wiersze wczytanych plików są dodawane do tabeli na bieżąco
+        self.task_manager.files_loaded_signal.connect(self.add_file_rows)
+        self.task_manager.files_loading_finished_signal.connect(self.on_files_loading_finished)
+
+        # Wczytanie ostatnio używanego katalogu z indeksu katalogu
+        if self.task_manager.load_last_tsp_directory():
+            self.load_files_button.setEnabled(False)
+
         # Dodanie elementów do layoutu
         self.layout.addWidget(self.load_files_button)
         self.layout.addWidget(self.instance_table)
@@ -47,18 +55,33 @@ class TSPInstancesWidget(QWidget):
 
     def load_instance_files(self):
         """
-        Ładuje pliki TSP i aktualizuje tabelę.
+        Rozpoczyna ładowanie plików TSP w tle; tabela jest uzupełniana w miarę wczytywania plików.
+        """
+        self.load_files_button.setEnabled(False)
+        if self.task_manager.select_tsp_directory():
+            self.instance_table.setRowCount(0)
+        else:
+            self.load_files_button.setEnabled(True)
+
+    def on_files_loading_finished(self):
+        """
+        Odblokowuje przycisk ładowania po wczytaniu wszystkich plików.
         """
-        self.task_manager.select_tsp_directory()
-        self.update_file_list()
+        self.load_files_button.setEnabled(True)
 
     def update_file_list(self):
         """
         Aktualizuje listę plików w tabeli.
         """
         self.instance_table.setRowCount(0)
-        files_data = self.task_manager.get_files_data_for_table()
+        self.add_file_rows(self.task_manager.get_files_data_for_table())
+
+    def add_file_rows(self, files_data: list[tuple[str, str, str]]):
+        """
+        Dodaje wiersze plików na końcu tabeli.
 
+        :param files_data: Lista krotek (nazwa, wymiar, obecność współrzędnych).
+        """
         for name, dimension, has_coordinates in files_data:
             row_position = self.instance_table.rowCount()
             self.instance_table.insertRow(row_position)
@@ -43,9 +43,9 @@ class CityPlotWidget(QWidget):
 
         # Data initialization
         self.coordinates: list[tuple[float, float]] = coordinates or []  # City coordinates [(x, y)]
-        self.data_x: list[float] = []  # X-coordinates of cities
-        self.data_y: list[float] = []  # Y-coordinates of cities
-        self.route: list[tuple[float, float]] = []  # Current route path
+        self.data_x: np.ndarray = np.empty(0)  # X-coordinates of cities
+        self.data_y: np.ndarray = np.empty(0)  # Y-coordinates of cities
+        self.route: np.ndarray = np.empty(0, dtype=np.int32)  # Current route path as city indices
 
         # Create scatter plot item for city positions
         self.scatter: pg.ScatterPlotItem = pg.ScatterPlotItem(pen=pg.mkPen(None), symbol='o', brush='w')
@@ -88,31 +88,26 @@ class CityPlotWidget(QWidget):
         """
         if self.coordinates:
             # Extract x and y coordinates from the list of (x, y) tuples
-            self.data_x, self.data_y = zip(*self.coordinates)
+            coordinate_array = np.asarray(self.coordinates, dtype=float)
+            self.data_x, self.data_y = coordinate_array[:, 0], coordinate_array[:, 1]
             # Update the scatter plot with the city positions
             self.scatter.setData(self.data_x, self.data_y)
 
-    def update_route(self, current_solution: list[int]) -> None:
+    def update_route(self, current_solution: np.ndarray) -> None:
         """
         Updates the city map to display the current route based on the solution provided.
         The route connects cities in the order specified in `current_solution`.
 
-        :param current_solution: List of city indices representing the current route as a permutation of city indices.
+        :param current_solution: Array of city indices representing the current route as a permutation of city indices.
         :return: None
         """
         try:
-            # Create the route based on the current solution (permutation of city indices)
-            self.route = [(self.data_x[i], self.data_y[i]) for i in current_solution]
+            # Create the route based on the current solution, adding the starting city at the end to close it
+            self.route = np.append(current_solution, current_solution[0])
 
-            # Add the starting city at the end to close the route
-            self.route.append((self.data_x[current_solution[0]], self.data_y[current_solution[0]]))
-
-            # Extract x and y coordinates for the route
-            route_x, route_y = zip(*self.route)
-
-            # Convert route_x and route_y to numpy arrays for compatibility with pyqtgraph
-            route_x = np.array(route_x)
-            route_y = np.array(route_y)
+            # Look up the x and y coordinates of the cities along the route
+            route_x = self.data_x[self.route]
+            route_y = self.data_y[self.route]
 
             # Update the route line on the plot
             self.route_line.setData(route_x, route_y)
@@ -128,7 +123,7 @@ class CityPlotWidget(QWidget):
 
         :return: None
         """
-        self.route.clear()  # Clear the stored route data
+        self.route = np.empty(0, dtype=np.int32)  # Clear the stored route data
         self.route_line.setData([], [])  # Clear the route line on the plot
 
     def clear_cities(self) -> None:
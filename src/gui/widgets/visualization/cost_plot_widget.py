@@ -59,16 +59,16 @@ class CostPlotWidget(QWidget):
         axis_item.setTickPen('w')
         axis_item.setPen('w')
 
-    def update_plot(self, current_time: int, current_cost: int) -> None:
+    def update_plot(self, current_times: list[int], current_costs: list[int]) -> None:
         """
-        Updates the plot with new data for time and cost.
+        Updates the plot with new samples of time and cost, redrawing the curve once for all of them.
 
-        :param current_time: The current elapsed time in milliseconds.
-        :param current_cost: The current cost associated with the solution at this time.
+        :param current_times: The elapsed times of the samples in milliseconds.
+        :param current_costs: The current costs associated with the solution at these times.
         :return: None
         """
-        self.data_x.append(current_time)
-        self.data_y.append(current_cost)
+        self.data_x.extend(current_times)
+        self.data_y.extend(current_costs)
 
         # Update curve with the new data
         self.curve.setData(self.data_x, self.data_y)
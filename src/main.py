@@ -16,7 +16,7 @@ def main():
     Main function to initialize and launch the TSP Optimization application.
 
     - Initializes QApplication to manage the GUI application.
-    - Creates TaskManager to manage backend tasks and algorithms.
+    - Creates TaskManager to manage backend tasks and algorithms, and stops its worker processes on quit.
     - Initializes MainWindow with the TaskManager instance, connecting the GUI with backend processes.
     - Shows the main window and starts the application's event loop.
 
@@ -27,6 +27,7 @@ def main():
 
     # Initialize TaskManager for managing algorithms and tasks
     task_manager: TaskManager = TaskManager()
+    app.aboutToQuit.connect(task_manager.shutdown)
 
     # Initialize MainWindow with the TaskManager instance
     main_window: MainWindow = MainWindow(task_manager)
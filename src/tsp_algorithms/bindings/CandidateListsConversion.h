@@ -0,0 +1,38 @@
+// src/tsp_algorithms/bindings/CandidateListsConversion.h
+
+#ifndef CANDIDATELISTSCONVERSION_H
+#define CANDIDATELISTSCONVERSION_H
+
+#include "CandidateLists.h"
+#include "DistanceMatrixConversion.h"
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+#include <cstdint>
+#include <stdexcept>
+
+
+namespace py = pybind11;
+
+/*
+ * Wraps an (n, k) NumPy array of nearest neighbors in CandidateLists without copying it. A C-contiguous int32
+ * array (e.g. a view of shared memory) is used in place; any other integer array is first converted to one. An
+ * empty array disables the candidate lists.
+ */
+static CandidateLists candidate_lists_from_array(const py::array& lists, size_t num_cities) {
+    if (lists.size() == 0) {
+        return CandidateLists();
+    }
+    if (lists.ndim() != 2 || static_cast<size_t>(lists.shape(0)) != num_cities) {
+        throw std::invalid_argument("Candidate lists must be an array with one row of candidates per city.");
+    }
+
+    auto typed_lists = py::array_t<int32_t, py::array::c_style | py::array::forcecast>::ensure(lists);
+    if (!typed_lists) {
+        throw std::invalid_argument("Candidate lists must be an integer array.");
+    }
+    const int32_t* data = typed_lists.data();
+    size_t k = typed_lists.shape(1);
+    return CandidateLists(data, num_cities, k, hold_array(std::move(typed_lists)));
+}
+
+#endif // CANDIDATELISTSCONVERSION_H
@@ -0,0 +1,38 @@
+// src/tsp_algorithms/bindings/ControlWordConversion.h
+
+#ifndef CONTROLWORDCONVERSION_H
+#define CONTROLWORDCONVERSION_H
+
+#include "ControlWord.h"
+#include <pybind11/pybind11.h>
+#include <cstdint>
+#include <memory>
+#include <optional>
+#include <stdexcept>
+
+
+namespace py = pybind11;
+
+/*
+ * Creates a control viewing the first 32-bit integer of a writable Python buffer, e.g. a multiprocessing
+ * RawArray in shared memory, so that the running engine sees the requests written to it by another process.
+ * The control keeps a reference to the buffer, released under the GIL. Without a buffer the control owns its word.
+ */
+static ControlWord control_word_from_buffer(const std::optional<py::buffer>& buffer) {
+    if (!buffer) {
+        return ControlWord();
+    }
+    py::buffer_info info = buffer->request(true);
+    if (info.itemsize != sizeof(uint32_t) || info.size < 1 ||
+        reinterpret_cast<std::uintptr_t>(info.ptr) % alignof(uint32_t) != 0) {
+        throw std::invalid_argument("Control word must be a buffer of aligned 32-bit integers.");
+    }
+    auto* buffer_object = new py::object(*buffer);
+    std::shared_ptr<const void> owner(buffer_object, [](const py::object* buffer_object) {
+        py::gil_scoped_acquire gil;
+        delete buffer_object;
+    });
+    return ControlWord(static_cast<uint32_t*>(info.ptr), std::move(owner));
+}
+
+#endif // CONTROLWORDCONVERSION_H
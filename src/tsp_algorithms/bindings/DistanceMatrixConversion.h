@@ -0,0 +1,70 @@
+// src/tsp_algorithms/bindings/DistanceMatrixConversion.h
+
+#ifndef DISTANCEMATRIXCONVERSION_H
+#define DISTANCEMATRIXCONVERSION_H
+
+#include "DistanceMatrix.h"
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+#include <cmath>
+#include <cstdint>
+#include <memory>
+#include <stdexcept>
+
+
+namespace py = pybind11;
+
+/*
+ * Returns a shared owner keeping a NumPy array alive while C++ objects view its data. The reference to the array
+ * is released under the GIL, since the last viewer may be destroyed while the GIL is released (e.g. in run()).
+ */
+static std::shared_ptr<const void> hold_array(py::object array) {
+    auto* array_object = new py::object(std::move(array));
+    return std::shared_ptr<const void>(array_object, [](const py::object* array_object) {
+        py::gil_scoped_acquire gil;
+        delete array_object;
+    });
+}
+
+/*
+ * Creates a matrix viewing the values of a NumPy array. A C-contiguous array of type T is used in place; any
+ * other array is first converted to one. The matrix keeps a reference to the array, released under the GIL.
+ */
+template <typename T>
+static DistanceMatrix view_array_values(const py::array& values, size_t num_cities, bool packed) {
+    auto typed_values = py::array_t<T, py::array::c_style | py::array::forcecast>::ensure(values);
+    if (!typed_values) {
+        throw std::invalid_argument("Distance matrix must be an integer array.");
+    }
+    const T* data = typed_values.data();
+    size_t value_count = typed_values.size();
+    return DistanceMatrix(num_cities, packed, data, value_count, hold_array(std::move(typed_values)));
+}
+
+/*
+ * Wraps the NumPy array of a Python DistanceMatrix in its C++ counterpart without copying it. A square array
+ * holds the dense layout, a flat array the packed upper triangle; uint16 and int32 arrays are viewed directly,
+ * other integer types are converted to int32. An empty array selects the matrix-free mode.
+ */
+static DistanceMatrix distance_matrix_from_array(const py::array& values) {
+    if (values.size() == 0) {
+        return DistanceMatrix();
+    }
+
+    size_t num_cities;
+    bool packed = values.ndim() == 1;
+    if (packed) {
+        num_cities = static_cast<size_t>((1.0 + std::sqrt(1.0 + 8.0 * values.size())) / 2.0);
+    } else if (values.ndim() == 2 && values.shape(0) == values.shape(1)) {
+        num_cities = values.shape(0);
+    } else {
+        throw std::invalid_argument("Distance matrix must be a square or a packed upper triangular array.");
+    }
+
+    if (values.dtype().is(py::dtype::of<uint16_t>())) {
+        return view_array_values<uint16_t>(values, num_cities, packed);
+    }
+    return view_array_values<int32_t>(values, num_cities, packed);
+}
+
+#endif // DISTANCEMATRIXCONVERSION_H
@@ -1,8 +1,12 @@
 // src/tsp_algorithms/bindings/SimulatedAnnealingBindings.cpp
 
 #include "SimulatedAnnealing.h"
+#include "CandidateListsConversion.h"
+#include "ControlWordConversion.h"
+#include "DistanceMatrixConversion.h"
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include <optional>
 
 
 // Using pybind11 namespace for convenience
@@ -29,11 +33,67 @@ PYBIND11_MODULE(tsp_sa, m) {
         .value("GREEDY", InitialSolutionMethodSA::GREEDY)
         .export_values();
 
+    // Define the MultiChainStrategySA enum to expose to Python
+    py::enum_<MultiChainStrategySA>(m, "MultiChainStrategySA")
+        .value("MULTISTART", MultiChainStrategySA::MULTISTART)
+        .value("PARALLEL_TEMPERING", MultiChainStrategySA::PARALLEL_TEMPERING)
+        .export_values();
+
+    // Expose the result of a run; best_solution is a NumPy view of the tour kept alive by the result
+    py::class_<ResultSA>(m, "ResultSA")
+        .def_property_readonly("best_solution", [](const py::object& self) {
+            const std::vector<int>& tour = self.cast<const ResultSA&>().best_solution;
+            return py::array_t<int>(static_cast<py::ssize_t>(tour.size()), tour.data(), self);
+        })
+        .def_readonly("best_cost", &ResultSA::best_cost)
+        .def_readonly("iteration_count", &ResultSA::iteration_count)
+        .def_readonly("final_temperature", &ResultSA::final_temperature)
+        .def_readonly("chain_best_costs", &ResultSA::chain_best_costs)
+        .def_readonly("elapsed_ms", &ResultSA::elapsed_ms)
+        .def_readonly("stopped", &ResultSA::stopped)
+        .def("to_dict", [](const py::object& self) {
+            const ResultSA& result = self.cast<const ResultSA&>();
+            py::dict fields;
+            fields["best_solution"] = self.attr("best_solution");
+            fields["best_cost"] = result.best_cost;
+            fields["iteration_count"] = result.iteration_count;
+            fields["final_temperature"] = result.final_temperature;
+            fields["chain_best_costs"] = result.chain_best_costs;
+            fields["elapsed_ms"] = result.elapsed_ms;
+            fields["stopped"] = result.stopped;
+            return fields;
+        }, "Return the fields of the result as a dictionary.");
+
     // Expose the SimulatedAnnealing class and bind its methods and constructor
     py::class_<SimulatedAnnealing>(m, "SimulatedAnnealing")
-        // Binding constructor with enums and relevant parameters
-        .def(py::init<int, int, const std::vector<std::vector<int>>&, int, InitialTempMethodSA,
-            InitialSolutionMethodSA, NeighborSelectionMethodSA, int, double>(),
+        // Binding constructor with enums and relevant parameters; dist_matrix is the compact NumPy array of a
+        // DistanceMatrix (square when dense, flat when packed); if it is empty the distances are computed on demand
+        // from coordinates using the given edge_weight_type. A non-empty (n, k) candidate_lists array (viewed in place
+        // when C-contiguous int32, like dist_matrix) restricts moves to edges between a city and its nearest neighbors.
+        // chains annealing chains run on as many threads, either independently or as a parallel tempering ladder
+        // exchanging temperatures every exchange_interval temperature levels; seed makes the initial solutions and
+        // moves reproducible. control is an optional buffer (e.g. shared memory) whose first 32-bit integer is the
+        // ControlWord polled by run(). text_telemetry sends the data as text instead of binary frames, for debugging
+        .def(py::init([](int port, int data_frequency_ms, const py::array& dist_matrix, int duration_ms,
+                         InitialTempMethodSA initial_temp_method, InitialSolutionMethodSA initial_solution_method,
+                         NeighborSelectionMethodSA neighbor_selection_method, int steps_per_temp, double alpha,
+                         const std::vector<std::pair<double, double>>& coordinates,
+                         const std::string& edge_weight_type, int row_cache_size,
+                         const py::array& candidate_lists, int chains,
+                         MultiChainStrategySA multi_chain_strategy, int exchange_interval,
+                         std::optional<unsigned int> seed, const std::optional<py::buffer>& control,
+                         bool text_telemetry) {
+                Distances distances = Distances::create(distance_matrix_from_array(dist_matrix), coordinates,
+                                                        edge_weight_type, row_cache_size);
+                CandidateLists candidates = candidate_lists_from_array(candidate_lists, distances.size());
+                return std::make_unique<SimulatedAnnealing>(port, data_frequency_ms, std::move(distances),
+                                                            duration_ms, initial_temp_method,
+                                                            initial_solution_method, neighbor_selection_method,
+                                                            steps_per_temp, alpha, std::move(candidates), chains,
+                                                            multi_chain_strategy, exchange_interval,
+                                                            seed.value_or(std::random_device{}()),
+                                                            control_word_from_buffer(control), text_telemetry);
+            }),
             py::arg("port"),
             py::arg("data_frequency_ms"),
             py::arg("dist_matrix"),
@@ -43,8 +103,33 @@ PYBIND11_MODULE(tsp_sa, m) {
             py::arg("neighbor_selection_method"),
             py::arg("steps_per_temp"),
             py::arg("alpha"),
+            py::arg("coordinates") = std::vector<std::pair<double, double>>{},
+            py::arg("edge_weight_type") = "",
+            py::arg("row_cache_size") = 0,
+            py::arg("candidate_lists") = py::array_t<int32_t>(),
+            py::arg("chains") = 1,
+            py::arg("multi_chain_strategy") = MultiChainStrategySA::MULTISTART,
+            py::arg("exchange_interval") = 10,
+            py::arg("seed") = py::none(),
+            py::arg("control") = py::none(),
+            py::arg("text_telemetry") = false,
             "Initialize the Simulated Annealing algorithm with the given parameters.")
 
-        // Binding for running the algorithm
-        .def("run", &SimulatedAnnealing::run, "Run the Simulated Annealing algorithm.");
+        // Binding for running the algorithm, returning its ResultSA; the GIL is released, so other threads can send
+        // control requests
+        .def("run", &SimulatedAnnealing::run, py::call_guard<py::gil_scoped_release>(), "Run the Simulated Annealing algorithm.")
+
+        // Bindings for the control requests, which the running algorithm polls between its steps
+        .def("request_stop", [](SimulatedAnnealing& engine) { engine.get_control().request_stop(); },
+             "Ask the running algorithm to stop and return its best solution.")
+        .def("pause", [](SimulatedAnnealing& engine) { engine.get_control().pause(); },
+             "Ask the running algorithm to pause; the pause does not count towards the duration.")
+        .def("resume", [](SimulatedAnnealing& engine) { engine.get_control().resume(); },
+             "Ask the paused algorithm to resume.")
+        .def("request_snapshot", [](SimulatedAnnealing& engine) { engine.get_control().request_snapshot(); },
+             "Ask the running algorithm to send its best solution so far.")
+
+        // Binding for the number of moves evaluated by run
+        .def("get_iteration_count", &SimulatedAnnealing::get_iteration_count,
+             "Return the number of moves evaluated by the last run in all chains.");
 }
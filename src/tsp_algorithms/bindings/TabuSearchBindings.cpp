@@ -1,8 +1,13 @@
 // src/tsp_algorithms/bindings/TabuSearchBindings.cpp
 
 #include "TabuSearch.h"
+#include "CandidateListsConversion.h"
+#include "ControlWordConversion.h"
+#include "DistanceMatrixConversion.h"
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include <optional>
+#include <random>
 
 
 // Using pybind11 namespace for convenience
@@ -15,6 +20,12 @@ PYBIND11_MODULE(tsp_ts, m) {
         .value("OPT_2", NeighborSelectionMethodTS::OPT_2)
         .export_values();
 
+    // Define the NeighborhoodScanMethodTS enum to expose to Python
+    py::enum_<NeighborhoodScanMethodTS>(m, "NeighborhoodScanMethodTS")
+        .value("SAMPLED", NeighborhoodScanMethodTS::SAMPLED)
+        .value("EXHAUSTIVE", NeighborhoodScanMethodTS::EXHAUSTIVE)
+        .export_values();
+
     // Define the TabuListLimitMethodTS enum to expose to Python
     py::enum_<TabuListLimitMethodTS>(m, "TabuListLimitMethodTS")
         .value("N", TabuListLimitMethodTS::N)
@@ -36,11 +47,65 @@ PYBIND11_MODULE(tsp_ts, m) {
         .value("RANDOM", TenureTypeTS::RANDOM)
         .export_values();
 
+    // Expose the result of a run; best_solution is a NumPy view of the tour kept alive by the result
+    py::class_<ResultTS>(m, "ResultTS")
+        .def_property_readonly("best_solution", [](const py::object& self) {
+            const std::vector<int>& tour = self.cast<const ResultTS&>().best_solution;
+            return py::array_t<int>(static_cast<py::ssize_t>(tour.size()), tour.data(), self);
+        })
+        .def_readonly("best_cost", &ResultTS::best_cost)
+        .def_readonly("iteration_count", &ResultTS::iteration_count)
+        .def_readonly("aspiration_count", &ResultTS::aspiration_count)
+        .def_readonly("tabu_rejection_count", &ResultTS::tabu_rejection_count)
+        .def_readonly("tabu_list_size", &ResultTS::tabu_list_size)
+        .def_readonly("elapsed_ms", &ResultTS::elapsed_ms)
+        .def_readonly("stopped", &ResultTS::stopped)
+        .def("to_dict", [](const py::object& self) {
+            const ResultTS& result = self.cast<const ResultTS&>();
+            py::dict fields;
+            fields["best_solution"] = self.attr("best_solution");
+            fields["best_cost"] = result.best_cost;
+            fields["iteration_count"] = result.iteration_count;
+            fields["aspiration_count"] = result.aspiration_count;
+            fields["tabu_rejection_count"] = result.tabu_rejection_count;
+            fields["tabu_list_size"] = result.tabu_list_size;
+            fields["elapsed_ms"] = result.elapsed_ms;
+            fields["stopped"] = result.stopped;
+            return fields;
+        }, "Return the fields of the result as a dictionary.");
+
     // Expose the TabuSearch class and bind its methods and constructor
     py::class_<TabuSearch>(m, "TabuSearch")
-        // Binding constructor with enums and relevant parameters
-        .def(py::init<int, int, const std::vector<std::vector<int>>&, int, InitialSolutionMethodTS,
-            NeighborSelectionMethodTS, int, TabuListLimitMethodTS, int, TenureTypeTS, int, std::pair<int, int>>(),
+        // Binding constructor with enums and relevant parameters; dist_matrix is the compact NumPy array of a
+        // DistanceMatrix (square when dense, flat when packed); if it is empty the distances are computed on demand
+        // from coordinates using the given edge_weight_type. A non-empty (n, k) candidate_lists array (viewed in place
+        // when C-contiguous int32, like dist_matrix) restricts moves to edges between a city and its nearest neighbors.
+        // The EXHAUSTIVE neighborhood scan evaluates every move instead of max_neighbors random ones. The neighborhood
+        // is evaluated by the given number of threads; for a given seed the search is the same whatever the number of
+        // threads. control is an optional buffer (e.g. shared memory) whose first 32-bit integer is the ControlWord
+        // polled by run(). text_telemetry sends the data as text instead of binary frames, for debugging
+        .def(py::init([](int port, int data_frequency_ms, const py::array& dist_matrix, int duration_ms,
+                         InitialSolutionMethodTS initial_solution_method,
+                         NeighborSelectionMethodTS neighbor_selection_method, int max_neighbors,
+                         TabuListLimitMethodTS tabu_list_limit_method, int tabu_list_custom_limit,
+                         TenureTypeTS tenure_type, int constant_tenure, std::pair<int, int> random_tenure_range,
+                         const std::vector<std::pair<double, double>>& coordinates,
+                         const std::string& edge_weight_type, int row_cache_size,
+                         const py::array& candidate_lists,
+                         NeighborhoodScanMethodTS neighborhood_scan_method, int threads,
+                         std::optional<unsigned int> seed, const std::optional<py::buffer>& control,
+                         bool text_telemetry) {
+                Distances distances = Distances::create(distance_matrix_from_array(dist_matrix), coordinates,
+                                                        edge_weight_type, row_cache_size);
+                CandidateLists candidates = candidate_lists_from_array(candidate_lists, distances.size());
+                return std::make_unique<TabuSearch>(port, data_frequency_ms, std::move(distances), duration_ms,
+                                                    initial_solution_method, neighbor_selection_method,
+                                                    neighborhood_scan_method, max_neighbors, tabu_list_limit_method, tabu_list_custom_limit,
+                                                    tenure_type, constant_tenure, random_tenure_range,
+                                                    std::move(candidates), threads,
+                                                    seed.value_or(std::random_device{}()),
+                                                    control_word_from_buffer(control), text_telemetry);
+            }),
             py::arg("port"),
             py::arg("data_frequency_ms"),
             py::arg("dist_matrix"),
@@ -53,8 +118,28 @@ PYBIND11_MODULE(tsp_ts, m) {
             py::arg("tenure_type"),
             py::arg("constant_tenure"),
             py::arg("random_tenure_range"),
+            py::arg("coordinates") = std::vector<std::pair<double, double>>{},
+            py::arg("edge_weight_type") = "",
+            py::arg("row_cache_size") = 0,
+            py::arg("candidate_lists") = py::array_t<int32_t>(),
+            py::arg("neighborhood_scan_method") = NeighborhoodScanMethodTS::SAMPLED,
+            py::arg("threads") = 1,
+            py::arg("seed") = py::none(),
+            py::arg("control") = py::none(),
+            py::arg("text_telemetry") = false,
             "Initialize the Tabu Search algorithm with the given parameters.")
 
-        // Binding for running the algorithm
-        .def("run", &TabuSearch::run, "Run the Tabu Search algorithm.");
+        // Binding for running the algorithm, returning its ResultTS; the GIL is released, so other threads can send
+        // control requests
+        .def("run", &TabuSearch::run, py::call_guard<py::gil_scoped_release>(), "Run the Tabu Search algorithm.")
+
+        // Bindings for the control requests, which the running algorithm polls between its steps
+        .def("request_stop", [](TabuSearch& engine) { engine.get_control().request_stop(); },
+             "Ask the running algorithm to stop and return its best solution.")
+        .def("pause", [](TabuSearch& engine) { engine.get_control().pause(); },
+             "Ask the running algorithm to pause; the pause does not count towards the duration.")
+        .def("resume", [](TabuSearch& engine) { engine.get_control().resume(); },
+             "Ask the paused algorithm to resume.")
+        .def("request_snapshot", [](TabuSearch& engine) { engine.get_control().request_snapshot(); },
+             "Ask the running algorithm to send its best solution so far.");
 }
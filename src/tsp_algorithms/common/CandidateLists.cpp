@@ -0,0 +1,26 @@
+// src/tsp_algorithms/common/CandidateLists.cpp
+
+#include "CandidateLists.h"
+#include <stdexcept>
+#include <string>
+#include <utility>
+
+
+// --- Constructor ---
+/*
+ * Initializes the candidate lists viewing the given array, validating that every list only contains other
+ * cities. No candidates (k == 0) disable the candidate lists.
+ */
+CandidateLists::CandidateLists(const int32_t* values, size_t num_cities, size_t k,
+                               std::shared_ptr<const void> owner):
+    candidates(values), k(k), owner(std::move(owner)) {
+    for (size_t city = 0; city < num_cities; ++city) {
+        for (size_t index = 0; index < k; ++index) {
+            int candidate = candidates[city * k + index];
+            if (candidate < 0 || static_cast<size_t>(candidate) >= num_cities || static_cast<size_t>(candidate) == city) {
+                throw std::invalid_argument("Invalid candidate " + std::to_string(candidate) + " for city " +
+                                            std::to_string(city) + ".");
+            }
+        }
+    }
+}
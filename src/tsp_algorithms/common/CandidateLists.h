@@ -0,0 +1,38 @@
+// src/tsp_algorithms/common/CandidateLists.h
+
+#ifndef CANDIDATE_LISTS_H
+#define CANDIDATE_LISTS_H
+
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+
+
+// Class viewing the k nearest neighbors (candidates) of every city in one flat row-major array, owned by another
+// object (e.g. a NumPy array, possibly in shared memory) that is kept alive without copying it. Moves restricted
+// to candidate edges skip the long edges that almost never appear in good tours
+class CandidateLists {
+public:
+    // Creates empty candidate lists (moves are not restricted)
+    CandidateLists() = default;
+
+    // Creates candidate lists viewing num_cities * k candidates owned by another object
+    CandidateLists(const int32_t* values, size_t num_cities, size_t k, std::shared_ptr<const void> owner);
+
+    // Returns the index-th nearest neighbor of the city
+    int at(int city, int index) const { return candidates[static_cast<size_t>(city) * k + index]; }
+
+    // Returns the number of candidates per city
+    int size_per_city() const { return static_cast<int>(k); }
+
+    // Returns true if no candidate lists are used
+    bool empty() const { return k == 0; }
+
+private:
+    // --- Member Variables ---
+    const int32_t* candidates{nullptr};     // Candidates of city c are stored at [c * k, (c + 1) * k)
+    size_t k{0};                            // Number of candidates per city
+    std::shared_ptr<const void> owner;      // Keeps the viewed candidates alive
+};
+
+#endif // CANDIDATE_LISTS_H
@@ -0,0 +1,76 @@
+// src/tsp_algorithms/common/ControlWord.h
+
+#ifndef CONTROLWORD_H
+#define CONTROLWORD_H
+
+#include <atomic>
+#include <chrono>
+#include <cstdint>
+#include <memory>
+#include <utility>
+
+
+// Word through which a running engine is asked to stop, pause or take a snapshot of its best solution. The
+// lowest bit requests a stop, the next one a pause, and the remaining bits count the requested snapshots, so a
+// request is never lost and the engine only reads the word. The word is either owned by the control or lives
+// in a buffer kept alive by a shared owner, e.g. shared memory written by another process
+class ControlWord {
+public:
+    // Bit requesting the engine to stop and return its best solution
+    static constexpr uint32_t STOP = 1;
+
+    // Bit requesting the engine to pause until it is cleared
+    static constexpr uint32_t PAUSE = 2;
+
+    // Increment of the word requesting a snapshot of the best solution
+    static constexpr uint32_t SNAPSHOT = 4;
+
+    // Interval between the checks of the word while the engine is paused
+    static constexpr std::chrono::milliseconds PAUSE_POLL_INTERVAL{1};
+
+    // Creates a control owning its word, with no requests
+    ControlWord(): ControlWord(std::make_shared<uint32_t>(0)) {}
+
+    // Creates a control viewing a word owned by another object
+    ControlWord(uint32_t* word, std::shared_ptr<const void> owner):
+        word(word), owner(std::move(owner)) {}
+
+    // Requests the engine to stop
+    void request_stop() { std::atomic_ref<uint32_t>(*word).fetch_or(STOP); }
+
+    // Requests the engine to pause, or to resume
+    void pause() { std::atomic_ref<uint32_t>(*word).fetch_or(PAUSE); }
+    void resume() { std::atomic_ref<uint32_t>(*word).fetch_and(~PAUSE); }
+
+    // Requests a snapshot of the best solution
+    void request_snapshot() { std::atomic_ref<uint32_t>(*word).fetch_add(SNAPSHOT); }
+
+    // Returns true if a stop has been requested
+    bool stop_requested() const { return load() & STOP; }
+
+    // Returns true if a pause has been requested and no stop
+    bool pause_requested() const { return (load() & (STOP | PAUSE)) == PAUSE; }
+
+    // Returns true if a snapshot has been requested since the last one was taken
+    bool snapshot_requested() const { return load() / SNAPSHOT != handled_snapshots; }
+
+    // Returns true if any request is pending
+    bool interrupted() const { return stop_requested() || pause_requested() || snapshot_requested(); }
+
+    // Marks the snapshots requested so far as taken
+    void acknowledge_snapshot() { handled_snapshots = load() / SNAPSHOT; }
+
+private:
+    // Creates a control owning the given word
+    explicit ControlWord(std::shared_ptr<uint32_t> owned_word): ControlWord(owned_word.get(), owned_word) {}
+
+    // Reads the word, seeing the requests written before it by any thread or process
+    uint32_t load() const { return std::atomic_ref<uint32_t>(*word).load(std::memory_order_acquire); }
+
+    // --- Member Variables ---
+    uint32_t* word;                         // Word holding the requests
+    std::shared_ptr<const void> owner;      // Keeps the buffer of the word alive (an owned word or a foreign buffer)
+    uint32_t handled_snapshots{0};          // Number of snapshot requests already taken
+};
+
+#endif // CONTROLWORD_H
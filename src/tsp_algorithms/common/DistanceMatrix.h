@@ -0,0 +1,126 @@
+// src/tsp_algorithms/common/DistanceMatrix.h
+
+#ifndef DISTANCEMATRIX_H
+#define DISTANCEMATRIX_H
+
+#include <algorithm>
+#include <cstdint>
+#include <memory>
+#include <stdexcept>
+#include <utility>
+#include <vector>
+
+
+// Compact distance matrix mirroring the Python DistanceMatrix: weights are stored as uint16 when they fit,
+// otherwise as int32, either densely (n * n entries, flat row-major) or as the packed strict upper triangle of
+// a symmetric matrix with a zero diagonal (n * (n - 1) / 2 entries). The entries are either owned by the matrix
+// or viewed in a buffer kept alive by a shared owner, e.g. a NumPy array, without copying them
+class DistanceMatrix {
+public:
+    // Creates an empty matrix (matrix-free mode)
+    DistanceMatrix() = default;
+
+    // Creates a matrix owning uint16 weights in the dense or packed layout
+    DistanceMatrix(size_t num_cities, bool packed, std::vector<uint16_t> values):
+        DistanceMatrix(num_cities, packed, std::make_shared<const std::vector<uint16_t>>(std::move(values))) {}
+
+    // Creates a matrix owning int32 weights in the dense or packed layout
+    DistanceMatrix(size_t num_cities, bool packed, std::vector<int32_t> values):
+        DistanceMatrix(num_cities, packed, std::make_shared<const std::vector<int32_t>>(std::move(values))) {}
+
+    // Creates a matrix viewing value_count uint16 weights owned by another object
+    DistanceMatrix(size_t num_cities, bool packed, const uint16_t* values, size_t value_count,
+                   std::shared_ptr<const void> owner):
+        num_cities(num_cities), packed(packed), wide(false), narrow_values(values), owner(std::move(owner)) {
+        check_size(value_count);
+    }
+
+    // Creates a matrix viewing value_count int32 weights owned by another object
+    DistanceMatrix(size_t num_cities, bool packed, const int32_t* values, size_t value_count,
+                   std::shared_ptr<const void> owner):
+        num_cities(num_cities), packed(packed), wide(true), wide_values(values), owner(std::move(owner)) {
+        check_size(value_count);
+    }
+
+    // Returns the distance between cities i and j
+    int operator()(int i, int j) const {
+        size_t index;
+        if (packed) {
+            if (i == j) {
+                return 0;
+            }
+            auto [low, high] = std::minmax(i, j);
+            index = row_offsets[low] + (high - low - 1);
+        } else {
+            index = static_cast<size_t>(i) * num_cities + j;
+        }
+        return wide ? wide_values[index] : narrow_values[index];
+    }
+
+    // Stores the distances from city i to count given cities; the layout is resolved once for the whole row
+    void gather(int i, const int* cities, size_t count, int* gathered) const {
+        if (packed) {
+            for (size_t k = 0; k < count; ++k) {
+                gathered[k] = (*this)(i, cities[k]);
+            }
+        } else if (wide) {
+            const int32_t* row = wide_values + static_cast<size_t>(i) * num_cities;
+            for (size_t k = 0; k < count; ++k) {
+                gathered[k] = row[cities[k]];
+            }
+        } else {
+            const uint16_t* row = narrow_values + static_cast<size_t>(i) * num_cities;
+            for (size_t k = 0; k < count; ++k) {
+                gathered[k] = row[cities[k]];
+            }
+        }
+    }
+
+    // Returns the number of cities
+    size_t size() const { return num_cities; }
+
+    // Returns true if the matrix holds no cities
+    bool empty() const { return num_cities == 0; }
+
+    // Returns true if only the upper triangle of a symmetric matrix is stored
+    bool is_packed() const { return packed; }
+
+private:
+    // Creates a matrix viewing the weights of an owned vector
+    template <typename T>
+    DistanceMatrix(size_t num_cities, bool packed, std::shared_ptr<const std::vector<T>> values):
+        DistanceMatrix(num_cities, packed, values->data(), values->size(), values) {}
+
+    // Validates the number of stored entries and precomputes the row offsets of the packed layout
+    void check_size(size_t value_count) {
+        size_t expected = packed ? num_cities * (num_cities - std::min<size_t>(num_cities, 1)) / 2
+                                 : num_cities * num_cities;
+        if (value_count != expected) {
+            throw std::invalid_argument("Distance matrix size does not match its number of cities.");
+        }
+        if (packed) {
+            row_offsets.resize(num_cities);
+            for (size_t i = 0, offset = 0; i < num_cities; ++i) {
+                row_offsets[i] = offset;
+                offset += num_cities - i - 1;
+            }
+        }
+    }
+
+    // --- Member Variables ---
+    size_t num_cities{0};                   // Number of cities
+    bool packed{false};                     // Whether only the strict upper triangle is stored
+    bool wide{false};                       // Whether the weights are stored as int32 instead of uint16
+
+    // Stored weights, only the pointer matching the width is used
+    const uint16_t* narrow_values{nullptr};
+    const int32_t* wide_values{nullptr};
+
+    // Keeps the buffer of the weights alive (an owned vector or a foreign buffer)
+    std::shared_ptr<const void> owner;
+
+    // Index of the first packed entry of each row
+    std::vector<size_t> row_offsets;
+};
+
+#endif // DISTANCEMATRIX_H
@@ -0,0 +1,162 @@
+// src/tsp_algorithms/common/Distances.cpp
+
+#include "Distances.h"
+#include <algorithm>
+#include <cmath>
+#include <stdexcept>
+
+
+// TSPLIB constants of the geographical distance
+constexpr double GEO_PI = 3.141592;
+constexpr double GEO_RRR = 6378.388;
+
+/*
+ * Converts a coordinate from the TSPLIB DDD.MM format to radians.
+ */
+static double geo_to_radians(double deg_min) {
+    int deg = static_cast<int>(deg_min);
+    double min = deg_min - deg;
+    return GEO_PI * (deg + 5.0 * min / 3.0) / 180.0;
+}
+
+// --- Constructors ---
+/*
+ * Initializes distances backed by a compact distance matrix, with a single row slot for row().
+ * Packed matrices are symmetric by construction, dense ones are checked once.
+ */
+Distances::Distances(DistanceMatrix dist_matrix):
+    num_cities(dist_matrix.size()), dense(true), matrix(std::move(dist_matrix)), row_cache_size(1) {
+
+    for (size_t i = 0; i < num_cities && symmetric && !matrix.is_packed(); ++i) {
+        for (size_t j = i + 1; j < num_cities; ++j) {
+            if (matrix(i, j) != matrix(j, i)) {
+                symmetric = false;
+                break;
+            }
+        }
+    }
+
+    cached_rows.resize(num_cities);
+    cached_row_ids.assign(row_cache_size, -1);
+}
+
+/*
+ * Initializes matrix-free distances computed from coordinates. At least one row slot is always allocated,
+ * because row() needs a buffer to return.
+ */
+Distances::Distances(const std::vector<std::pair<double, double>>& coordinates, EdgeWeightType edge_weight_type,
+                     int row_cache_size):
+    num_cities(coordinates.size()), dense(false), edge_weight_type(edge_weight_type),
+    row_cache_size(std::max(row_cache_size, 1)) {
+
+    xs.reserve(num_cities);
+    ys.reserve(num_cities);
+    for (const auto& [x, y] : coordinates) {
+        // GEO coordinates are converted to radians once, as the reference implementation does
+        xs.push_back(edge_weight_type == EdgeWeightType::GEO ? geo_to_radians(x) : x);
+        ys.push_back(edge_weight_type == EdgeWeightType::GEO ? geo_to_radians(y) : y);
+    }
+
+    cached_rows.resize(this->row_cache_size * num_cities);
+    cached_row_ids.assign(this->row_cache_size, -1);
+}
+
+/*
+ * Creates matrix-backed distances if a matrix is given, otherwise matrix-free distances from the coordinates.
+ */
+Distances Distances::create(DistanceMatrix dist_matrix,
+                            const std::vector<std::pair<double, double>>& coordinates,
+                            const std::string& edge_weight_type, int row_cache_size) {
+    if (!dist_matrix.empty()) {
+        return Distances(std::move(dist_matrix));
+    }
+    if (coordinates.empty()) {
+        throw std::invalid_argument("Either a distance matrix or coordinates must be provided.");
+    }
+    return Distances(coordinates, parse_edge_weight_type(edge_weight_type), row_cache_size);
+}
+
+// --- Row Access ---
+/*
+ * Returns all distances from city i, expanded from the matrix or computed into its cache slot.
+ */
+const int* Distances::row(int i) const {
+    size_t slot = i % row_cache_size;
+    int* cached_row = cached_rows.data() + slot * num_cities;
+    if (cached_row_ids[slot] != i) {
+        for (size_t j = 0; j < num_cities; ++j) {
+            cached_row[j] = dense ? matrix(i, static_cast<int>(j)) : compute_distance(i, static_cast<int>(j));
+        }
+        cached_row_ids[slot] = i;
+    }
+    return cached_row;
+}
+
+/*
+ * Stores the distances from city i to the given cities, reading the matrix directly or computing them without
+ * touching the row cache.
+ */
+void Distances::gather(int i, const int* cities, size_t count, int* gathered) const {
+    if (dense) {
+        matrix.gather(i, cities, count, gathered);
+        return;
+    }
+    for (size_t k = 0; k < count; ++k) {
+        gathered[k] = oracle_distance(i, cities[k]);
+    }
+}
+
+// --- Matrix-free Distances ---
+/*
+ * Returns the distance from a cached row of i or j if one is present, otherwise computes it.
+ */
+int Distances::oracle_distance(int i, int j) const {
+    size_t slot_i = i % row_cache_size;
+    if (cached_row_ids[slot_i] == i) {
+        return cached_rows[slot_i * num_cities + j];
+    }
+    size_t slot_j = j % row_cache_size;
+    if (cached_row_ids[slot_j] == j) {
+        return cached_rows[slot_j * num_cities + i];
+    }
+    return compute_distance(i, j);
+}
+
+/*
+ * Computes the distance between cities i and j with the TSPLIB rounding of the selected edge weight type.
+ */
+int Distances::compute_distance(int i, int j) const {
+    if (i == j) {
+        return 0;
+    }
+
+    switch (edge_weight_type) {
+        case EdgeWeightType::EUC_2D: {
+            double xd = xs[i] - xs[j];
+            double yd = ys[i] - ys[j];
+            return static_cast<int>(std::sqrt(xd * xd + yd * yd) + 0.5);
+        }
+        case EdgeWeightType::CEIL_2D: {
+            double xd = xs[i] - xs[j];
+            double yd = ys[i] - ys[j];
+            return static_cast<int>(std::ceil(std::sqrt(xd * xd + yd * yd)));
+        }
+        case EdgeWeightType::ATT: {
+            double xd = xs[i] - xs[j];
+            double yd = ys[i] - ys[j];
+            double rij = std::sqrt((xd * xd + yd * yd) / 10.0);
+            int tij = static_cast<int>(rij + 0.5);
+            return tij < rij ? tij + 1 : tij;
+        }
+        case EdgeWeightType::GEO: {
+            // TSPLIB distance always computed with the smaller index first, like the Python reference
+            int a = std::min(i, j);
+            int b = std::max(i, j);
+            double q1 = std::cos(ys[a] - ys[b]);
+            double q2 = std::cos(xs[a] - xs[b]);
+            double q3 = std::cos(xs[a] + xs[b]);
+            return static_cast<int>(GEO_RRR * std::acos(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3)) + 1.0);
+        }
+    }
+    return 0;
+}
@@ -0,0 +1,80 @@
+// src/tsp_algorithms/common/Distances.h
+
+#ifndef DISTANCES_H
+#define DISTANCES_H
+
+#include "DistanceMatrix.h"
+#include "EdgeWeightType.h"
+#include <string>
+#include <utility>
+#include <vector>
+
+
+// Class providing distances between cities, either from a compact distance matrix or computed on demand
+// from city coordinates (matrix-free mode for instances whose matrix does not fit in memory)
+class Distances {
+public:
+    // Creates distances backed by a compact distance matrix
+    explicit Distances(DistanceMatrix dist_matrix);
+
+    // Creates distances computed on demand from coordinates, with an optional bounded cache of full rows
+    Distances(const std::vector<std::pair<double, double>>& coordinates, EdgeWeightType edge_weight_type,
+              int row_cache_size);
+
+    // Selects the dense mode if a matrix is given, otherwise the matrix-free mode
+    static Distances create(DistanceMatrix dist_matrix,
+                            const std::vector<std::pair<double, double>>& coordinates,
+                            const std::string& edge_weight_type, int row_cache_size);
+
+    // Returns the distance between cities i and j; safe to call from several threads while row() is not called
+    int operator()(int i, int j) const {
+        if (dense) {
+            return matrix(i, j);
+        }
+        return oracle_distance(i, j);
+    }
+
+    // Returns all distances from city i; the row stays valid until the next call to row()
+    const int* row(int i) const;
+
+    // Stores the distances from city i to count given cities; safe to call from several threads like operator()
+    void gather(int i, const int* cities, size_t count, int* gathered) const;
+
+    // Returns the number of cities
+    size_t size() const { return num_cities; }
+
+    // Returns true if the distances are stored in a distance matrix
+    bool is_dense() const { return dense; }
+
+    // Returns true if the distance from i to j always equals the distance from j to i
+    bool is_symmetric() const { return symmetric; }
+
+private:
+    // --- Matrix-free Distances ---
+    // Returns a distance from the row cache if possible, otherwise computes it from the coordinates
+    int oracle_distance(int i, int j) const;
+
+    // Computes a TSPLIB-rounded distance from the coordinates
+    int compute_distance(int i, int j) const;
+
+    // --- Member Variables ---
+    size_t num_cities;                      // Number of cities
+    bool dense;                             // Whether the distance matrix is used
+    bool symmetric{true};                   // Whether all distances are symmetric
+
+    // Compact distance matrix (empty in matrix-free mode)
+    DistanceMatrix matrix;
+
+    // Coordinates (in radians for GEO) and the metric used in matrix-free mode
+    std::vector<double> xs;
+    std::vector<double> ys;
+    EdgeWeightType edge_weight_type{EdgeWeightType::EUC_2D};
+
+    // Direct-mapped cache of full distance rows, row i is stored in slot i % row_cache_size; with a distance
+    // matrix a single slot holds the row expanded from the compact storage
+    size_t row_cache_size{0};
+    mutable std::vector<int> cached_rows;
+    mutable std::vector<int> cached_row_ids;
+};
+
+#endif // DISTANCES_H
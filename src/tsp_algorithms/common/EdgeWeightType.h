@@ -0,0 +1,27 @@
+// src/tsp_algorithms/common/EdgeWeightType.h
+
+#ifndef EDGEWEIGHTTYPE_H
+#define EDGEWEIGHTTYPE_H
+
+#include <stdexcept>
+#include <string>
+
+
+// Enum defining the TSPLIB edge weight types that can be computed from coordinates
+enum class EdgeWeightType {
+  EUC_2D, // Euclidean distance rounded to the nearest integer
+  CEIL_2D, // Euclidean distance rounded up
+  ATT, // Pseudo-Euclidean distance
+  GEO // Geographical distance
+};
+
+// Converts a TSPLIB EDGE_WEIGHT_TYPE name to the corresponding enum value
+inline EdgeWeightType parse_edge_weight_type(const std::string& name) {
+  if (name == "EUC_2D") return EdgeWeightType::EUC_2D;
+  if (name == "CEIL_2D") return EdgeWeightType::CEIL_2D;
+  if (name == "ATT") return EdgeWeightType::ATT;
+  if (name == "GEO") return EdgeWeightType::GEO;
+  throw std::invalid_argument("Unsupported EDGE_WEIGHT_TYPE for coordinate distances: " + name);
+}
+
+#endif //EDGEWEIGHTTYPE_H
@@ -0,0 +1,43 @@
+// src/tsp_algorithms/common/TelemetryFrame.h
+
+#ifndef TELEMETRY_FRAME_H
+#define TELEMETRY_FRAME_H
+
+#include <cstdint>
+#include <type_traits>
+
+
+// Types of the telemetry messages sent by the engines
+enum class TelemetryMessageType : uint16_t {
+    DATA = 0,      // Periodic sample: costs, counters and the current tour
+    SNAPSHOT = 1,  // Requested snapshot: the best cost and the best tour
+    END = 2,       // End of the run, no tour
+    READY = 3      // Engine connected and set up, about to run: its setup time and initial best cost, no tour
+};
+
+// Fixed header of a binary telemetry frame, followed by tour_length raw int32 city indices starting at offset
+// header_size. All fields are in native (little-endian) byte order and 8-byte aligned, so the receiver decodes
+// the header and the tour without parsing or copying (see src/backend/components/telemetry_frame.py)
+struct TelemetryFrameHeader {
+    // Bytes starting every binary frame; text messages never start with them
+    static constexpr char MAGIC[4] = {'T', 'S', 'P', 'T'};
+
+    // Version of the frame layout, increased whenever it changes
+    static constexpr uint16_t VERSION = 1;
+
+    char magic[4];                  // MAGIC
+    uint16_t version;               // VERSION
+    uint16_t type;                  // TelemetryMessageType of the frame
+    uint32_t header_size;           // Offset of the tour in bytes, i.e. the size of this header
+    uint32_t tour_length;           // Number of cities of the tour following the header
+    uint64_t sequence;              // Number of frames sent before this one, reveals dropped frames
+    int64_t elapsed_ms;             // Time since the start of the run in milliseconds
+    int64_t best_cost;              // Cost of the best solution found so far
+    int64_t current_cost;           // Cost of the current solution (the best one in snapshots)
+    uint64_t iteration_count;       // Number of iterations (moves tried) so far
+};
+
+static_assert(sizeof(TelemetryFrameHeader) == 56, "The telemetry frame header must have a fixed size.");
+static_assert(std::is_standard_layout_v<TelemetryFrameHeader>, "The telemetry frame header must be plain data.");
+
+#endif // TELEMETRY_FRAME_H
@@ -0,0 +1,147 @@
+// src/tsp_algorithms/common/TelemetrySender.cpp
+
+#include "TelemetrySender.h"
+#include <nng/protocol/pair1/pair.h>
+#include <charconv>
+#include <cstring>
+#include <iostream>
+#include <string>
+
+
+// --- Construction ---
+/*
+ * Creates a sender sending binary frames, or text messages for debugging.
+ */
+TelemetrySender::TelemetrySender(bool text_format): text_format(text_format) {}
+
+/*
+ * Closes the NNG socket.
+ */
+TelemetrySender::~TelemetrySender() {
+    nng_close(sock);
+}
+
+/*
+ * Opens the NNG socket and dials the receiver listening on the given local port.
+ */
+void TelemetrySender::connect(int port) {
+    // NNG socket initialization
+    if (nng_pair1_open(&sock) != 0) {
+        std::cout << "Failed to open NNG socket." << std::endl;
+    }
+
+    // Create the address using the specified port
+    std::string address = "tcp://127.0.0.1:" + std::to_string(port);
+    if (nng_dial(sock, address.c_str(), NULL, 0) != 0) {
+        std::cout << "Failed to connect NNG socket." << std::endl;
+    }
+}
+
+// --- Messages ---
+/*
+ * Sends the readiness of the engine once it is set up: the time its setup took and the cost of its initial best
+ * solution. The receiver takes it as the engine's side of the startup handshake.
+ */
+void TelemetrySender::send_ready(int64_t setup_ms, int64_t best_cost) {
+    send(TelemetryMessageType::READY, setup_ms, best_cost, best_cost, 0, nullptr);
+}
+
+/*
+ * Sends a periodic sample with the current cost and solution.
+ */
+void TelemetrySender::send_data(int64_t elapsed_ms, int64_t best_cost, int64_t current_cost,
+                                uint64_t iteration_count, const std::vector<int>& current_solution) {
+    send(TelemetryMessageType::DATA, elapsed_ms, best_cost, current_cost, iteration_count, &current_solution);
+}
+
+/*
+ * Sends a snapshot of the best solution; its cost is reported as both the best and the current cost.
+ */
+void TelemetrySender::send_snapshot(int64_t elapsed_ms, int64_t best_cost, uint64_t iteration_count,
+                                    const std::vector<int>& best_solution) {
+    send(TelemetryMessageType::SNAPSHOT, elapsed_ms, best_cost, best_cost, iteration_count, &best_solution);
+}
+
+/*
+ * Sends the end of the run, without a tour.
+ */
+void TelemetrySender::send_end(int64_t elapsed_ms, int64_t best_cost, uint64_t iteration_count) {
+    send(TelemetryMessageType::END, elapsed_ms, best_cost, best_cost, iteration_count, nullptr);
+}
+
+/*
+ * Encodes the message in the selected format and sends it through the NNG socket.
+ */
+void TelemetrySender::send(TelemetryMessageType type, int64_t elapsed_ms, int64_t best_cost, int64_t current_cost,
+                           uint64_t iteration_count, const std::vector<int>* tour) {
+    if (text_format) {
+        encode_text(type, elapsed_ms, best_cost, current_cost, tour);
+    } else {
+        encode_binary(type, elapsed_ms, best_cost, current_cost, iteration_count, tour);
+    }
+    ++sequence;
+
+    if (nng_send(sock, buffer.data(), buffer.size(), 0) != 0) {
+        std::cerr << "Error: Failed to send telemetry message." << std::endl;
+    }
+}
+
+// --- Encoding ---
+/*
+ * Writes the header and copies the tour behind it as raw int32 values.
+ */
+void TelemetrySender::encode_binary(TelemetryMessageType type, int64_t elapsed_ms, int64_t best_cost,
+                                    int64_t current_cost, uint64_t iteration_count, const std::vector<int>* tour) {
+    static_assert(sizeof(int) == sizeof(int32_t), "Tours are sent as int32 values.");
+
+    TelemetryFrameHeader header{};
+    std::memcpy(header.magic, TelemetryFrameHeader::MAGIC, sizeof(header.magic));
+    header.version = TelemetryFrameHeader::VERSION;
+    header.type = static_cast<uint16_t>(type);
+    header.header_size = sizeof(TelemetryFrameHeader);
+    header.tour_length = tour ? static_cast<uint32_t>(tour->size()) : 0;
+    header.sequence = sequence;
+    header.elapsed_ms = elapsed_ms;
+    header.best_cost = best_cost;
+    header.current_cost = current_cost;
+    header.iteration_count = iteration_count;
+
+    size_t tour_bytes = header.tour_length * sizeof(int32_t);
+    buffer.resize(sizeof(TelemetryFrameHeader) + tour_bytes);
+    std::memcpy(buffer.data(), &header, sizeof(TelemetryFrameHeader));
+    if (tour_bytes > 0) {
+        std::memcpy(buffer.data() + sizeof(TelemetryFrameHeader), tour->data(), tour_bytes);
+    }
+}
+
+/*
+ * Writes the message as text: "elapsed best current a,b,c,..." for samples, "READY setup best" for the
+ * readiness, "SNAPSHOT best a,b,c,..." for snapshots and "EOF" for the end of the run.
+ */
+void TelemetrySender::encode_text(TelemetryMessageType type, int64_t elapsed_ms, int64_t best_cost,
+                                  int64_t current_cost, const std::vector<int>* tour) {
+    std::string message;
+    if (type == TelemetryMessageType::END) {
+        message = "EOF";
+    } else if (type == TelemetryMessageType::READY) {
+        message = "READY " + std::to_string(elapsed_ms) + " " + std::to_string(best_cost);
+    } else if (type == TelemetryMessageType::SNAPSHOT) {
+        message = "SNAPSHOT " + std::to_string(best_cost) + " ";
+    } else {
+        message = std::to_string(elapsed_ms) + " " + std::to_string(best_cost) + " " +
+                  std::to_string(current_cost) + " ";
+    }
+
+    // Append the tour as comma-separated city indices
+    if (tour) {
+        char digits[16];
+        for (size_t i = 0; i < tour->size(); ++i) {
+            auto end = std::to_chars(digits, digits + sizeof(digits), (*tour)[i]).ptr;
+            message.append(digits, end);
+            if (i != tour->size() - 1) {
+                message += ',';
+            }
+        }
+    }
+    buffer.assign(message.begin(), message.end());
+}
@@ -0,0 +1,64 @@
+// src/tsp_algorithms/common/TelemetrySender.h
+
+#ifndef TELEMETRY_SENDER_H
+#define TELEMETRY_SENDER_H
+
+#include "TelemetryFrame.h"
+#include <cstdint>
+#include <vector>
+#include <nng/nng.h>
+
+
+// Sends the telemetry of a running engine (readiness, periodic samples, snapshots of the best solution and the
+// end of the run) to the receiver over an NNG pair socket. Messages are binary frames by default; the text
+// format "elapsed best current a,b,c,..." ("READY setup best", "SNAPSHOT best a,b,c,...", "EOF") is kept for
+// debugging
+class TelemetrySender {
+public:
+    // Creates a sender that is not connected yet
+    explicit TelemetrySender(bool text_format = false);
+
+    // Closes the socket
+    ~TelemetrySender();
+
+    TelemetrySender(const TelemetrySender&) = delete;
+    TelemetrySender& operator=(const TelemetrySender&) = delete;
+
+    // Connects to the receiver listening on the given local port
+    void connect(int port);
+
+    // Signals the receiver that the engine is connected and set up, with its setup time
+    void send_ready(int64_t setup_ms, int64_t best_cost);
+
+    // Sends a periodic sample with the current solution
+    void send_data(int64_t elapsed_ms, int64_t best_cost, int64_t current_cost, uint64_t iteration_count,
+                   const std::vector<int>& current_solution);
+
+    // Sends a snapshot of the best solution
+    void send_snapshot(int64_t elapsed_ms, int64_t best_cost, uint64_t iteration_count,
+                       const std::vector<int>& best_solution);
+
+    // Sends the end of the run
+    void send_end(int64_t elapsed_ms, int64_t best_cost, uint64_t iteration_count);
+
+private:
+    // Encodes a message of the given type into the buffer and sends it
+    void send(TelemetryMessageType type, int64_t elapsed_ms, int64_t best_cost, int64_t current_cost,
+              uint64_t iteration_count, const std::vector<int>* tour);
+
+    // Encodes the message as a binary frame: the header followed by the raw tour
+    void encode_binary(TelemetryMessageType type, int64_t elapsed_ms, int64_t best_cost, int64_t current_cost,
+                       uint64_t iteration_count, const std::vector<int>* tour);
+
+    // Encodes the message in the text format
+    void encode_text(TelemetryMessageType type, int64_t elapsed_ms, int64_t best_cost, int64_t current_cost,
+                     const std::vector<int>* tour);
+
+    // --- Member Variables ---
+    nng_socket sock{};                  // Socket for sending data to the receiver
+    const bool text_format;             // Whether messages are sent as text instead of binary frames
+    uint64_t sequence{0};               // Number of messages sent so far
+    std::vector<char> buffer;           // Encoded message, reused across messages
+};
+
+#endif // TELEMETRY_SENDER_H
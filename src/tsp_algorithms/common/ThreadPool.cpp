@@ -0,0 +1,92 @@
+// src/tsp_algorithms/common/ThreadPool.cpp
+
+#include "ThreadPool.h"
+
+
+// --- Constructor ---
+/*
+ * Starts the worker threads, which wait for the first batch of tasks.
+ */
+ThreadPool::ThreadPool(int num_threads) {
+    for (int thread = 1; thread < num_threads; ++thread) {
+        workers.emplace_back(&ThreadPool::work, this, thread);
+    }
+}
+
+// --- Destructor ---
+/*
+ * Wakes the worker threads to exit and joins them.
+ */
+ThreadPool::~ThreadPool() {
+    {
+        std::lock_guard<std::mutex> lock(mutex);
+        stopping = true;
+    }
+    batch_started.notify_all();
+    for (std::thread& worker : workers) {
+        worker.join();
+    }
+}
+
+// --- Running Tasks ---
+/*
+ * Publishes a batch of tasks, runs tasks on the calling thread as well, and waits for the workers to finish.
+ * Tasks are taken one at a time from a shared counter, so threads that finish early take over the remaining ones.
+ */
+void ThreadPool::run(int task_count, const std::function<void(int, int)>& task) {
+    if (workers.empty()) {
+        for (int index = 0; index < task_count; ++index) {
+            task(index, 0);
+        }
+        return;
+    }
+
+    {
+        std::lock_guard<std::mutex> lock(mutex);
+        this->task = &task;
+        this->task_count = task_count;
+        next_index = 0;
+        busy_workers = static_cast<int>(workers.size());
+        ++batch;
+    }
+    batch_started.notify_all();
+
+    run_tasks(0);
+
+    std::unique_lock<std::mutex> lock(mutex);
+    batch_finished.wait(lock, [this] { return busy_workers == 0; });
+    this->task = nullptr;
+}
+
+/*
+ * Waits for a new batch, runs its tasks and reports when done, until the pool is stopped.
+ */
+void ThreadPool::work(int thread) {
+    int finished_batch = 0;
+    while (true) {
+        {
+            std::unique_lock<std::mutex> lock(mutex);
+            batch_started.wait(lock, [&] { return stopping || batch != finished_batch; });
+            if (stopping) {
+                return;
+            }
+            finished_batch = batch;
+        }
+
+        run_tasks(thread);
+
+        std::lock_guard<std::mutex> lock(mutex);
+        if (--busy_workers == 0) {
+            batch_finished.notify_one();
+        }
+    }
+}
+
+/*
+ * Runs tasks of the current batch until all of them have been taken.
+ */
+void ThreadPool::run_tasks(int thread) {
+    for (int index = next_index++; index < task_count; index = next_index++) {
+        (*task)(index, thread);
+    }
+}
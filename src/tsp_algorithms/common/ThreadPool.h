@@ -0,0 +1,55 @@
+// src/tsp_algorithms/common/ThreadPool.h
+
+#ifndef THREAD_POOL_H
+#define THREAD_POOL_H
+
+#include <atomic>
+#include <condition_variable>
+#include <functional>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+
+// Class running batches of tasks on threads that are started once and reused, so that the work of every
+// iteration can be split across cores without creating threads. The thread calling run() takes part as well
+class ThreadPool {
+public:
+    // Starts num_threads - 1 worker threads; with a single thread, tasks run on the calling thread only
+    explicit ThreadPool(int num_threads);
+
+    // Stops and joins the worker threads
+    ~ThreadPool();
+
+    ThreadPool(const ThreadPool&) = delete;
+    ThreadPool& operator=(const ThreadPool&) = delete;
+
+    // Returns the number of threads running tasks, including the calling thread
+    int size() const { return static_cast<int>(workers.size()) + 1; }
+
+    // Runs task(index, thread) for every index in [0, task_count) and waits until all of them are done; thread
+    // identifies the running thread in [0, size()), so that tasks can use per-thread buffers
+    void run(int task_count, const std::function<void(int, int)>& task);
+
+private:
+    // Waits for batches of tasks and runs them until the pool is destroyed
+    void work(int thread);
+
+    // Runs tasks of the current batch until none are left
+    void run_tasks(int thread);
+
+    // --- Member Variables ---
+    std::vector<std::thread> workers;                   // Worker threads
+    std::mutex mutex;                                   // Guards the batch state below
+    std::condition_variable batch_started;              // Wakes the workers when a batch starts or the pool stops
+    std::condition_variable batch_finished;             // Wakes run() when the last worker finishes the batch
+
+    const std::function<void(int, int)>* task{nullptr}; // Task of the current batch
+    int task_count{0};                                  // Number of tasks of the current batch
+    std::atomic<int> next_index{0};                     // Index of the next task to run
+    int batch{0};                                       // Number of the current batch
+    int busy_workers{0};                                // Workers still running tasks of the current batch
+    bool stopping{false};                               // Whether the workers should exit
+};
+
+#endif // THREAD_POOL_H
@@ -0,0 +1,114 @@
+// src/tsp_algorithms/common/TourMoves.cpp
+
+#include "TourMoves.h"
+#include <algorithm>
+
+
+// --- Cost Changes ---
+/*
+ * Calculates the cost change of a swap from the edges around both positions, counting each edge once when the
+ * positions are adjacent.
+ */
+long long swap_delta(const std::vector<int>& tour, const Distances& distances, int i, int j) {
+    if (i == j) {
+        return 0;
+    }
+
+    int num_cities = static_cast<int>(tour.size());
+    auto swapped_city_at = [&](int position) {
+        position %= num_cities;
+        return position == i ? tour[j] : position == j ? tour[i] : tour[position];
+    };
+
+    // Edges starting at the positions before and at both swapped cities
+    int edges[4] = {(i + num_cities - 1) % num_cities, i, (j + num_cities - 1) % num_cities, j};
+    long long delta = 0;
+    for (int k = 0; k < 4; ++k) {
+        if (std::find(edges, edges + k, edges[k]) != edges + k) {
+            continue;
+        }
+        delta += distances(swapped_city_at(edges[k]), swapped_city_at(edges[k] + 1)) -
+                 distances(tour[edges[k]], tour[(edges[k] + 1) % num_cities]);
+    }
+    return delta;
+}
+
+/*
+ * Calculates the cost change of a reversal from the two edges around the segment in constant time. For asymmetric
+ * distances the edges inside the segment change direction and are summed as well.
+ */
+long long reversal_delta(const std::vector<int>& tour, const Distances& distances, int begin, int end) {
+    int num_cities = static_cast<int>(tour.size());
+    auto city_at = [&](int position) { return tour[(position + num_cities) % num_cities]; };
+    bool whole_tour = begin == 0 && end == num_cities - 1;
+
+    // Reversing a single city, or the whole tour of a symmetric instance, does not change its length
+    if (begin >= end || (whole_tour && distances.is_symmetric())) {
+        return 0;
+    }
+
+    long long delta = 0;
+    if (!whole_tour) {
+        int before = city_at(begin - 1);
+        int after = city_at(end + 1);
+        delta += static_cast<long long>(distances(before, tour[end])) + distances(tour[begin], after) -
+                 distances(before, tour[begin]) - distances(tour[end], after);
+    }
+    if (!distances.is_symmetric()) {
+        // Edges inside the segment are traversed in the opposite direction, the whole tour closes the cycle
+        int last = whole_tour ? end + 1 : end;
+        for (int k = begin; k < last; ++k) {
+            delta += distances(city_at(k + 1), tour[k]) - distances(tour[k], city_at(k + 1));
+        }
+    }
+    return delta;
+}
+
+/*
+ * Calculates the cost change of reversing a path of a two-level list from the two edges around it. Only symmetric
+ * tours are stored as two-level lists, so the edges inside the path keep their lengths.
+ */
+long long reversal_delta(const TwoLevelList& tour, const Distances& distances, int first, int last) {
+    int before = tour.prev(first);
+    int after = tour.next(last);
+
+    // Reversing a single city or the whole tour does not change its length
+    if (first == last || after == first) {
+        return 0;
+    }
+    return static_cast<long long>(distances(before, last)) + distances(first, after) -
+           distances(before, first) - distances(last, after);
+}
+
+// --- Tour Modification ---
+/*
+ * Swaps the cities at positions i and j and updates their positions.
+ */
+void swap_cities(std::vector<int>& tour, std::vector<int>& positions, int i, int j) {
+    std::swap(tour[i], tour[j]);
+    positions[tour[i]] = i;
+    positions[tour[j]] = j;
+}
+
+/*
+ * Reverses the segment from begin to end (inclusive) and updates the positions of its cities. For symmetric
+ * distances reversing the complementary segment yields the same tour traversed in the opposite direction,
+ * so the shorter of the two is reversed.
+ */
+void reverse_segment(std::vector<int>& tour, std::vector<int>& positions, int begin, int end, bool symmetric) {
+    int num_cities = static_cast<int>(tour.size());
+    int length = end - begin + 1;
+    if (symmetric && 2 * length > num_cities) {
+        begin = (end + 1) % num_cities;
+        end = (begin + num_cities - length - 1) % num_cities;
+        length = num_cities - length;
+    }
+
+    for (int k = 0; k < length / 2; ++k) {
+        int left = (begin + k) % num_cities;
+        int right = (end - k + num_cities) % num_cities;
+        std::swap(tour[left], tour[right]);
+        positions[tour[left]] = left;
+        positions[tour[right]] = right;
+    }
+}
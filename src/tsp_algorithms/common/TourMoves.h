@@ -0,0 +1,30 @@
+// src/tsp_algorithms/common/TourMoves.h
+
+#ifndef TOURMOVES_H
+#define TOURMOVES_H
+
+#include "Distances.h"
+#include "TwoLevelList.h"
+#include <vector>
+
+
+// Moves on a tour stored as an array of cities with the position of every city, shared by SA and TS.
+// Cost changes are computed from the affected edges without modifying the tour.
+
+// Returns the cost change of swapping the cities at positions i and j
+long long swap_delta(const std::vector<int>& tour, const Distances& distances, int i, int j);
+
+// Returns the cost change of reversing the segment from begin to end (inclusive)
+long long reversal_delta(const std::vector<int>& tour, const Distances& distances, int begin, int end);
+
+// Returns the cost change of reversing the path from city first to city last of a symmetric tour stored as a
+// two-level list
+long long reversal_delta(const TwoLevelList& tour, const Distances& distances, int first, int last);
+
+// Swaps the cities at positions i and j
+void swap_cities(std::vector<int>& tour, std::vector<int>& positions, int i, int j);
+
+// Reverses the segment from begin to end (inclusive), or its complement if that is shorter and equivalent
+void reverse_segment(std::vector<int>& tour, std::vector<int>& positions, int begin, int end, bool symmetric);
+
+#endif // TOURMOVES_H
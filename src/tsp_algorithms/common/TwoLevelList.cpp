@@ -0,0 +1,217 @@
+// src/tsp_algorithms/common/TwoLevelList.cpp
+
+#include "TwoLevelList.h"
+#include <algorithm>
+#include <cmath>
+#include <utility>
+
+
+// --- Construction ---
+/*
+ * Creates the tour visiting the cities in the given order.
+ */
+TwoLevelList::TwoLevelList(const std::vector<int>& tour) {
+    rebuild(tour);
+}
+
+/*
+ * Splits the tour into segments of about sqrt(n) consecutive cities with cleared reversal bits. Every reversal
+ * adds at most two segments, so the tour is rebuilt once their number has grown fourfold, which bounds the
+ * number of segments and keeps the amortized cost of the rebuilds at O(sqrt(n)) per reversal.
+ */
+void TwoLevelList::rebuild(const std::vector<int>& tour) {
+    int num_cities = static_cast<int>(tour.size());
+    int segment_size = std::max(1, static_cast<int>(std::sqrt(static_cast<double>(num_cities))));
+    int num_segments = (num_cities + segment_size - 1) / segment_size;
+
+    cities.resize(num_cities);
+    segments.clear();
+    for (int segment = 0; segment < num_segments; ++segment) {
+        int begin = segment * segment_size;
+        int end = std::min(num_cities, begin + segment_size) - 1;
+        segments.push_back({tour[begin], tour[end], (segment + 1) % num_segments,
+                            (segment + num_segments - 1) % num_segments, segment, false});
+    }
+    for (int position = 0; position < num_cities; ++position) {
+        cities[tour[position]] = {tour[(position + 1) % num_cities], tour[(position + num_cities - 1) % num_cities],
+                                  position % segment_size, position / segment_size};
+    }
+    max_segments = 4 * static_cast<size_t>(num_segments) + 2;
+}
+
+// --- Queries ---
+/*
+ * Compares the positions of the cities in tour order, given by the rank of their segment and their sequence
+ * number in the direction of the segment, taking into account that the path may wrap around.
+ */
+bool TwoLevelList::between(int a, int b, int c) const {
+    auto order = [this](int city) {
+        const Segment& segment = segments[cities[city].segment];
+        return std::make_pair(segment.rank, segment.reversed ? -cities[city].id : cities[city].id);
+    };
+    auto order_a = order(a);
+    auto order_b = order(b);
+    auto order_c = order(c);
+    if (order_a <= order_c) {
+        return order_a <= order_b && order_b <= order_c;
+    }
+    return order_a <= order_b || order_b <= order_c;
+}
+
+/*
+ * Stores the cities in tour order, starting from city 0.
+ */
+void TwoLevelList::to_vector(std::vector<int>& tour) const {
+    tour.resize(cities.size());
+    int city = 0;
+    for (int& visited : tour) {
+        visited = city;
+        city = next(city);
+    }
+}
+
+// --- Reversal ---
+/*
+ * Reverses the path from first to last. The segments are split so that the path consists of whole segments,
+ * then their bits are flipped and their order is reversed. Inside the path the links stay valid, since flipping
+ * a bit swaps the roles of both links; only the two edges joining the path to the rest of the tour are relinked.
+ */
+void TwoLevelList::reverse(int first, int last) {
+    if (first == last) {
+        return;
+    }
+    int before = prev(first);
+    int after = next(last);
+    bool whole_tour = after == first;
+
+    split_before(first);
+    split_after(last);
+
+    // Collect the segments of the path in tour order and flip them
+    path_segments.clear();
+    for (int segment = cities[first].segment;; segment = segments[segment].next) {
+        path_segments.push_back(segment);
+        segments[segment].reversed = !segments[segment].reversed;
+        if (segment == cities[last].segment) {
+            break;
+        }
+    }
+
+    if (whole_tour) {
+        // The whole cycle changes its direction
+        for (int segment : path_segments) {
+            std::swap(segments[segment].next, segments[segment].prev);
+        }
+    } else {
+        // Join the reversed path to the rest of the tour
+        set_next(before, last);
+        set_prev(last, before);
+        set_next(first, after);
+        set_prev(after, first);
+
+        // Link the segments in the opposite order between the segments around the path
+        int previous_segment = segments[path_segments.front()].prev;
+        int next_segment = segments[path_segments.back()].next;
+        segments[previous_segment].next = path_segments.back();
+        segments[path_segments.back()].prev = previous_segment;
+        for (size_t k = path_segments.size() - 1; k > 0; --k) {
+            segments[path_segments[k]].next = path_segments[k - 1];
+            segments[path_segments[k - 1]].prev = path_segments[k];
+        }
+        segments[path_segments.front()].next = next_segment;
+        segments[next_segment].prev = path_segments.front();
+    }
+
+    // Renumber the segments in tour order
+    int rank = 0;
+    int segment = path_segments.front();
+    do {
+        segments[segment].rank = rank++;
+        segment = segments[segment].next;
+    } while (segment != path_segments.front());
+
+    if (segments.size() > max_segments) {
+        std::vector<int> tour;
+        to_vector(tour);
+        rebuild(tour);
+    }
+}
+
+/*
+ * Splits the segment of the city so that the city is the first one of its segment in tour order.
+ */
+void TwoLevelList::split_before(int city) {
+    const Segment& segment = segments[cities[city].segment];
+    if (!segment.reversed && city != segment.first) {
+        split(cities[city].segment, cities[city].prev);
+    } else if (segment.reversed && city != segment.last) {
+        split(cities[city].segment, city);
+    }
+}
+
+/*
+ * Splits the segment of the city so that the city is the last one of its segment in tour order.
+ */
+void TwoLevelList::split_after(int city) {
+    const Segment& segment = segments[cities[city].segment];
+    if (!segment.reversed && city != segment.last) {
+        split(cities[city].segment, city);
+    } else if (segment.reversed && city != segment.first) {
+        split(cities[city].segment, cities[city].prev);
+    }
+}
+
+/*
+ * Splits a segment into the cities up to the given one and the cities after it, in the orientation of the
+ * segment. The smaller part becomes a new segment with the same bit, so only its cities are relabeled and
+ * no link or sequence number changes. The new segment is placed before or after the old one in tour order.
+ */
+void TwoLevelList::split(int segment, int city) {
+    Segment part = segments[segment];
+    int head_size = cities[city].id - cities[part.first].id + 1;
+    int tail_size = cities[part.last].id - cities[city].id;
+    bool move_head = head_size <= tail_size;
+    if (move_head) {
+        part.last = city;
+        segments[segment].first = cities[city].next;
+    } else {
+        part.first = cities[city].next;
+        segments[segment].last = city;
+    }
+
+    int new_segment = static_cast<int>(segments.size());
+    for (int moved = part.first;; moved = cities[moved].next) {
+        cities[moved].segment = new_segment;
+        if (moved == part.last) {
+            break;
+        }
+    }
+
+    // The head precedes the tail in tour order unless the segment is reversed
+    if (move_head == part.reversed) {
+        part.prev = segment;
+        part.next = segments[segment].next;
+        segments[part.next].prev = new_segment;
+        segments[segment].next = new_segment;
+    } else {
+        part.next = segment;
+        part.prev = segments[segment].prev;
+        segments[part.prev].next = new_segment;
+        segments[segment].prev = new_segment;
+    }
+    segments.push_back(part);
+}
+
+/*
+ * Sets the link followed to the next city in tour order, which depends on the bit of the segment.
+ */
+void TwoLevelList::set_next(int city, int next_city) {
+    (segments[cities[city].segment].reversed ? cities[city].prev : cities[city].next) = next_city;
+}
+
+/*
+ * Sets the link followed to the previous city in tour order, which depends on the bit of the segment.
+ */
+void TwoLevelList::set_prev(int city, int prev_city) {
+    (segments[cities[city].segment].reversed ? cities[city].next : cities[city].prev) = prev_city;
+}
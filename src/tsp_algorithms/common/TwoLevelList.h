@@ -0,0 +1,90 @@
+// src/tsp_algorithms/common/TwoLevelList.h
+
+#ifndef TWOLEVELLIST_H
+#define TWOLEVELLIST_H
+
+#include <cstddef>
+#include <vector>
+
+
+// Tour stored as a two-level doubly-linked list: the cities form a doubly-linked cycle split into about sqrt(n)
+// segments, and every segment has a reversal bit telling in which direction its links are followed. A path is
+// reversed by splitting the segments at its ends, flipping the bits of its segments and reversing their order,
+// in O(sqrt(n)) instead of the O(n) of an array, while the successor, predecessor and between queries take O(1)
+class TwoLevelList {
+public:
+    // Number of cities from which the engines store tours of symmetric instances as a two-level list
+    static constexpr size_t MIN_CITIES = 10000;
+
+    // Creates an empty tour
+    TwoLevelList() = default;
+
+    // Creates the tour visiting the cities in the given order
+    explicit TwoLevelList(const std::vector<int>& tour);
+
+    // Returns the number of cities
+    size_t size() const { return cities.size(); }
+
+    // Returns true if the tour holds no cities
+    bool empty() const { return cities.empty(); }
+
+    // Returns the city following the given one
+    int next(int city) const {
+        return segments[cities[city].segment].reversed ? cities[city].prev : cities[city].next;
+    }
+
+    // Returns the city preceding the given one
+    int prev(int city) const {
+        return segments[cities[city].segment].reversed ? cities[city].next : cities[city].prev;
+    }
+
+    // Returns true if city b lies on the path from city a forward to city c (both inclusive)
+    bool between(int a, int b, int c) const;
+
+    // Reverses the path from city first forward to city last (both inclusive)
+    void reverse(int first, int last);
+
+    // Stores the cities in tour order, starting from city 0
+    void to_vector(std::vector<int>& tour) const;
+
+private:
+    // A city with its links, which are followed backwards while the bit of its segment is set
+    struct City {
+        int next;     // Next city in the orientation of the segment
+        int prev;     // Previous city in the orientation of the segment
+        int id;       // Sequence number, increasing along the orientation of the segment
+        int segment;  // Segment containing the city
+    };
+
+    // A run of cities with consecutive sequence numbers
+    struct Segment {
+        int first;     // City with the smallest sequence number
+        int last;      // City with the largest sequence number
+        int next;      // Next segment in tour order
+        int prev;      // Previous segment in tour order
+        int rank;      // Position of the segment in tour order
+        bool reversed; // Whether the segment is traversed from last to first
+    };
+
+    // Splits the tour into segments of about sqrt(n) cities
+    void rebuild(const std::vector<int>& tour);
+
+    // Splits the segment of the city so that the city starts (or ends) its segment in tour order
+    void split_before(int city);
+    void split_after(int city);
+
+    // Splits a segment after the given city in the orientation of the segment; the smaller part is relabeled
+    void split(int segment, int city);
+
+    // Sets the link followed to the next (or previous) city in tour order
+    void set_next(int city, int next_city);
+    void set_prev(int city, int prev_city);
+
+    // --- Member Variables ---
+    std::vector<City> cities;          // Cities indexed by their number
+    std::vector<Segment> segments;     // Segments, including those created by splits since the last rebuild
+    size_t max_segments{0};            // Number of segments from which the tour is rebuilt
+    std::vector<int> path_segments;    // Segments of the reversed path, reused across reversals
+};
+
+#endif // TWOLEVELLIST_H
@@ -0,0 +1,370 @@
+// src/tsp_algorithms/sa/AnnealingChain.cpp
+
+#include "AnnealingChain.h"
+#include <algorithm>
+#include <cmath>
+#include <limits>
+#include <numeric>
+
+
+// --- Constructor ---
+/*
+ * Initializes the chain with its own random number generator and initial solution.
+ */
+AnnealingChain::AnnealingChain(const Distances& distances, const CandidateLists& candidate_lists,
+    NeighborSelectionMethodSA neighbor_selection_method, InitialSolutionMethodSA initial_solution_method,
+    unsigned int seed):
+
+    distances(distances), candidate_lists(candidate_lists), neighbor_selection_method(neighbor_selection_method),
+    rng(seed) {
+
+    // Initialize the initial solution based on the specified type.
+    initialize_solution(initial_solution_method);
+    // Record the position of every city in the solution.
+    positions.resize(current_solution.size());
+    for (size_t position = 0; position < current_solution.size(); ++position) {
+        positions[current_solution[position]] = static_cast<int>(position);
+    }
+    // Reverse segments of large tours in a two-level list; an Insert is applied as two reversals.
+    if (distances.is_symmetric() &&
+        ((neighbor_selection_method == NeighborSelectionMethodSA::INVERT &&
+          current_solution.size() >= TwoLevelList::MIN_CITIES) ||
+         (neighbor_selection_method == NeighborSelectionMethodSA::INSERT &&
+          current_solution.size() >= MIN_INSERT_CITIES))) {
+        linked_tour = TwoLevelList(current_solution);
+    }
+    // Calculate the cost of the initial solution.
+    current_cost = calculate_cost(current_solution);
+    // Set the current solution as the best one.
+    best_solution = current_solution;
+    // Set the current cost as the best one.
+    best_cost = current_cost;
+}
+
+// --- Annealing ---
+/*
+ * Performs the given number of moves at the current temperature. Every move is accepted if it is better, or
+ * with a probability depending on the temperature, and only accepted moves modify the tour.
+ */
+void AnnealingChain::anneal(int steps) {
+    for (int step = 0; step < steps; step++) {
+        // Generate a move and calculate the cost difference it would cause
+        MoveSA move = generate_move();
+        long long delta = calculate_move_delta(move);
+        iteration_count++;
+
+        // Accept the move if it is better or with a certain probability, only then the tour is modified
+        if (delta < 0 || generate_random_double() < std::exp(-delta / temperature)) {
+            // Leaving the best solution, keep a copy of it
+            if (delta > 0) {
+                store_best_solution();
+            }
+            apply_move(move);
+            current_cost += delta;
+
+            // Update the best solution if the new one is better
+            update_best_solution();
+        }
+    }
+}
+
+// --- Solution Initialization ---
+/*
+ * Initializes the solution based on the specified type (e.g., Random or Greedy).
+ */
+void AnnealingChain::initialize_solution(InitialSolutionMethodSA initial_solution_method) {
+    if (initial_solution_method == InitialSolutionMethodSA::RANDOM) {
+        initialize_random_solution();
+    } else if (initial_solution_method == InitialSolutionMethodSA::GREEDY) {
+        initialize_greedy_solution();
+    }
+}
+
+// --- Random Solution Initialization ---
+/*
+ * Initializes a random solution (random permutation of cities).
+ */
+void AnnealingChain::initialize_random_solution() {
+    current_solution.resize(distances.size());
+    std::iota(current_solution.begin(), current_solution.end(), 0);
+    std::shuffle(current_solution.begin(), current_solution.end(), rng);
+}
+
+// --- Greedy Solution Initialization ---
+/*
+ * Initializes a greedy solution (nearest neighbor heuristic).
+ */
+void AnnealingChain::initialize_greedy_solution() {
+    size_t num_cities = distances.size();
+    current_solution.clear();
+    current_solution.reserve(num_cities);
+
+    // Start from a random city
+    std::uniform_int_distribution<size_t> dist(0, num_cities - 1);
+    size_t current_city = dist(rng);
+    current_solution.push_back(current_city);
+
+    std::vector<bool> visited(num_cities, false);
+    visited[current_city] = true;
+
+    // Greedy step: choose the closest city
+    for (size_t step = 1; step < num_cities; ++step) {
+        int closest_city = -1;
+        int min_distance = std::numeric_limits<int>::max();
+        const int* distances_from_current = distances.row(current_city);
+
+        for (size_t city = 0; city < num_cities; ++city) {
+            if (!visited[city] && distances_from_current[city] < min_distance) {
+                closest_city = city;
+                min_distance = distances_from_current[city];
+            }
+        }
+
+        current_solution.push_back(closest_city);
+        visited[closest_city] = true;
+        current_city = closest_city;
+    }
+}
+
+/*
+ * Updates the best cost if the current solution is better. The solution is only copied by store_best_solution()
+ * when the search is about to leave it, so a run of improving moves does not copy the tour on every step.
+ */
+void AnnealingChain::update_best_solution() {
+    if (current_cost < best_cost) {
+        best_cost = current_cost;
+        current_is_best = true;
+    }
+}
+
+/*
+ * Copies the current solution into the best solution if it is the best one found so far.
+ */
+void AnnealingChain::store_best_solution() {
+    if (current_is_best) {
+        if (linked_tour.empty()) {
+            best_solution = current_solution;
+        } else {
+            best_linked_tour = linked_tour;
+        }
+        current_is_best = false;
+    }
+}
+
+/*
+ * Returns the current solution, reading it from the two-level list first if the tour is stored in one.
+ */
+const std::vector<int>& AnnealingChain::get_current_solution() {
+    if (!linked_tour.empty()) {
+        linked_tour.to_vector(current_solution);
+    }
+    return current_solution;
+}
+
+/*
+ * Returns the best solution found by the chain, copying the current solution first if it is the best one.
+ */
+const std::vector<int>& AnnealingChain::get_best_solution() {
+    store_best_solution();
+    if (!best_linked_tour.empty()) {
+        best_linked_tour.to_vector(best_solution);
+    }
+    return best_solution;
+}
+
+// --- Cost Calculation ---
+/*
+ * Calculates the cost of a solution (sum of distances).
+ */
+long long AnnealingChain::calculate_cost(const std::vector<int>& solution) const {
+    long long cost = 0;
+    for (size_t i = 0; i < solution.size() - 1; ++i) {
+        cost += distances(solution[i], solution[i + 1]);
+    }
+    cost += distances(solution.back(), solution.front());
+    return cost;
+}
+
+// --- Move Generation ---
+/*
+ * Generates a random move based on the selected method (Swap, Insert, Invert) between two distinct positions.
+ * An Insert moves the city at i to the position j it would take after removing it from the tour. With a
+ * two-level list, an Invert reverses the path between two distinct cities and an Insert moves a city behind
+ * another one.
+ */
+MoveSA AnnealingChain::generate_move() {
+    if (!candidate_lists.empty()) {
+        return generate_candidate_move();
+    }
+
+    int num_cities = static_cast<int>(current_solution.size());
+    int i = generate_random_number(0, num_cities - 1);
+    int j;
+    do {
+        j = generate_random_number(0, num_cities - 1);
+    } while (i == j);
+
+    switch (neighbor_selection_method) {
+        case NeighborSelectionMethodSA::SWAP:
+            return {i, j};
+        case NeighborSelectionMethodSA::INSERT:
+            // Behind the city at j when moving forward, in front of it when moving backward
+            return linked_tour.empty() ? MoveSA{i, i < j ? j : (j + num_cities - 1) % num_cities} : MoveSA{i, j};
+        case NeighborSelectionMethodSA::INVERT:
+            return linked_tour.empty() ? MoveSA{std::min(i, j), std::max(i, j)} : MoveSA{i, j};
+    }
+    return {i, j};
+}
+
+/*
+ * Generates a move in which a random city is followed by one of its candidate cities.
+ * Swap exchanges the candidate with the successor, Insert moves the candidate behind the city, and Invert
+ * reverses the segment between them (a 2-opt move creating the candidate edge).
+ */
+MoveSA AnnealingChain::generate_candidate_move() {
+    int num_cities = static_cast<int>(current_solution.size());
+    int i = generate_random_number(0, num_cities - 1);
+
+    // With a two-level list, the candidate is moved behind a random city, or the path from the successor of the
+    // city to its candidate is reversed
+    if (!linked_tour.empty()) {
+        int candidate = candidate_lists.at(i, generate_random_number(0, candidate_lists.size_per_city() - 1));
+        return neighbor_selection_method == NeighborSelectionMethodSA::INSERT ? MoveSA{candidate, i}
+                                                                               : MoveSA{linked_tour.next(i), candidate};
+    }
+    int candidate = candidate_lists.at(current_solution[i],
+                                       generate_random_number(0, candidate_lists.size_per_city() - 1));
+    int j = positions[candidate];
+
+    switch (neighbor_selection_method) {
+        case NeighborSelectionMethodSA::SWAP:
+            return {(i + 1) % num_cities, j};
+        case NeighborSelectionMethodSA::INSERT:
+            return {j, i};
+        case NeighborSelectionMethodSA::INVERT:
+            return i < j ? MoveSA{i + 1, j} : MoveSA{j + 1, i};
+    }
+    return {i, j};
+}
+
+// --- Move Evaluation ---
+/*
+ * Calculates the cost change of a move from the edges it removes and adds, in constant time. Only the Invert
+ * move of an asymmetric instance also has to account for the reversed direction of the edges inside the segment.
+ */
+long long AnnealingChain::calculate_move_delta(const MoveSA& move) const {
+    const std::vector<int>& tour = current_solution;
+    int num_cities = static_cast<int>(tour.size());
+    auto city_at = [&](int position) { return tour[(position + num_cities) % num_cities]; };
+
+    switch (neighbor_selection_method) {
+        case NeighborSelectionMethodSA::SWAP:
+            return swap_delta(tour, distances, move.first, move.second);
+        case NeighborSelectionMethodSA::INSERT: {
+            int city, previous, next, gap_start, gap_end;
+            if (linked_tour.empty()) {
+                int from = move.first;
+                int gap = move.second;
+                // The gaps next to the city leave the tour unchanged
+                if (gap == from || gap == (from + num_cities - 1) % num_cities) {
+                    return 0;
+                }
+                city = tour[from];
+                previous = city_at(from - 1);
+                next = city_at(from + 1);
+                gap_start = tour[gap];
+                gap_end = city_at(gap + 1);
+            } else {
+                city = move.first;
+                gap_start = move.second;
+                if (gap_start == city || gap_start == linked_tour.prev(city)) {
+                    return 0;
+                }
+                previous = linked_tour.prev(city);
+                next = linked_tour.next(city);
+                gap_end = linked_tour.next(gap_start);
+            }
+            return static_cast<long long>(distances(previous, next)) + distances(gap_start, city) +
+                   distances(city, gap_end) - distances(previous, city) - distances(city, next) -
+                   distances(gap_start, gap_end);
+        }
+        case NeighborSelectionMethodSA::INVERT:
+            return linked_tour.empty() ? reversal_delta(tour, distances, move.first, move.second)
+                                       : reversal_delta(linked_tour, distances, move.first, move.second);
+    }
+    return 0;
+}
+
+/*
+ * Applies a move to the current solution in place and updates the positions of the moved cities. With a
+ * two-level list, an Insert takes two reversals in O(sqrt(n)) instead of shifting the cities in between.
+ */
+void AnnealingChain::apply_move(const MoveSA& move) {
+    switch (neighbor_selection_method) {
+        case NeighborSelectionMethodSA::SWAP:
+            swap_cities(current_solution, positions, move.first, move.second);
+        break;
+        case NeighborSelectionMethodSA::INSERT: {
+            if (!linked_tour.empty()) {
+                int city = move.first;
+                int gap_start = move.second;
+                if (gap_start == city || gap_start == linked_tour.prev(city)) {
+                    break;
+                }
+                // Reversing the path from the city to gap_start puts the city in front of the successor of
+                // gap_start; reversing the path back to the old successor of the city restores its direction
+                int next = linked_tour.next(city);
+                linked_tour.reverse(city, gap_start);
+                linked_tour.reverse(gap_start, next);
+                break;
+            }
+            int from = move.first;
+            int gap = move.second;
+            if (gap == from) {
+                break;
+            }
+            // Shift the cities between the old and the new position by one
+            int first;
+            int last;
+            if (from < gap) {
+                std::rotate(current_solution.begin() + from, current_solution.begin() + from + 1,
+                            current_solution.begin() + gap + 1);
+                first = from;
+                last = gap;
+            } else {
+                std::rotate(current_solution.begin() + gap + 1, current_solution.begin() + from,
+                            current_solution.begin() + from + 1);
+                first = gap + 1;
+                last = from;
+            }
+            for (int position = first; position <= last; ++position) {
+                positions[current_solution[position]] = position;
+            }
+            break;
+        }
+        case NeighborSelectionMethodSA::INVERT:
+            if (linked_tour.empty()) {
+                reverse_segment(current_solution, positions, move.first, move.second, distances.is_symmetric());
+            } else {
+                linked_tour.reverse(move.first, move.second);
+            }
+        break;
+    }
+}
+
+// --- Random Helpers ---
+/*
+ * Generates a random integer number in the range [min, max].
+ */
+int AnnealingChain::generate_random_number(int min, int max) {
+    std::uniform_int_distribution<> dist(min, max);
+    return dist(rng);
+}
+
+/*
+ * Generates a random double number in the range [0, 1).
+ */
+double AnnealingChain::generate_random_double() {
+    std::uniform_real_distribution<> dist(0.0, 1.0);
+    return dist(rng);
+}
@@ -0,0 +1,129 @@
+// src/tsp_algorithms/sa/AnnealingChain.h
+
+#ifndef ANNEALING_CHAIN_H
+#define ANNEALING_CHAIN_H
+
+#include "InitialSolutionMethodSA.h"
+#include "NeighborSelectionMethodSA.h"
+#include "CandidateLists.h"
+#include "Distances.h"
+#include "MoveSA.h"
+#include "TourMoves.h"
+#include "TwoLevelList.h"
+#include <random>
+#include <vector>
+
+
+// Class representing one Simulated Annealing chain: a tour annealed at its own temperature with its own random
+// number generator. Chains only read the shared distances, so several of them can run on separate threads
+class AnnealingChain {
+public:
+    // Number of cities from which Insert moves, applied as two reversals, are faster in a two-level list than
+    // rotating the array
+    static constexpr size_t MIN_INSERT_CITIES = 25000;
+
+    // Constructor creating the initial solution of the chain
+    AnnealingChain(const Distances& distances, const CandidateLists& candidate_lists,
+                   NeighborSelectionMethodSA neighbor_selection_method,
+                   InitialSolutionMethodSA initial_solution_method, unsigned int seed);
+
+    // Performs the given number of moves at the current temperature
+    void anneal(int steps);
+
+    // Multiplies the temperature by alpha (geometric cooling)
+    void cool(double alpha) { temperature *= alpha; }
+
+    // Returns the current temperature
+    double get_temperature() const { return temperature; }
+
+    // Sets the current temperature
+    void set_temperature(double new_temperature) { temperature = new_temperature; }
+
+    // Returns the current solution and its cost
+    const std::vector<int>& get_current_solution();
+    long long get_current_cost() const { return current_cost; }
+
+    // Returns the best solution found by the chain and its cost
+    const std::vector<int>& get_best_solution();
+    long long get_best_cost() const { return best_cost; }
+
+    // Returns the number of moves evaluated by the chain
+    long long get_iteration_count() const { return iteration_count; }
+
+    // Calculates the total cost of the solution path
+    long long calculate_cost(const std::vector<int>& solution) const;
+
+private:
+    // --- Solution Initialization ---
+    // Initializes the solution based on the specified type (e.g., Random or Greedy)
+    void initialize_solution(InitialSolutionMethodSA initial_solution_type);
+
+    // Initializes a random solution (random permutation of cities)
+    void initialize_random_solution();
+
+    // Initializes a greedy solution (nearest neighbor heuristic)
+    void initialize_greedy_solution();
+
+    // Updates the best cost if the current solution is better, the solution itself is copied lazily
+    void update_best_solution();
+
+    // Copies the current solution into the best solution if it is the best one found
+    void store_best_solution();
+
+    // --- Move Generation ---
+    // Generates a random move based on the selected method (Swap, Insert, Invert)
+    MoveSA generate_move();
+
+    // Generates a move that joins a random city with one of its candidate cities
+    MoveSA generate_candidate_move();
+
+    // --- Move Evaluation ---
+    // Calculates the cost change of a move without applying it
+    long long calculate_move_delta(const MoveSA& move) const;
+
+    // Applies a move to the current solution in place
+    void apply_move(const MoveSA& move);
+
+    // --- Random Number Generation Helpers ---
+    // Generates a random integer number in the range [min, max]
+    int generate_random_number(int min, int max);
+
+    // Generates a random double number in the range [0, 1)
+    double generate_random_double();
+
+    // --- Member Variables ---
+    // Distances between cities and candidate lists, shared by all chains
+    const Distances& distances;
+    const CandidateLists& candidate_lists;
+
+    // Selected method for type of move
+    NeighborSelectionMethodSA neighbor_selection_method;
+
+    // Random number generator of the chain
+    std::mt19937 rng;
+
+    // Current temperature
+    double temperature{};
+
+    // Current solution, the position of every city in it, and its cost
+    std::vector<int> current_solution;
+    std::vector<int> positions;
+    long long current_cost;
+
+    // Current solution of large symmetric instances annealed with Invert or Insert moves; if not empty, moves are
+    // given by cities and current_solution is only updated on request
+    TwoLevelList linked_tour;
+
+    // Copy of the two-level list holding the best solution, which is only read into best_solution on request
+    TwoLevelList best_linked_tour;
+
+    // Best solution found and its cost; while current_is_best is set, best_solution may be stale
+    std::vector<int> best_solution;
+    long long best_cost;
+    bool current_is_best{true};
+
+    // Number of moves evaluated by the chain
+    long long iteration_count{0};
+};
+
+#endif // ANNEALING_CHAIN_H
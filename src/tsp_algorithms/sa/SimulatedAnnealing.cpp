@@ -1,98 +1,189 @@
 // src/tsp_algorithms/sa/SimulatedAnnealing.cpp
 
 #include "SimulatedAnnealing.h"
-#include <nng/protocol/pair1/pair.h>
+#include <algorithm>
+#include <cmath>
 #include <random>
 #include <iostream>
-#include <sstream>
-#include <fstream>
+#include <limits>
+#include <numeric>
 #include <vector>
 #include <string>
+#include <thread>
 
 
 // --- Constructor ---
 /*
  * Initializes the Simulated Annealing algorithm with the given parameters.
  */
-SimulatedAnnealing::SimulatedAnnealing(int port, int data_frequency_ms, const std::vector<std::vector<int>>& dist_matrix, int duration_ms,
+SimulatedAnnealing::SimulatedAnnealing(int port, int data_frequency_ms, Distances dist, int duration_ms,
     InitialTempMethodSA initial_temp_method, InitialSolutionMethodSA initial_solution_method,
-    NeighborSelectionMethodSA neighbor_selection_method, int steps_per_temp, double alpha):
+    NeighborSelectionMethodSA neighbor_selection_method, int steps_per_temp, double alpha,
+    CandidateLists candidate_lists, int num_chains, MultiChainStrategySA multi_chain_strategy, int exchange_interval,
+    unsigned int seed, ControlWord control, bool text_telemetry):
 
+    telemetry(text_telemetry),
     max_duration(duration_ms), data_frequency(data_frequency_ms), alpha(alpha), steps_per_temp(steps_per_temp),
-    neighbor_selection_method(neighbor_selection_method), distances(dist_matrix) {
-
-    // Initialize the initial solution based on the specified type.
-    initialize_solution(initial_solution_method);
-    // Calculate the cost of the initial solution.
-    current_cost = calculate_cost(current_solution);
-    // Set the current solution as the best one.
-    best_solution = current_solution;
-    // Set the current cost as the best one.
-    best_cost = current_cost;
-    // Initialize the temperature based on the specified method.
-    initialize_temperature(initial_temp_method);
-
-    // NNG socket initialization
-    if (nng_pair1_open(&sock) != 0) {
-        std::cout << "Failed to open NNG socket." << std::endl;
-    }
-
-    // Create the address using the specified port
-    std::string address = "tcp://127.0.0.1:" + std::to_string(port);
-    if (nng_dial(sock, address.c_str(), NULL, 0) != 0) {
-        std::cout << "Failed to connect NNG socket." << std::endl;
+    distances(std::move(dist)), candidate_lists(std::move(candidate_lists)),
+    multi_chain_strategy(multi_chain_strategy), exchange_interval(std::max(exchange_interval, 1)), rng(seed),
+    thread_pool(std::max(num_chains, 1)), control(std::move(control)) {
+
+    // Connect to the receiver first, which is already listening, so that a failure shows before the setup
+    auto setup_start = std::chrono::steady_clock::now();
+    telemetry.connect(port);
+
+    // Create the chains, each with its own initial solution and random number generator.
+    chains.reserve(thread_pool.size());
+    for (int chain = 0; chain < thread_pool.size(); ++chain) {
+        chains.emplace_back(distances, this->candidate_lists, neighbor_selection_method,
+                            initial_solution_method, rng());
     }
-}
+    // Initialize the temperatures based on the specified method.
+    initialize_temperatures(initial_temp_method);
 
-// --- Destructor ---
-/*
- * Destroys the Simulated Annealing algorithm and closes the NNG socket.
- */
-SimulatedAnnealing::~SimulatedAnnealing() {
-    nng_close(sock);
+    // Signal the receiver that the engine is set up, completing the startup handshake
+    auto setup_ms = std::chrono::duration_cast<std::chrono::milliseconds>(
+        std::chrono::steady_clock::now() - setup_start).count();
+    telemetry.send_ready(setup_ms, best_chain().get_best_cost());
 }
 
 // --- Main Algorithm Loop ---
 /*
  * The main function that runs the Simulated Annealing algorithm.
- * It iterates until the termination condition is met (time).
+ * It iterates until the termination condition is met (time or a stop request) and returns the best solution
+ * found with statistics of the run.
  */
-void SimulatedAnnealing::run() {
+ResultSA SimulatedAnnealing::run() {
     // Start the timer to measure the algorithm's duration.
     auto start_time = std::chrono::steady_clock::now();
     auto last_send_time = start_time;
 
-    // Iteration loop until the termination condition is met.
+    // Iteration loop until the termination condition is met. The chains run in parallel until the next data
+    // sending (or replica exchange) or control request, then the best of them is reported.
     while (!should_terminate(start_time)) {
+        // Send a requested snapshot and wait while the run is paused
+        handle_control_requests(start_time, last_send_time);
+
+        auto end_time = start_time + std::chrono::milliseconds(max_duration);
+        auto epoch_end = multi_chain_strategy == MultiChainStrategySA::PARALLEL_TEMPERING
+            ? end_time : std::min(end_time, last_send_time + std::chrono::milliseconds(data_frequency));
+        thread_pool.run(static_cast<int>(chains.size()), [&](int chain, int) {
+            run_chain_epoch(chains[chain], epoch_end);
+        });
+
+        // Let the chains of the ladder exchange their temperatures
+        if (multi_chain_strategy == MultiChainStrategySA::PARALLEL_TEMPERING) {
+            exchange_replicas();
+        }
+        // Send the current data, passing start_time and last_send_time by reference
+        send_data(start_time, last_send_time);
+    }
+    // Collect the result from the chain holding the best solution
+    AnnealingChain& chain = best_chain();
+    ResultSA result;
+    result.best_solution = chain.get_best_solution();
+    result.best_cost = chain.get_best_cost();
+    result.iteration_count = get_iteration_count();
+    result.final_temperature = chain.get_temperature();
+    for (const AnnealingChain& annealing_chain : chains) {
+        result.chain_best_costs.push_back(annealing_chain.get_best_cost());
+    }
+    result.elapsed_ms = std::chrono::duration_cast<std::chrono::milliseconds>(
+        std::chrono::steady_clock::now() - start_time).count();
+    result.stopped = control.stop_requested();
 
-        // Loop for a specified number of steps at the current temperature
-        for (int step = 0; step < steps_per_temp; step++) {
-            // Generate a new neighbor solution
-            std::vector<int> new_solution = generate_neighbor(current_solution);
-            int new_cost = calculate_cost(new_solution);
+    // Send the final data to indicate the end of the algorithm
+    telemetry.send_end(result.elapsed_ms, result.best_cost, result.iteration_count);
+    return result;
+}
 
-            // Calculate the cost difference between the current and new solutions
-            int delta = new_cost - current_cost;
+/*
+ * Returns the number of moves evaluated by all chains.
+ */
+long long SimulatedAnnealing::get_iteration_count() const {
+    long long iteration_count = 0;
+    for (const AnnealingChain& chain : chains) {
+        iteration_count += chain.get_iteration_count();
+    }
+    return iteration_count;
+}
 
-            // Accept the new solution if it is better or with a certain probability
-            if (delta < 0 || generate_random_double() < std::exp(-delta / temperature)) {
-                current_solution = new_solution;
-                current_cost = new_cost;
+// --- Chain Scheduling ---
+/*
+ * Runs temperature levels on one chain, a number of steps at the current temperature followed by the cooling,
+ * until the epoch ends or a control request arrives. Chains of the parallel tempering ladder also stop after
+ * exchange_interval levels, so that they all run the same number of levels between exchanges and their
+ * temperatures keep their ratios; for the same reason they only give way to a stop request.
+ */
+void SimulatedAnnealing::run_chain_epoch(AnnealingChain& chain,
+                                         const std::chrono::steady_clock::time_point& epoch_end) const {
+    bool tempering = multi_chain_strategy == MultiChainStrategySA::PARALLEL_TEMPERING;
+    int max_levels = tempering ? exchange_interval : std::numeric_limits<int>::max();
+    int levels = 0;
+    do {
+        chain.anneal(steps_per_temp);
+        chain.cool(alpha);
+        levels++;
+    } while (levels < max_levels && std::chrono::steady_clock::now() < epoch_end &&
+             !(tempering ? control.stop_requested() : control.interrupted()));
+}
 
-                // Update the best solution if the new one is better
-                update_best_solution();
-            }
-            // Send the current data, passing start_time and last_send_time by reference
-            send_data(start_time, last_send_time);
+/*
+ * Proposes to exchange the temperatures of neighboring chains of the ladder, alternating between even and odd
+ * rungs. An exchange is accepted with the Metropolis probability min(1, exp((1/T_cold - 1/T_hot)(E_cold - E_hot))),
+ * so better solutions tend to move to colder temperatures while the hotter chains keep exploring.
+ */
+void SimulatedAnnealing::exchange_replicas() {
+    for (size_t rung = exchange_round % 2; rung + 1 < ladder.size(); rung += 2) {
+        AnnealingChain& hot = chains[ladder[rung]];
+        AnnealingChain& cold = chains[ladder[rung + 1]];
+        double exponent = (1.0 / cold.get_temperature() - 1.0 / hot.get_temperature()) *
+                          static_cast<double>(cold.get_current_cost() - hot.get_current_cost());
+        if (exponent >= 0 || generate_random_double() < std::exp(exponent)) {
+            double hot_temperature = hot.get_temperature();
+            hot.set_temperature(cold.get_temperature());
+            cold.set_temperature(hot_temperature);
+            std::swap(ladder[rung], ladder[rung + 1]);
         }
-        // Apply the temperature cooling after a certain number of steps
-        apply_temperature_cooling();
     }
-    // Send the final data to indicate the end of the algorithm
-    std::string eof_message = "EOF";
-    nng_send(sock, const_cast<char*>(eof_message.c_str()), eof_message.size(), 0);
+    exchange_round++;
+}
 
-    save_best_solution_to_file();
+/*
+ * Returns the chain whose best solution is the cheapest, the first one on ties.
+ */
+AnnealingChain& SimulatedAnnealing::best_chain() {
+    return *std::min_element(chains.begin(), chains.end(), [](const AnnealingChain& a, const AnnealingChain& b) {
+        return a.get_best_cost() < b.get_best_cost();
+    });
+}
+
+// --- Control Requests ---
+/*
+ * Sends the best solution to the receiver for every requested snapshot, and waits while a pause is requested,
+ * still sending snapshots. The pause does not count towards the duration, so the
+ * clock is shifted by it.
+ */
+void SimulatedAnnealing::handle_control_requests(std::chrono::steady_clock::time_point& start_time,
+                                                 std::chrono::steady_clock::time_point& last_send_time) {
+    auto pause_start = std::chrono::steady_clock::now();
+    bool paused = false;
+    while (true) {
+        if (control.snapshot_requested()) {
+            control.acknowledge_snapshot();
+            send_snapshot(start_time);
+        }
+        if (!control.pause_requested()) {
+            break;
+        }
+        paused = true;
+        std::this_thread::sleep_for(ControlWord::PAUSE_POLL_INTERVAL);
+    }
+    if (paused) {
+        auto paused_time = std::chrono::steady_clock::now() - pause_start;
+        start_time += paused_time;
+        last_send_time += paused_time;
+    }
 }
 
 // --- Data Sending ---
@@ -110,249 +201,144 @@ void SimulatedAnnealing::send_data(const std::chrono::steady_clock::time_point&
         auto elapsed_time = std::chrono::duration_cast<std::chrono::milliseconds>(current_time - start_time).count();
         last_send_time = current_time;
 
-        // Convert the current solution to a string
-        std::stringstream solution_stream;
-        for (size_t i = 0; i < current_solution.size(); ++i) {
-            solution_stream << current_solution[i];
-            if (i != current_solution.size() - 1) {
-                solution_stream << ",";
-            }
-        }
-
-        // Send the data through the NNG socket
-        std::string message = std::to_string(elapsed_time) + " " + std::to_string(best_cost) + " " + std::to_string(current_cost) + " " + solution_stream.str();
-        if (nng_send(sock, const_cast<char*>(message.c_str()), message.size(), 0) != 0) {
-            std::cerr << "Error: Failed to send message: " << message << std::endl;
-        }
+        // Report the chain holding the best solution found
+        AnnealingChain& chain = best_chain();
+        telemetry.send_data(elapsed_time, chain.get_best_cost(), chain.get_current_cost(), get_iteration_count(),
+                            chain.get_current_solution());
     }
 }
 
-// --- Best Solution Saving ---
 /*
- * Saves the best solution to a file.
- * Each city is written on a separate line, followed by the "EOF" marker.
+ * Sends the best solution found so far and its cost as a snapshot.
  */
-void SimulatedAnnealing::save_best_solution_to_file() {
-    std::string filename = "data/best_solutions/best_solution_sa.txt";
-    std::ofstream file(filename);
-    if (file.is_open()) {
-        for (int city : best_solution) {
-            file << city << "\n";
-        }
-        file << "EOF" << std::endl;  // Znacznik końca trasy
-        file.close();
-    } else {
-        std::cerr << "Error: Could not open file " << filename << " for writing." << std::endl;
-    }
+void SimulatedAnnealing::send_snapshot(const std::chrono::steady_clock::time_point& start_time) {
+    auto elapsed_time = std::chrono::duration_cast<std::chrono::milliseconds>(
+        std::chrono::steady_clock::now() - start_time).count();
+    AnnealingChain& chain = best_chain();
+    telemetry.send_snapshot(elapsed_time, chain.get_best_cost(), get_iteration_count(), chain.get_best_solution());
 }
 
-// --- Solution Initialization ---
-/*
- * Initializes the solution based on the specified type (e.g., Random or Greedy).
- */
-void SimulatedAnnealing::initialize_solution(InitialSolutionMethodSA initial_solution_method) {
-    if (initial_solution_method == InitialSolutionMethodSA::RANDOM) {
-        initialize_random_solution();
-    } else if (initial_solution_method == InitialSolutionMethodSA::GREEDY) {
-        initialize_greedy_solution();
-    }
-}
-
-// --- Random Solution Initialization ---
-/*
- * Initializes a random solution (random permutation of cities).
- */
-void SimulatedAnnealing::initialize_random_solution() {
-    current_solution.resize(distances.size());
-    std::iota(current_solution.begin(), current_solution.end(), 0);
-    std::shuffle(current_solution.begin(), current_solution.end(), std::mt19937{std::random_device{}()});
-}
-
-// --- Greedy Solution Initialization ---
+// --- Temperature Initialization ---
 /*
- * Initializes a greedy solution (nearest neighbor heuristic).
+ * Initializes the temperatures of the chains. Independent chains all start at the initial temperature, the
+ * parallel tempering ladder spreads geometrically from it down to LADDER_SPAN times it.
  */
-void SimulatedAnnealing::initialize_greedy_solution() {
-    size_t num_cities = distances.size();
-    current_solution.clear();
-    current_solution.reserve(num_cities);
-
-    // Start from a random city
-    std::mt19937 rng(std::random_device{}());
-    std::uniform_int_distribution<size_t> dist(0, num_cities - 1);
-    size_t current_city = dist(rng);
-    current_solution.push_back(current_city);
-
-    std::vector<bool> visited(num_cities, false);
-    visited[current_city] = true;
-
-    // Greedy step: choose the closest city
-    for (size_t step = 1; step < num_cities; ++step) {
-        int closest_city = -1;
-        int min_distance = std::numeric_limits<int>::max();
-
-        for (size_t city = 0; city < num_cities; ++city) {
-            if (!visited[city] && distances[current_city][city] < min_distance) {
-                closest_city = city;
-                min_distance = distances[current_city][city];
-            }
-        }
-
-        current_solution.push_back(closest_city);
-        visited[closest_city] = true;
-        current_city = closest_city;
+void SimulatedAnnealing::initialize_temperatures(InitialTempMethodSA initial_temp_method) {
+    double temperature = initial_temperature(initial_temp_method);
+    bool tempering = multi_chain_strategy == MultiChainStrategySA::PARALLEL_TEMPERING && chains.size() > 1;
+    for (size_t chain = 0; chain < chains.size(); ++chain) {
+        double rung = tempering ? static_cast<double>(chain) / (chains.size() - 1) : 0.0;
+        chains[chain].set_temperature(temperature * std::pow(LADDER_SPAN, rung));
+        ladder.push_back(static_cast<int>(chain));
     }
 }
 
-// --- Temperature Initialization ---
 /*
- * Initializes the temperature based on the selected method.
+ * Returns the initial temperature based on the selected method.
  */
-void SimulatedAnnealing::initialize_temperature(InitialTempMethodSA initial_temp_method) {
+double SimulatedAnnealing::initial_temperature(InitialTempMethodSA initial_temp_method) {
     switch (initial_temp_method) {
         case InitialTempMethodSA::AVG:
-            temperature = init_temp_avg_distance();
-        break;
+            return init_temp_avg_distance();
         case InitialTempMethodSA::MAX:
-            temperature = init_temp_max_distance();
-        break;
+            return init_temp_max_distance();
         case InitialTempMethodSA::SAMPLING:
-            temperature = init_temp_sampling();
-        break;
+            return init_temp_sampling();
     }
+    return 0.0;
 }
 
 // --- Temperature Initialization Methods ---
 /*
  * Initializes the temperature based on the average distance between cities.
+ * Without a dense matrix the average is estimated from randomly sampled city pairs.
  */
 double SimulatedAnnealing::init_temp_avg_distance() {
     double total_distance = 0.0;
-    int count = 0;
-    for (size_t i = 0; i < distances.size(); ++i) {
-        for (size_t j = i + 1; j < distances.size(); ++j) {
-            total_distance += distances[i][j];
-            count++;
+    long long count = 0;
+    if (distances.is_dense()) {
+        for (size_t i = 0; i < distances.size(); ++i) {
+            for (size_t j = i + 1; j < distances.size(); ++j) {
+                total_distance += distances(i, j);
+                count++;
+            }
+        }
+    } else {
+        for (int k = 0; k < TEMPERATURE_SAMPLE_SIZE; ++k) {
+            int i = generate_random_number(0, distances.size() - 1);
+            int j = generate_random_number(0, distances.size() - 1);
+            if (i != j) {
+                total_distance += distances(i, j);
+                count++;
+            }
         }
     }
-    return (total_distance / count) * 0.5;
+    return (total_distance / std::max(count, 1LL)) * 0.5;
 }
 
 /*
  * Initializes the temperature based on the maximum distance between cities.
+ * Without a dense matrix the maximum is estimated from randomly sampled city pairs.
  */
 double SimulatedAnnealing::init_temp_max_distance() {
     int max_distance = 0;
-    for (const auto& row : distances) {
-        max_distance = std::max(max_distance, *std::max_element(row.begin(), row.end()));
+    if (distances.is_dense()) {
+        for (size_t i = 0; i < distances.size(); ++i) {
+            const int* row = distances.row(i);
+            max_distance = std::max(max_distance, *std::max_element(row, row + distances.size()));
+        }
+    } else {
+        for (int k = 0; k < TEMPERATURE_SAMPLE_SIZE; ++k) {
+            int i = generate_random_number(0, distances.size() - 1);
+            int j = generate_random_number(0, distances.size() - 1);
+            max_distance = std::max(max_distance, distances(i, j));
+        }
     }
     return max_distance * 0.5;
 }
 
 /*
- * Initializes the temperature based on the sampled cost differences.
+ * Initializes the temperature based on the sampled cost differences from the initial solution of the first chain.
  */
 double SimulatedAnnealing::init_temp_sampling() {
+    AnnealingChain& chain = chains.front();
     std::vector<double> deltas;
     for (int k = 0; k < 100; ++k) {
-        std::vector<int> sample = current_solution;
-        std::shuffle(sample.begin(), sample.end(), std::mt19937{std::random_device{}()});
-        deltas.push_back(std::fabs(calculate_cost(sample) - current_cost));
+        std::vector<int> sample = chain.get_current_solution();
+        std::shuffle(sample.begin(), sample.end(), rng);
+        deltas.push_back(std::fabs(chain.calculate_cost(sample) - chain.get_current_cost()));
     }
     double avg_delta = std::accumulate(deltas.begin(), deltas.end(), 0.0) / deltas.size();
     return avg_delta * 0.5;
 }
 
 /*
- * Checks if the algorithm should terminate based on the elapsed time or temperature.
+ * Checks if the algorithm should terminate based on the elapsed time or a stop request.
  */
 bool SimulatedAnnealing::should_terminate(const std::chrono::steady_clock::time_point& start_time) {
     auto current_time = std::chrono::steady_clock::now();
     double elapsed_time = std::chrono::duration_cast<std::chrono::milliseconds>(current_time - start_time).count();
 
-    // Check if the elapsed time exceeds the maximum duration or if the temperature is below the final temperature
-    if (elapsed_time >= max_duration) {
+    // Check if the elapsed time exceeds the maximum duration or if a stop has been requested
+    if (elapsed_time >= max_duration || control.stop_requested()) {
         return true;
     }
     return false;
 }
 
-/*
- * Updates the best solution if the current one is better.
- */
-void SimulatedAnnealing::update_best_solution() {
-    if (current_cost < best_cost) {
-        best_solution = current_solution;
-        best_cost = current_cost;
-    }
-}
-
-// --- Cost Calculation ---
-/*
- * Calculates the cost of a solution (sum of distances).
- */
-int SimulatedAnnealing::calculate_cost(const std::vector<int>& solution) {
-    int cost = 0;
-    for (size_t i = 0; i < solution.size() - 1; ++i) {
-        cost += distances[solution[i]][solution[i + 1]];
-    }
-    cost += distances[solution.back()][solution.front()];
-    return cost;
-}
-
-// --- Neighbor Generation ---
-/*
- * Generates a neighboring solution based on the selected method (Swap, Insert, Invert)
- */
-std::vector<int> SimulatedAnnealing::generate_neighbor(const std::vector<int>& solution) {
-    std::vector<int> new_solution = solution;
-    int i = generate_random_number(0, solution.size() - 1);
-    int j;
-    do {
-        j = generate_random_number(0, solution.size() - 1);
-    } while (i == j);
-
-    switch (neighbor_selection_method) {
-        case NeighborSelectionMethodSA::SWAP:
-            std::swap(new_solution[i], new_solution[j]);
-        break;
-        case NeighborSelectionMethodSA::INSERT: {
-            int temp = new_solution[i];
-            new_solution.erase(new_solution.begin() + i);
-            new_solution.insert(new_solution.begin() + j, temp);
-            break;
-        }
-        case NeighborSelectionMethodSA::INVERT:
-            if (i > j) std::swap(i, j);
-        std::reverse(new_solution.begin() + i, new_solution.begin() + j + 1);
-        break;
-    }
-    return new_solution;
-}
-
-// --- Temperature Cooling ---
-/*
- * Applies the temperature cooling schedule to decrease the temperature
- */
-void SimulatedAnnealing::apply_temperature_cooling() {
-    temperature *= alpha;
-}
-
 // --- Random Helpers ---
 /*
  * Generates a random integer number in the range [min, max].
  */
 int SimulatedAnnealing::generate_random_number(int min, int max) {
-    static std::mt19937 gen{std::random_device{}()};
     std::uniform_int_distribution<> dist(min, max);
-    return dist(gen);
+    return dist(rng);
 }
 
 /*
  * Generates a random double number in the range [0, 1).
  */
 double SimulatedAnnealing::generate_random_double() {
-    static std::mt19937 gen{std::random_device{}()};
     std::uniform_real_distribution<> dist(0.0, 1.0);
-    return dist(gen);
+    return dist(rng);
 }
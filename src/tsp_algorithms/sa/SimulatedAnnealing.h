@@ -3,49 +3,73 @@
 #ifndef SIMULATED_ANNEALING_H
 #define SIMULATED_ANNEALING_H
 
+#include "AnnealingChain.h"
 #include "InitialSolutionMethodSA.h"
 #include "InitialTempMethodSA.h"
+#include "MultiChainStrategySA.h"
 #include "NeighborSelectionMethodSA.h"
+#include "ResultSA.h"
+#include "CandidateLists.h"
+#include "ControlWord.h"
+#include "Distances.h"
+#include "TelemetrySender.h"
+#include "ThreadPool.h"
+#include <chrono>
+#include <random>
 #include <vector>
-#include <nng/nng.h>
 
 
-// Class representing the Simulated Annealing algorithm for the Traveling Salesman Problem (TSP)
+// Class representing the Simulated Annealing algorithm for the Traveling Salesman Problem (TSP); it runs one or
+// more annealing chains, each on its own thread, over the same read-only distances
 class SimulatedAnnealing {
 public:
     // Constructor for the Simulated Annealing algorithm
-    SimulatedAnnealing(int port, int data_frequency_ms, const std::vector<std::vector<int>>& dist_matrix, int duration_ms,
+    SimulatedAnnealing(int port, int data_frequency_ms, Distances dist, int duration_ms,
                        InitialTempMethodSA initial_temp_method, InitialSolutionMethodSA initial_solution_method,
-                       NeighborSelectionMethodSA neighbor_selection_method, int steps_per_temp, double alpha);
+                       NeighborSelectionMethodSA neighbor_selection_method, int steps_per_temp, double alpha,
+                       CandidateLists candidate_lists = {}, int num_chains = 1,
+                       MultiChainStrategySA multi_chain_strategy = MultiChainStrategySA::MULTISTART,
+                       int exchange_interval = 10, unsigned int seed = std::random_device{}(),
+                       ControlWord control = {}, bool text_telemetry = false);
 
-    // Destructor for the Simulated Annealing algorithm
-    ~SimulatedAnnealing();
+    // Method to run the Simulated Annealing algorithm, returns the best solution found and statistics of the run
+    ResultSA run();
 
-    // Method to run the Simulated Annealing algorithm
-    void run();
+    // Returns the number of moves evaluated by run() in all chains
+    long long get_iteration_count() const;
+
+    // Returns the word through which the running algorithm is asked to stop, pause or take a snapshot
+    ControlWord& get_control() { return control; }
 
 private:
-    // --- Data Sending ---
-    // Sends the current data (elapsed time and current cost) to the server
-    void send_data(const std::chrono::steady_clock::time_point &start_time, std::chrono::steady_clock::time_point &last_send_time);
+    // --- Chain Scheduling ---
+    // Runs temperature levels on one chain until the epoch ends
+    void run_chain_epoch(AnnealingChain& chain, const std::chrono::steady_clock::time_point& epoch_end) const;
+
+    // Proposes temperature exchanges between neighboring rungs of the parallel tempering ladder
+    void exchange_replicas();
 
-    // --- Best Solution Saving ---
-    // Saves the best solution to a file.
-    void save_best_solution_to_file();
+    // Returns the chain holding the best solution found
+    AnnealingChain& best_chain();
 
-    // --- Solution Initialization ---
-    // Initializes the solution based on the specified type (e.g., Random or Greedy)
-    void initialize_solution(InitialSolutionMethodSA initial_solution_type);
+    // --- Control Requests ---
+    // Sends a requested snapshot and waits while a pause is requested, shifting the clock by the pause
+    void handle_control_requests(std::chrono::steady_clock::time_point& start_time,
+                                 std::chrono::steady_clock::time_point& last_send_time);
 
-    // Initializes a random solution (random permutation of cities)
-    void initialize_random_solution();
+    // --- Data Sending ---
+    // Sends the current data (elapsed time and current cost) to the server
+    void send_data(const std::chrono::steady_clock::time_point &start_time, std::chrono::steady_clock::time_point &last_send_time);
 
-    // Initializes a greedy solution (nearest neighbor heuristic)
-    void initialize_greedy_solution();
+    // Sends the best solution found so far to the receiver
+    void send_snapshot(const std::chrono::steady_clock::time_point& start_time);
 
     // --- Temperature Initialization ---
+    // Initializes the temperature of every chain
+    void initialize_temperatures(InitialTempMethodSA initial_temp_type);
+
     // Initializes the temperature
-    void initialize_temperature(InitialTempMethodSA initial_temp_type);
+    double initial_temperature(InitialTempMethodSA initial_temp_type);
 
     // Initializes the temperature based on the average distance
     double init_temp_avg_distance();
@@ -56,24 +80,9 @@ private:
     // Initializes temperature based on sampled cost differences
     double init_temp_sampling();
 
-    // Checks if the algorithm should terminate based on time or temperature
+    // Checks if the algorithm should terminate based on time or a stop request
     bool should_terminate(const std::chrono::steady_clock::time_point& start_time);
 
-    // Updates the best solution if the current solution is better
-    void update_best_solution();
-
-    // --- Cost Calculation ---
-    // Calculates the total cost of the solution path
-    int calculate_cost(const std::vector<int>& solution);
-
-    // --- Neighbor Generation ---
-    // Generates a neighbor solution based on the selected method (Swap, Insert, Invert)
-    std::vector<int> generate_neighbor(const std::vector<int>& solution);
-
-    // --- Temperature Cooling ---
-    // Applies the temperature cooling schedule to decrease the temperature
-    void apply_temperature_cooling();
-
     // --- Random Number Generation Helpers ---
     // Generates a random integer number in the range [min, max]
     int generate_random_number(int min, int max);
@@ -81,30 +90,46 @@ private:
     // Generates a random double number in the range [0, 1)
     double generate_random_double();
 
-    // --- NNG Socket ---
-    nng_socket sock{};                  // Socket for sending data to the receiver
-    int port{};                         // Port number for the receiver
+    // --- Telemetry ---
+    TelemetrySender telemetry;          // Sends the data to the receiver (binary frames, or text for debugging)
     int data_frequency;                 // Frequency of sending data to the server in milliseconds
 
     // --- Member Variables ---
-    double temperature{};               // Current temperature
     const int max_duration;             // Maximum allowed duration in milliseconds
     const double alpha;                 // Parameter for geometric decay
     const int steps_per_temp;           // Steps to perform at each temperature level
 
-    // Selected method for type of move
-    const NeighborSelectionMethodSA neighbor_selection_method;
+    // Distances between cities (dense matrix or computed from coordinates)
+    const Distances distances;
+
+    // Nearest neighbors of every city; if not empty, moves only create edges to candidate cities
+    const CandidateLists candidate_lists;
+
+    // Number of random city pairs used to estimate the initial temperature without a dense matrix
+    static constexpr int TEMPERATURE_SAMPLE_SIZE = 100000;
+
+    // Highest to lowest temperature of the parallel tempering ladder, relative to the initial temperature
+    static constexpr double LADDER_SPAN = 0.01;
+
+    // How the chains cooperate and the number of temperature levels between replica exchanges
+    const MultiChainStrategySA multi_chain_strategy;
+    const int exchange_interval;
+
+    // Random number generator seeding the chains and deciding replica exchanges
+    std::mt19937 rng;
+
+    // Annealing chains and the threads running them
+    std::vector<AnnealingChain> chains;
+    ThreadPool thread_pool;
 
-    // Distance matrix between cities
-    const std::vector<std::vector<int>> distances;
+    // Indices of the chains ordered from the hottest to the coldest temperature
+    std::vector<int> ladder;
 
-    // Current solution and its cost
-    std::vector<int> current_solution;
-    int current_cost;
+    // Number of replica exchange rounds, alternating between even and odd rungs of the ladder
+    int exchange_round{0};
 
-    // Best solution found and its cost
-    std::vector<int> best_solution;
-    int best_cost;
+    // Stop, pause and snapshot requests, polled between temperature levels
+    ControlWord control;
 };
 
 #endif // SIMULATED_ANNEALING_H
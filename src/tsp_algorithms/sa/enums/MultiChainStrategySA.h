@@ -0,0 +1,13 @@
+// src/tsp_algorithms/sa/enums/MultiChainStrategySA.h
+
+#ifndef MULTICHAINSTRATEGYSA_H
+#define MULTICHAINSTRATEGYSA_H
+
+
+// Enum defining how several annealing chains cooperate
+enum class MultiChainStrategySA {
+  MULTISTART, // Independent chains with their own initial solutions, the best tour of all of them is kept
+  PARALLEL_TEMPERING // Chains on a ladder of temperatures that periodically exchange their temperatures
+};
+
+#endif //MULTICHAINSTRATEGYSA_H
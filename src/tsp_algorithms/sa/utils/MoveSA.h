@@ -0,0 +1,17 @@
+// src/tsp_algorithms/sa/utils/MoveSA.h
+
+#ifndef MOVESA_H
+#define MOVESA_H
+
+
+// A struct describing a Simulated Annealing move by tour positions, interpreted according to the move type:
+// Swap exchanges the cities at first and second, Insert moves the city at first into the gap between positions
+// second and second + 1, and Invert reverses the segment from first to second (inclusive). When the tour is
+// stored as a two-level list, moves are given by cities: Invert reverses the path from first to second, and
+// Insert moves the city first behind the city second
+struct MoveSA {
+    int first;   // First position of the move
+    int second;  // Second position of the move
+};
+
+#endif // MOVESA_H
@@ -0,0 +1,20 @@
+// src/tsp_algorithms/sa/utils/ResultSA.h
+
+#ifndef RESULTSA_H
+#define RESULTSA_H
+
+#include <vector>
+
+
+// A struct holding the outcome of a Simulated Annealing run, returned by run()
+struct ResultSA {
+    std::vector<int> best_solution;          // Best tour found by any chain
+    long long best_cost{0};                  // Cost of the best tour
+    long long iteration_count{0};            // Number of moves evaluated in all chains
+    double final_temperature{0.0};           // Temperature of the chain holding the best tour at the end
+    std::vector<long long> chain_best_costs; // Cost of the best tour of every chain
+    long long elapsed_ms{0};                 // Duration of the run without pauses, in milliseconds
+    bool stopped{false};                     // Whether the run ended on a stop request instead of its duration
+};
+
+#endif // RESULTSA_H
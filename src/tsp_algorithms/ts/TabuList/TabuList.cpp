@@ -1,15 +1,27 @@
 // src/tsp_algorithms/ts/TabuList/TabuList.cpp
 
 #include "TabuList.h"
+#include <algorithm>
 
 
 // --- Constructor ---
 /*
- * Initializes the Tabu List with the given tenure, random tenure range, tenure type, and limit.
+ * Initializes the Tabu List with the given tenure, random tenure range, tenure type, limit, and seed of the random
+ * tenures.
+ * A tenure never exceeds the largest configured value, so that many expiration buckets cover all tabu moves.
  */
-TabuList::TabuList(int constant_tenure, std::pair<int, int> random_tenure_range, TenureTypeTS tenure_type, int limit):
+TabuList::TabuList(int constant_tenure, std::pair<int, int> random_tenure_range, TenureTypeTS tenure_type, int limit,
+                   int num_cities, unsigned int seed):
     constant_tenure(constant_tenure), random_tenure_range(random_tenure_range),
-    tenure_type(tenure_type), rng(std::random_device{}()), limit(limit) {}
+    tenure_type(tenure_type), rng(seed), limit(limit), num_cities(num_cities) {
+
+    int max_tenure = tenure_type == TenureTypeTS::RANDOM ? random_tenure_range.second : constant_tenure;
+    expiration_buckets.resize(std::max(max_tenure, 0) + 1);
+
+    if (num_cities <= DENSE_TABLE_MAX_CITIES) {
+        dense_expirations.assign(static_cast<size_t>(num_cities) * num_cities, 0);
+    }
+}
 
 // --- Get Tenure ---
 /*
@@ -23,27 +35,83 @@ int TabuList::get_tenure() {
     return constant_tenure;
 }
 
+// --- Expiration Table ---
+/*
+ * Returns the key of a pair of cities, normalized so that the smaller city is first.
+ */
+long long TabuList::key_of(int city1, int city2) const {
+    if (city1 > city2) {
+        std::swap(city1, city2);
+    }
+    return static_cast<long long>(city1) * num_cities + city2;
+}
+
+/*
+ * Returns the iteration in which the pair stops being tabu.
+ */
+int TabuList::expiration_of(long long key) const {
+    if (!dense_expirations.empty()) {
+        return dense_expirations[key];
+    }
+    auto entry = sparse_expirations.find(key);
+    return entry != sparse_expirations.end() ? entry->second : 0;
+}
+
+/*
+ * Sets the iteration in which the pair stops being tabu. Hashed entries are removed once they expire.
+ */
+void TabuList::set_expiration(long long key, int expiration) {
+    if (!dense_expirations.empty()) {
+        dense_expirations[key] = expiration;
+    } else if (expiration > iteration) {
+        sparse_expirations[key] = expiration;
+    } else {
+        sparse_expirations.erase(key);
+    }
+}
+
 // --- Enforce Limit ---
 /*
  * Ensures that the Tabu List size does not exceed the specified limit.
- * Removes the oldest move if the limit is exceeded.
+ * Removes the move with the smallest remaining tenure (the oldest one among equal tenures).
  */
 void TabuList::enforce_limit() {
-    if (tabu_map.size() > limit) {
-        tabu_map.erase(tabu_map.begin());  // Remove the move with the smallest tenure
+    for (int expiration = iteration + 1; size > 0 && size > limit; ++expiration) {
+        std::deque<long long>& bucket = expiration_buckets[expiration % expiration_buckets.size()];
+        while (!bucket.empty() && size > 0 && size > limit) {
+            long long key = bucket.front();
+            bucket.pop_front();
+            // Skip entries of moves that were added again with a later expiration
+            if (expiration_of(key) == expiration) {
+                set_expiration(key, 0);
+                --size;
+            }
+        }
     }
 }
 
 // --- Add Move ---
 /*
- * Adds a move to the Tabu List with the appropriate tenure.
- * The move is normalized to ensure the smaller city is first.
+ * Adds a move to the Tabu List with the appropriate tenure. A move added with tenure t is tabu for the rest of the
+ * current iteration and the following t - 1 iterations; a move that is already tabu stays tabu until the later of its expirations.
  */
 void TabuList::add_move(int city1, int city2) {
-    if (city1 > city2) {
-        std::swap(city1, city2);  // Ensure the smaller city is always first
+    int tenure = get_tenure();
+    if (tenure <= 0) {
+        return;
     }
-    tabu_map.insert({get_tenure(), {city1, city2}});  // Insert the move with tenure
+
+    long long key = key_of(city1, city2);
+    int current_expiration = expiration_of(key);
+    int expiration = iteration + tenure;
+    if (expiration <= current_expiration) {
+        return;
+    }
+    if (current_expiration <= iteration) {
+        ++size;
+    }
+    set_expiration(key, expiration);
+    expiration_buckets[expiration % expiration_buckets.size()].push_back(key);
 
     // Ensure the Tabu List size does not exceed the limit
     enforce_limit();
@@ -51,52 +119,24 @@ void TabuList::add_move(int city1, int city2) {
 
 // --- Check if Move is Tabu ---
 /*
- * Checks if a move is tabu by looking for the move in the Tabu List.
+ * Checks if a move is tabu by comparing its expiration with the current iteration.
  */
 bool TabuList::is_tabu(int city1, int city2) const {
-    if (city1 > city2) {
-        std::swap(city1, city2);  // Normalize the move
-    }
-
-    for (const auto& entry : tabu_map) {
-        if (entry.second.first == city1 && entry.second.second == city2) {
-            return true;
-        }
-    }
-    return false;
+    return expiration_of(key_of(city1, city2)) > iteration;
 }
 
-// --- Decrement Tenure ---
+// --- Next Iteration ---
 /*
- * Decreases the tenure of all moves in the Tabu List.
- * Removes moves whose tenure reaches zero.
+ * Advances to the next iteration. Only the bucket of moves expiring now is visited, to keep the size up to date.
  */
-void TabuList::decrement_tenure() {
-    std::vector<std::pair<int, std::pair<int, int>>> updated_moves;
-
-    // Decrement tenure and remove moves with tenure <= 0
-    for (auto it = tabu_map.begin(); it != tabu_map.end();) {
-        int new_tenure = it->first - 1;
-        if (new_tenure > 0) {
-            updated_moves.push_back({new_tenure, it->second});
+void TabuList::next_iteration() {
+    ++iteration;
+    std::deque<long long>& bucket = expiration_buckets[iteration % expiration_buckets.size()];
+    for (long long key : bucket) {
+        if (expiration_of(key) == iteration) {
+            set_expiration(key, 0);
+            --size;
         }
-        it = tabu_map.erase(it);
-    }
-
-    // Insert updated moves back into the Tabu List
-    for (const auto& move : updated_moves) {
-        tabu_map.insert(move);
     }
+    bucket.clear();
 }
-
-// Decrement tenure and remove moves with tenure <= 0
-// for (auto it = tabu_map.begin(); it != tabu_map.end();) {
-//     int new_tenure = it->first - 1;
-//     if (new_tenure <= 0) {
-//         it = tabu_map.erase(it);  // Remove the move
-//     } else {
-//         // Update the move with the new tenure
-//         updated_moves.push_back({new_tenure, it->second});
-//         it = tabu_map.erase(it); // Remove the old move
-//     }
-// }
\ No newline at end of file
@@ -4,16 +4,19 @@
 #define TABU_LIST_H
 
 #include "TenureTypeTS.h"
+#include <deque>
 #include <random>
-#include <map>
+#include <unordered_map>
+#include <vector>
 
 
-// Class representing the Tabu List
+// Class representing the Tabu List. Every tabu pair of cities is stored with the iteration in which its tenure
+// expires, so checking and adding moves take constant time and tenures never have to be decremented
 class TabuList {
 public:
     // Constructor with parameters for the Tabu List
     explicit TabuList(int constant_tenure, std::pair<int, int> random_tenure_range,
-                      TenureTypeTS tenure_type, int limit);
+                      TenureTypeTS tenure_type, int limit, int num_cities, unsigned int seed);
 
     // Add a move to the Tabu List
     void add_move(int city1, int city2);
@@ -21,20 +24,48 @@ public:
     // Check if a move is tabu
     bool is_tabu(int city1, int city2) const;
 
-    // Decrease tenure of all moves on the Tabu List
-    void decrement_tenure();
+    // Advance to the next iteration, releasing the moves whose tenure has expired
+    void next_iteration();
+
+    // Returns the number of iterations started so far
+    int get_iteration() const { return iteration; }
+
+    // Returns the number of moves currently tabu
+    int get_size() const { return size; }
 
 private:
-    std::multimap<int, std::pair<int, int>> tabu_map;  // Stores moves with their tenure
+    // Largest number of cities for which the expirations are stored in a dense n x n table
+    static constexpr int DENSE_TABLE_MAX_CITIES = 2048;
+
     int constant_tenure;                               // Constant tenure duration
     std::pair<int, int> random_tenure_range;           // Range for random tenure
     TenureTypeTS tenure_type;                          // Type of tenure (CONSTANT or RANDOM)
     std::mt19937 rng;                                  // Random number generator
     int limit;                                         // Maximum size of the Tabu List
+    int num_cities;                                    // Number of cities, used to index pairs of cities
+
+    int iteration{0};                                  // Current iteration
+    int size{0};                                       // Number of moves currently tabu
+
+    // Iteration in which each pair of cities stops being tabu, dense for small instances and hashed otherwise
+    std::vector<int> dense_expirations;
+    std::unordered_map<long long, int> sparse_expirations;
+
+    // Moves in the order they expire, bucket e % buckets.size() holds the moves expiring in iteration e
+    std::vector<std::deque<long long>> expiration_buckets;
 
     // Get tenure value (constant or random based on the tenure type)
     int get_tenure();
 
+    // Returns the key of a pair of cities, independent of their order
+    long long key_of(int city1, int city2) const;
+
+    // Returns the iteration in which the pair stops being tabu (0 if it never was)
+    int expiration_of(long long key) const;
+
+    // Sets the iteration in which the pair stops being tabu
+    void set_expiration(long long key, int expiration);
+
     // Ensure that the Tabu List doesn't exceed its limit
     void enforce_limit();
 };
@@ -2,31 +2,67 @@
 
 #include "TabuSearch.h"
 #include "NeighborSelectionMethodTS.h"
-#include "MoveHashUtils.h"
-#include <nng/protocol/pair1/pair.h>
+#include <algorithm>
 #include <iostream>
 #include <chrono>
-#include <unordered_set>
-#include <fstream>
+#include <climits>
+#include <numeric>
 #include <vector>
 #include <string>
+#include <thread>
 
 
 // --- Constructor ---
 /*
  * Initializes the Tabu Search algorithm with the given parameters.
  */
-TabuSearch::TabuSearch(int port, int data_frequency_ms, const std::vector<std::vector<int>>& dist_matrix, int duration_ms,
+TabuSearch::TabuSearch(int port, int data_frequency_ms, Distances dist, int duration_ms,
     InitialSolutionMethodTS initial_solution_method, NeighborSelectionMethodTS neighbor_selection_method,
-    int max_neighbors, TabuListLimitMethodTS tabu_list_limit_method, int tabu_list_custom_limit,
-    TenureTypeTS tenure_type, int constant_tenure, std::pair<int, int> random_tenure_range):
+    NeighborhoodScanMethodTS neighborhood_scan_method, int max_neighbors, TabuListLimitMethodTS tabu_list_limit_method, int tabu_list_custom_limit,
+    TenureTypeTS tenure_type, int constant_tenure, std::pair<int, int> random_tenure_range,
+    CandidateLists candidate_lists, int threads, unsigned int seed, ControlWord control, bool text_telemetry):
 
+    telemetry(text_telemetry),
     max_duration(duration_ms), data_frequency(data_frequency_ms), max_neighbors(max_neighbors),
-    tabu_list(constant_tenure, random_tenure_range, tenure_type, calculate_tabu_list_limit(tabu_list_limit_method, dist_matrix.size(), tabu_list_custom_limit)),
-    neighbor_selection_method(neighbor_selection_method), distances(dist_matrix) {
+    tabu_list(constant_tenure, random_tenure_range, tenure_type, calculate_tabu_list_limit(tabu_list_limit_method, dist.size(), tabu_list_custom_limit), dist.size(),
+              seed + 1),
+    neighbor_selection_method(neighbor_selection_method), neighborhood_scan_method(neighborhood_scan_method),
+    distances(std::move(dist)),
+    candidate_lists(std::move(candidate_lists)), rng(seed), thread_pool(std::max(threads, 1)),
+    control(std::move(control)) {
+
+    // Connect to the receiver first, which is already listening, so that a failure shows before the setup
+    auto setup_start = std::chrono::steady_clock::now();
+    telemetry.connect(port);
 
     // Initialize the initial solution based on the specified type.
     initialize_solution(initial_solution_method);
+    // Record the position of every city in the solution.
+    positions.resize(current_solution.size());
+    for (size_t position = 0; position < current_solution.size(); ++position) {
+        positions[current_solution[position]] = static_cast<int>(position);
+    }
+    // Allocate the neighborhood once, it is refilled in every iteration.
+    neighborhood.reserve(std::max(max_neighbors, 0));
+    neighborhood_keys.reserve(std::max(max_neighbors, 0));
+    // Allocate the buffers of the exhaustive scan, gathered rows hold one extra entry for the wrap-around edge.
+    if (neighborhood_scan_method == NeighborhoodScanMethodTS::EXHAUSTIVE) {
+        tour_edges.resize(current_solution.size());
+        reversal_gains.assign(current_solution.size() + 1, 0);
+        scan_workspaces.resize(thread_pool.size());
+        for (ScanWorkspace& workspace : scan_workspaces) {
+            for (std::vector<int>& gathered : workspace.gathered_distances) {
+                gathered.resize(current_solution.size() + 1);
+            }
+            workspace.deltas.resize(current_solution.size());
+        }
+    }
+    // Reverse segments of large tours in a two-level list when sampling 2-opt moves.
+    if (neighbor_selection_method == NeighborSelectionMethodTS::OPT_2 &&
+        neighborhood_scan_method == NeighborhoodScanMethodTS::SAMPLED && distances.is_symmetric() &&
+        current_solution.size() >= TwoLevelList::MIN_CITIES) {
+        linked_tour = TwoLevelList(current_solution);
+    }
     // Calculate the cost of the initial solution.
     current_cost = calculate_cost(current_solution);
     // Set the initial solution as the best one.
@@ -34,69 +70,113 @@ TabuSearch::TabuSearch(int port, int data_frequency_ms, const std::vector<std::v
     // Set the initial cost as the best cost.
     best_cost = current_cost;
 
-    // NNG socket initialization
-    if (nng_pair1_open(&sock) != 0) {
-        std::cout << "Failed to open NNG socket." << std::endl;
-    }
-
-    // Create the address using the specified port
-    std::string address = "tcp://127.0.0.1:" + std::to_string(port);
-    if (nng_dial(sock, address.c_str(), NULL, 0) != 0) {
-        std::cout << "Failed to connect NNG socket." << std::endl;
-    }
-}
-
-// --- Destructor ---
-/*
- * Destroys the Tabu Search algorithm and closes the NNG socket.
- */
-TabuSearch::~TabuSearch() {
-    nng_close(sock);
+    // Signal the receiver that the engine is set up, completing the startup handshake
+    auto setup_ms = std::chrono::duration_cast<std::chrono::milliseconds>(
+        std::chrono::steady_clock::now() - setup_start).count();
+    telemetry.send_ready(setup_ms, best_cost);
 }
 
 // --- Main Algorithm Loop ---
 /*
  * The main function that runs the Tabu Search algorithm.
- * Iterates through neighborhoods, evaluating solutions until termination (time).
+ * Iterates through neighborhoods, evaluating solutions until termination (time or a stop request), and returns
+ * the best solution found with statistics of the run and its tabu list.
  */
-void TabuSearch::run() {
+ResultTS TabuSearch::run() {
     // Start the timer to measure the algorithm's duration.
     auto start_time = std::chrono::steady_clock::now();
     auto last_send_time = start_time;
 
-    // Main loop until the algorithm exceeds the maximum duration
+    // Main loop until the algorithm exceeds the maximum duration or is asked to stop
     while (!should_terminate(start_time)) {
-        // Decrease tenures of all tabu moves.
-        tabu_list.decrement_tenure();
+        // Send a requested snapshot and wait while the run is paused
+        handle_control_requests(start_time, last_send_time);
+
+        // Advance the Tabu List, releasing the moves whose tenure has expired.
+        tabu_list.next_iteration();
+
+        // Apply the best admissible move of the whole neighborhood.
+        if (neighborhood_scan_method == NeighborhoodScanMethodTS::EXHAUSTIVE) {
+            Neighbor best_neighbor{};
+            if (scan_neighborhood(best_neighbor)) {
+                if (neighbor_selection_method == NeighborSelectionMethodTS::SWAP) {
+                    process_swap_move(best_neighbor);
+                } else {
+                    process_2opt_move(best_neighbor);
+                }
+                send_data(start_time, last_send_time);
+            }
+            continue;
+        }
 
-        // Generate a neighborhood of possible moves (Swap or 2-opt).
-        std::vector<Neighbor> neighborhood = generate_neighborhood(current_solution);
+        // Generate a neighborhood of possible moves (Swap or 2-opt) and evaluate it.
+        generate_neighborhood();
+        evaluate_neighborhood();
+
+        // Evaluate the neighbors from the best one, sorting only as many batches as needed to find a valid move.
+        size_t sorted_end = 0;
+        for (size_t index = 0; index < neighborhood.size(); ++index) {
+            if (index == sorted_end) {
+                sorted_end = std::min(neighborhood.size(), sorted_end + SELECTION_BATCH_SIZE);
+                std::partial_sort(neighborhood.begin() + index, neighborhood.begin() + sorted_end, neighborhood.end(),
+                                  [](const Neighbor& a, const Neighbor& b) { return a.delta < b.delta; });
+            }
 
-        // Evaluate each neighbor in the neighborhood.
-        for (Neighbor &neighbor : neighborhood) {
             // Process the neighbor based on the move type (Swap or 2-opt).
-            if (std::holds_alternative<std::pair<int, int>>(neighbor.move)) {
-                if (process_swap_move(neighbor)) {
-
-                    // Send the current data, passing start_time and last_send_time by reference
-                    send_data(start_time, last_send_time);
-                    break;
-                }
-            } else if (std::holds_alternative<std::pair<std::pair<int, int>, std::pair<int, int>>>(neighbor.move)) {
-                if (process_2opt_move(neighbor)) {
-
-                    // Send the current data, passing start_time and last_send_time by reference
-                    send_data(start_time, last_send_time);
-                    break;
-                }
+            bool applied = neighbor_selection_method == NeighborSelectionMethodTS::SWAP
+                               ? process_swap_move(neighborhood[index])
+                               : process_2opt_move(neighborhood[index]);
+            if (applied) {
+                // Send the current data, passing start_time and last_send_time by reference
+                send_data(start_time, last_send_time);
+                break;
             }
         }
     }
+    // Collect the result with the statistics of the tabu list
+    collect_best_solution();
+    ResultTS result;
+    result.best_solution = best_solution;
+    result.best_cost = best_cost;
+    result.iteration_count = tabu_list.get_iteration();
+    result.aspiration_count = aspiration_count;
+    result.tabu_rejection_count = tabu_rejection_count;
+    result.tabu_list_size = tabu_list.get_size();
+    result.elapsed_ms = std::chrono::duration_cast<std::chrono::milliseconds>(
+        std::chrono::steady_clock::now() - start_time).count();
+    result.stopped = control.stop_requested();
+
     // Send the final data to indicate the end of the algorithm
-    std::string eof_message = "EOF";
-    nng_send(sock, const_cast<char*>(eof_message.c_str()), eof_message.size(), 0);
+    telemetry.send_end(result.elapsed_ms, result.best_cost, result.iteration_count);
+    return result;
+}
 
-    save_best_solution_to_file();
+// --- Control Requests ---
+/*
+ * Sends the best solution to the receiver for every requested snapshot, and waits while a pause is requested,
+ * still sending snapshots. The pause does not count towards the duration, so the
+ * clock is shifted by it.
+ */
+void TabuSearch::handle_control_requests(std::chrono::steady_clock::time_point& start_time,
+                                         std::chrono::steady_clock::time_point& last_send_time) {
+    auto pause_start = std::chrono::steady_clock::now();
+    bool paused = false;
+    while (true) {
+        if (control.snapshot_requested()) {
+            control.acknowledge_snapshot();
+            send_snapshot(start_time);
+        }
+        if (!control.pause_requested()) {
+            break;
+        }
+        paused = true;
+        std::this_thread::sleep_for(ControlWord::PAUSE_POLL_INTERVAL);
+    }
+    if (paused) {
+        auto paused_time = std::chrono::steady_clock::now() - pause_start;
+        start_time += paused_time;
+        last_send_time += paused_time;
+    }
 }
 
 // --- Data Sending ---
@@ -114,40 +194,23 @@ void TabuSearch::send_data(const std::chrono::steady_clock::time_point& start_ti
         auto elapsed_time = std::chrono::duration_cast<std::chrono::milliseconds>(current_time - start_time).count();
         last_send_time = current_time;
 
-        // Convert the current solution to a string
-        std::stringstream solution_stream;
-        for (size_t i = 0; i < current_solution.size(); ++i) {
-            solution_stream << current_solution[i];
-            if (i != current_solution.size() - 1) {
-                solution_stream << ",";
-            }
+        // Read the current solution from the two-level list if the tour is stored in one
+        if (!linked_tour.empty()) {
+            linked_tour.to_vector(current_solution);
         }
 
-        // Send the data through the NNG socket
-        std::string message = std::to_string(elapsed_time) + " " + std::to_string(best_cost) + " " + std::to_string(current_cost) + " " + solution_stream.str();
-        if (nng_send(sock, const_cast<char*>(message.c_str()), message.size(), 0) != 0) {
-            std::cerr << "Error: Failed to send message: " << message << std::endl;
-        }
+        telemetry.send_data(elapsed_time, best_cost, current_cost, tabu_list.get_iteration(), current_solution);
     }
 }
 
-// --- Best Solution Saving ---
 /*
- * Saves the best solution to a file.
- * Each city is written on a separate line, followed by the "EOF" marker.
+ * Sends the best solution found so far and its cost as a snapshot.
  */
-void TabuSearch::save_best_solution_to_file() {
-    std::string filename = "data/best_solutions/best_solution_ts.txt";
-    std::ofstream file(filename);
-    if (file.is_open()) {
-        for (int city : best_solution) {
-            file << city << "\n";
-        }
-        file << "EOF" << std::endl;  // Znacznik końca trasy
-        file.close();
-    } else {
-        std::cerr << "Error: Could not open file " << filename << " for writing." << std::endl;
-    }
+void TabuSearch::send_snapshot(const std::chrono::steady_clock::time_point& start_time) {
+    auto elapsed_time = std::chrono::duration_cast<std::chrono::milliseconds>(
+        std::chrono::steady_clock::now() - start_time).count();
+    collect_best_solution();
+    telemetry.send_snapshot(elapsed_time, best_cost, tabu_list.get_iteration(), best_solution);
 }
 
 // --- Solution Initialization ---
@@ -169,7 +232,7 @@ void TabuSearch::initialize_solution(InitialSolutionMethodTS initial_solution_me
 void TabuSearch::initialize_random_solution() {
     current_solution.resize(distances.size());
     std::iota(current_solution.begin(), current_solution.end(), 0);
-    std::shuffle(current_solution.begin(), current_solution.end(), std::mt19937{std::random_device{}()});
+    std::shuffle(current_solution.begin(), current_solution.end(), rng);
 }
 
 // --- Greedy Solution Initialization ---
@@ -182,7 +245,6 @@ void TabuSearch::initialize_greedy_solution() {
     current_solution.reserve(num_cities);
 
     // Zaczynamy od losowego miasta
-    std::mt19937 rng(std::random_device{}());
     std::uniform_int_distribution<size_t> dist(0, num_cities - 1);
     size_t current_city = dist(rng);
     current_solution.push_back(current_city);
@@ -194,11 +256,12 @@ void TabuSearch::initialize_greedy_solution() {
     for (size_t step = 1; step < num_cities; ++step) {
         int closest_city = -1;
         int min_distance = std::numeric_limits<int>::max();
+        const int* distances_from_current = distances.row(current_city);
 
         for (size_t city = 0; city < num_cities; ++city) {
-            if (!visited[city] && distances[current_city][city] < min_distance) {
+            if (!visited[city] && distances_from_current[city] < min_distance) {
                 closest_city = city;
-                min_distance = distances[current_city][city];
+                min_distance = distances_from_current[city];
             }
         }
 
@@ -212,129 +275,434 @@ void TabuSearch::initialize_greedy_solution() {
 /*
  * Calculates the total cost (distance) for a given solution (tour).
  */
-int TabuSearch::calculate_cost(const std::vector<int>& solution) {
-    int cost = 0;
+long long TabuSearch::calculate_cost(const std::vector<int>& solution) {
+    long long cost = 0;
     for (size_t i = 0; i < solution.size() - 1; ++i) {
-        cost += distances[solution[i]][solution[i + 1]];
+        cost += distances(solution[i], solution[i + 1]);
     }
     // Add the distance from the last city back to the starting city.
-    cost += distances[solution.back()][solution.front()];
+    cost += distances(solution.back(), solution.front());
     return cost;
 }
 
 // --- Neighborhood Generation ---
 /*
- * Generates the neighborhood of solutions using either Swap or 2-opt moves.
+ * Fills the neighborhood with moves of the current solution using either Swap or 2-opt moves.
+ * Only the positions of the moves are stored, the solution is not copied.
  */
-std::vector<Neighbor> TabuSearch::generate_neighborhood(const std::vector<int>& current_solution) {
-    std::multimap<int, Neighbor> sorted_neighborhood; // Sorted neighborhood by cost
-
-    // Generate the neighborhood based on the move type (Swap or 2-opt).
-    if (neighbor_selection_method == NeighborSelectionMethodTS::SWAP) {
-        generate_swap_neighborhood(current_solution, sorted_neighborhood);
+void TabuSearch::generate_neighborhood() {
+    neighborhood.clear();
+    neighborhood_keys.clear();
+
+    // Generate the neighborhood based on the move type (Swap or 2-opt), restricted to candidate edges if available.
+    if (!candidate_lists.empty()) {
+        if (neighbor_selection_method == NeighborSelectionMethodTS::SWAP) {
+            generate_candidate_swap_neighborhood();
+        } else if (neighbor_selection_method == NeighborSelectionMethodTS::OPT_2) {
+            generate_candidate_2opt_neighborhood();
+        }
+    } else if (neighbor_selection_method == NeighborSelectionMethodTS::SWAP) {
+        generate_swap_neighborhood();
     } else if (neighbor_selection_method == NeighborSelectionMethodTS::OPT_2) {
-        generate_2opt_neighborhood(current_solution, sorted_neighborhood);
+        generate_2opt_neighborhood();
     }
-
-    // Convert the sorted neighborhood to a vector of neighbors.
-    std::vector<Neighbor> neighborhood;
-    for (const auto& entry : sorted_neighborhood) {
-        neighborhood.push_back(entry.second);
-    }
-    return neighborhood;
 }
 
 // --- Swap Neighborhood Generation ---
 /*
- * Generates the neighborhood using Swap moves.
+ * Generates the neighborhood using Swap moves of random distinct positions.
+ * The neighborhood is limited to the number of distinct Swap moves of the tour.
  */
-void TabuSearch::generate_swap_neighborhood(const std::vector<int>& current_solution, std::multimap<int, Neighbor>& sorted_neighborhood) {
-    std::mt19937 rng(std::random_device{}()); // Random number generator
-    std::unordered_set<std::pair<int, int>, hash_pair> added_swap_moves; // Set to track unique swap moves
-    std::uniform_int_distribution<size_t> dist(0, current_solution.size() - 1); // Random index selection
+void TabuSearch::generate_swap_neighborhood() {
+    long long num_cities = static_cast<long long>(current_solution.size());
+    size_t target_size = static_cast<size_t>(std::min<long long>(max_neighbors, num_cities * (num_cities - 1) / 2));
+    std::uniform_int_distribution<int> dist(0, num_cities - 1); // Random index selection
 
-    for (int k = 0; k < max_neighbors; ++k) {
-        size_t i = dist(rng); // Randomly select the first city
-        size_t j = dist(rng); // Randomly select the second city
+    while (neighborhood.size() < target_size) {
+        int i = dist(rng); // Randomly select the first city
+        int j = dist(rng); // Randomly select the second city
 
         // Check that cities are different
-        while (i == j) { j = dist(rng); }
+        if (i != j) {
+            add_neighbor(std::min(i, j), std::max(i, j));
+        }
+    }
+}
 
-        // Ensure that the pair (i, j) is unique
-        if (added_swap_moves.find({std::min(i, j), std::max(i, j)}) != added_swap_moves.end()) {
-            --k; // Skip this move and generate a new one
+// --- 2-opt Neighborhood Generation ---
+/*
+ * Generates the neighborhood using 2-opt moves of random pairs of edges.
+ * The neighborhood is limited to the number of distinct 2-opt moves of the tour. With a two-level list, the
+ * edges are drawn by the cities they start from.
+ */
+void TabuSearch::generate_2opt_neighborhood() {
+    long long num_cities = static_cast<long long>(current_solution.size());
+    size_t target_size = static_cast<size_t>(
+        std::min<long long>(max_neighbors, std::max(num_cities * (num_cities - 3) / 2, 0LL)));
+    std::uniform_int_distribution<int> dist(0, num_cities - 1); // Random index selection
+
+    while (neighborhood.size() < target_size) {
+        int i = dist(rng); // Randomly select the first edge
+        int j = dist(rng); // Randomly select the second edge
+        if (i > j) {
+            std::swap(i, j);
+        }
+
+        // Ensure that the edges are different and not adjacent
+        if (!linked_tour.empty() ? i == j || linked_tour.next(i) == j || linked_tour.next(j) == i
+                                 : (j - i) < 2 || (j == num_cities - 1 && i == 0)) {
             continue;
         }
+        add_neighbor(i, j);
+    }
+}
 
-        std::vector<int> new_solution = current_solution;
-        std::swap(new_solution[i], new_solution[j]); // Swap the cities
+// --- Candidate Neighborhood Generation ---
+/*
+ * Draws a random position i and the position j of one of the candidates of the city at i. With a two-level list,
+ * a random city and its candidate are drawn instead.
+ */
+std::pair<int, int> TabuSearch::draw_candidate_pair() {
+    std::uniform_int_distribution<int> position_dist(0, current_solution.size() - 1);
+    std::uniform_int_distribution<int> candidate_dist(0, candidate_lists.size_per_city() - 1);
 
-        int neighbor_cost = calculate_cost(new_solution); // Calculate the cost
+    int i = position_dist(rng);
+    if (!linked_tour.empty()) {
+        return {i, candidate_lists.at(i, candidate_dist(rng))};
+    }
+    int candidate = candidate_lists.at(current_solution[i], candidate_dist(rng));
+    return {i, positions[candidate]};
+}
+
+/*
+ * Generates the neighborhood using Swap moves that place a candidate city right after a random city.
+ * The number of distinct candidate moves may be smaller than max_neighbors, so the number of draws is bounded.
+ */
+void TabuSearch::generate_candidate_swap_neighborhood() {
+    int num_cities = static_cast<int>(current_solution.size());
 
-        // Add the neighbor to the sorted neighborhood
-        add_neighbor(sorted_neighborhood, new_solution, neighbor_cost, std::make_pair(current_solution[i], current_solution[j]));
+    for (long long attempt = 0; neighborhood.size() < static_cast<size_t>(std::max(max_neighbors, 0)) &&
+                                attempt < 4LL * max_neighbors; ++attempt) {
+        auto [i, candidate_position] = draw_candidate_pair();
+        int j = (i + 1) % num_cities; // The candidate is moved to the successor of the city
 
-        // Add the move to the set to avoid duplicates
-        added_swap_moves.insert({std::min(i, j), std::max(i, j)});
+        // Skip candidates that already follow the city
+        if (j != candidate_position) {
+            add_neighbor(std::min(j, candidate_position), std::max(j, candidate_position));
+        }
     }
 }
 
-// --- 2-opt Neighborhood Generation ---
 /*
- * Generates the neighborhood using 2-opt moves.
+ * Generates the neighborhood using 2-opt moves that create an edge between a random city and its candidate.
+ * The number of distinct candidate moves may be smaller than max_neighbors, so the number of draws is bounded.
  */
-void TabuSearch::generate_2opt_neighborhood(const std::vector<int>& current_solution, std::multimap<int, Neighbor>& sorted_neighborhood) {
-    std::mt19937 rng(std::random_device{}()); // Random number generator
-    std::unordered_set<std::tuple<int, int, int, int>, hash_tuple> added_2opt_moves; // Set to track unique 2-opt moves
-    std::uniform_int_distribution<size_t> dist(0, current_solution.size() - 1); // Random index selection
+void TabuSearch::generate_candidate_2opt_neighborhood() {
+    int num_cities = static_cast<int>(current_solution.size());
+
+    for (long long attempt = 0; neighborhood.size() < static_cast<size_t>(std::max(max_neighbors, 0)) &&
+                                attempt < 4LL * max_neighbors; ++attempt) {
+        auto [first, second] = draw_candidate_pair();
+        int i = std::min(first, second);
+        int j = std::max(first, second);
+
+        // Removing edges (i, i+1) and (j, j+1) creates the edge between the cities at i and j, so the edges
+        // must be different and not adjacent
+        if (!linked_tour.empty() ? i != j && linked_tour.next(i) != j && linked_tour.next(j) != i
+                                 : (j - i) >= 2 && !(j == num_cities - 1 && i == 0)) {
+            add_neighbor(i, j);
+        }
+    }
+}
 
-    for (int k = 0; k < max_neighbors; ++k) {
-        size_t i = dist(rng); // Randomly select the first edge
-        size_t j = dist(rng); // Randomly select the second edge
+// --- Add Neighbor ---
+/*
+ * Helper function to add a move to the neighborhood, skipping moves that are already in it.
+ */
+void TabuSearch::add_neighbor(int first, int second) {
+    long long key = static_cast<long long>(first) * static_cast<long long>(current_solution.size()) + second;
+    if (neighborhood_keys.insert(key).second) {
+        neighborhood.push_back({first, second, 0});
+    }
+}
 
-        // Ensure that the edges are different and not adjacent
-        while (i >= j || (j - i) < 2 || (j == current_solution.size() - 1 && i == 0)) {
-            i = dist(rng);
-            j = dist(rng);
+// --- Neighborhood Evaluation ---
+/*
+ * Computes the cost changes of the moves in chunks spread over the threads. The moves are drawn beforehand
+ * on a single thread, so the neighborhood does not depend on the number of threads.
+ */
+void TabuSearch::evaluate_neighborhood() {
+    int num_neighbors = static_cast<int>(neighborhood.size());
+    int num_tasks = (num_neighbors + EVALUATION_CHUNK_SIZE - 1) / EVALUATION_CHUNK_SIZE;
+
+    thread_pool.run(num_tasks, [this, num_neighbors](int task, int) {
+        int end = std::min(num_neighbors, (task + 1) * EVALUATION_CHUNK_SIZE);
+        for (int index = task * EVALUATION_CHUNK_SIZE; index < end; ++index) {
+            Neighbor& neighbor = neighborhood[index];
+            if (neighbor_selection_method == NeighborSelectionMethodTS::SWAP) {
+                neighbor.delta = swap_delta(current_solution, distances, neighbor.first, neighbor.second);
+            } else if (linked_tour.empty()) {
+                neighbor.delta = reversal_delta(current_solution, distances, neighbor.first + 1, neighbor.second);
+            } else {
+                neighbor.delta = reversal_delta(linked_tour, distances, linked_tour.next(neighbor.first),
+                                                neighbor.second);
+            }
         }
+    });
+}
 
-        // Ensure that the pair (i, i+1, j, j+1) is unique
-        if (added_2opt_moves.find({i, i + 1, j, (j + 1) % current_solution.size()}) != added_2opt_moves.end()) {
-            --k; // Skip this move and generate a new one
-            continue;
+// --- Exhaustive Neighborhood Scan ---
+/*
+ * Finds the best admissible move of the whole neighborhood (or of all candidate moves) in one pass. The lengths
+ * of the tour edges are computed once per iteration, so every move is evaluated in constant time. The first
+ * positions are scanned in chunks spread over the threads, each keeping its own best move, and the best moves
+ * are reduced in an order that does not depend on the number of threads.
+ */
+bool TabuSearch::scan_neighborhood(Neighbor& best_neighbor) {
+    int num_cities = static_cast<int>(current_solution.size());
+    bool reversal_changes_length = neighbor_selection_method == NeighborSelectionMethodTS::OPT_2 &&
+                                   !distances.is_symmetric();
+
+    for (int k = 0; k < num_cities; ++k) {
+        int next = current_solution[(k + 1) % num_cities];
+        tour_edges[k] = distances(current_solution[k], next);
+        // A reversed segment traverses its edges backwards, which only changes their length if asymmetric
+        if (reversal_changes_length) {
+            reversal_gains[k + 1] = reversal_gains[k] + distances(next, current_solution[k]) - tour_edges[k];
         }
+    }
 
-        std::vector<int> new_solution = current_solution;
+    // Moves are identified by their first position, the last positions have no moves with later ones
+    void (TabuSearch::*scan_moves)(int, ScanWorkspace&) const;
+    int num_positions;
+    if (!candidate_lists.empty()) {
+        scan_moves = &TabuSearch::scan_candidate_moves;
+        num_positions = num_cities;
+    } else if (neighbor_selection_method == NeighborSelectionMethodTS::SWAP) {
+        scan_moves = &TabuSearch::scan_swap_moves;
+        num_positions = num_cities - 1;
+    } else {
+        scan_moves = &TabuSearch::scan_2opt_moves;
+        num_positions = num_cities - 2;
+    }
 
-        // Reverse the segment between the two edges
-        if (j == current_solution.size() - 1) {
-            std::reverse(new_solution.begin() + (j + 1) % current_solution.size(), new_solution.begin() + i + 1);
+    for (ScanWorkspace& workspace : scan_workspaces) {
+        workspace.best_neighbor = {-1, -1, LLONG_MAX};
+    }
+    int num_tasks = (std::max(num_positions, 0) + SCAN_CHUNK_SIZE - 1) / SCAN_CHUNK_SIZE;
+    thread_pool.run(num_tasks, [&](int task, int thread) {
+        int end = std::min(num_positions, (task + 1) * SCAN_CHUNK_SIZE);
+        for (int i = task * SCAN_CHUNK_SIZE; i < end; ++i) {
+            (this->*scan_moves)(i, scan_workspaces[thread]);
+        }
+    });
+
+    best_neighbor = {-1, -1, LLONG_MAX};
+    for (const ScanWorkspace& workspace : scan_workspaces) {
+        if (workspace.best_neighbor.first >= 0 && is_better(workspace.best_neighbor, best_neighbor)) {
+            best_neighbor = workspace.best_neighbor;
+        }
+    }
+    return best_neighbor.first >= 0;
+}
+
+/*
+ * Scans the Swap moves of position i with all later positions. The distances to its city and neighbors are
+ * gathered in tour order, so the cost changes of all swaps are computed by a branch-free loop the compiler
+ * can vectorize. Only moves better than the best one so far are checked against the Tabu List.
+ */
+void TabuSearch::scan_swap_moves(int i, ScanWorkspace& workspace) const {
+    int num_cities = static_cast<int>(current_solution.size());
+    Neighbor& best_neighbor = workspace.best_neighbor;
+    int city = current_solution[i];
+    int previous = current_solution[(i + num_cities - 1) % num_cities];
+    int next = current_solution[i + 1];
+
+    // Swaps of adjacent cities share an edge and are evaluated separately
+    offer_neighbor(best_neighbor, i, i + 1, swap_delta(current_solution, distances, i, i + 1));
+    if (i == 0 && num_cities > 2) {
+        offer_neighbor(best_neighbor, 0, num_cities - 1, swap_delta(current_solution, distances, 0, num_cities - 1));
+    }
+
+    int begin = i + 2;
+    int end = i == 0 ? num_cities - 1 : num_cities;
+    if (begin >= end) {
+        return;
+    }
+
+    std::vector<int>& from_previous = workspace.gathered_distances[0];
+    std::vector<int>& to_next = workspace.gathered_distances[1];
+    std::vector<int>& from_city = workspace.gathered_distances[2];
+    std::vector<int>& to_city = distances.is_symmetric() ? from_city : workspace.gathered_distances[3];
+    gather_distances_from(previous, from_previous);
+    gather_distances_to(next, to_next);
+    gather_distances_from(city, from_city);
+    if (!distances.is_symmetric()) {
+        gather_distances_to(city, to_city);
+    }
+
+    // The city at j takes the place between previous and next, the city at i the place between the neighbors of j
+    const int* from_previous_data = from_previous.data();
+    const int* to_next_data = to_next.data();
+    const int* from_city_data = from_city.data();
+    const int* to_city_data = to_city.data();
+    const long long* edges = tour_edges.data();
+    long long* deltas = workspace.deltas.data();
+    long long removed = edges[(i + num_cities - 1) % num_cities] + edges[i];
+    for (int j = begin; j < end; ++j) {
+        deltas[j] = static_cast<long long>(from_previous_data[j]) + to_next_data[j] + to_city_data[j - 1] +
+                    from_city_data[j + 1] - edges[j - 1] - edges[j] - removed;
+    }
+
+    for (int j = begin; j < end; ++j) {
+        if (deltas[j] <= best_neighbor.delta) {
+            offer_neighbor(best_neighbor, i, j, deltas[j]);
+        }
+    }
+}
+
+/*
+ * Scans the 2-opt moves of the edge starting at position i with all later edges. The distances from its cities
+ * are gathered in tour order, so the cost changes of all moves are computed by a branch-free loop the compiler
+ * can vectorize. Only moves better than the best one so far are checked against the Tabu List.
+ */
+void TabuSearch::scan_2opt_moves(int i, ScanWorkspace& workspace) const {
+    int num_cities = static_cast<int>(current_solution.size());
+    Neighbor& best_neighbor = workspace.best_neighbor;
+
+    // The second edge must not be adjacent to the first one
+    int begin = i + 2;
+    int end = i == 0 ? num_cities - 1 : num_cities;
+    if (begin >= end) {
+        return;
+    }
+
+    std::vector<int>& from_first = workspace.gathered_distances[0];
+    std::vector<int>& from_second = workspace.gathered_distances[1];
+    gather_distances_from(current_solution[i], from_first);
+    gather_distances_from(current_solution[i + 1], from_second);
+
+    // Edges (i, i+1) and (j, j+1) are replaced by (i, j) and (i+1, j+1), the segment between them is reversed
+    const int* from_first_data = from_first.data();
+    const int* from_second_data = from_second.data();
+    const long long* edges = tour_edges.data();
+    const long long* gains = reversal_gains.data();
+    long long* deltas = workspace.deltas.data();
+    long long removed = edges[i] + gains[i + 1];
+    for (int j = begin; j < end; ++j) {
+        deltas[j] = static_cast<long long>(from_first_data[j]) + from_second_data[j + 1] - edges[j] + gains[j] -
+                    removed;
+    }
+
+    for (int j = begin; j < end; ++j) {
+        if (deltas[j] <= best_neighbor.delta) {
+            offer_neighbor(best_neighbor, i, j, deltas[j]);
+        }
+    }
+}
+
+/*
+ * Scans the moves of the candidate neighborhoods of position i: Swap moves that place a candidate city right
+ * after the city at i, and 2-opt moves that create an edge between the city at i and its candidate.
+ */
+void TabuSearch::scan_candidate_moves(int i, ScanWorkspace& workspace) const {
+    int num_cities = static_cast<int>(current_solution.size());
+
+    for (int index = 0; index < candidate_lists.size_per_city(); ++index) {
+        int candidate_position = positions[candidate_lists.at(current_solution[i], index)];
+
+        if (neighbor_selection_method == NeighborSelectionMethodTS::SWAP) {
+            int j = (i + 1) % num_cities;
+            if (j != candidate_position) {
+                int first = std::min(j, candidate_position);
+                int second = std::max(j, candidate_position);
+                offer_neighbor(workspace.best_neighbor, first, second,
+                               swap_delta(current_solution, distances, first, second));
+            }
         } else {
-            std::reverse(new_solution.begin() + i + 1, new_solution.begin() + (j + 1) % current_solution.size());
+            int first = std::min(i, candidate_position);
+            int second = std::max(i, candidate_position);
+            if ((second - first) >= 2 && !(second == num_cities - 1 && first == 0)) {
+                offer_neighbor(workspace.best_neighbor, first, second, scanned_2opt_delta(first, second));
+            }
         }
+    }
+}
+
+/*
+ * Stores the distances from the city to every city of the current solution in tour order. The first entry is
+ * repeated at the end, for the edge closing the tour. Unlike row(), gather() does not use a shared buffer, so
+ * threads can gather concurrently.
+ */
+void TabuSearch::gather_distances_from(int city, std::vector<int>& gathered) const {
+    size_t num_cities = current_solution.size();
+    distances.gather(city, current_solution.data(), num_cities, gathered.data());
+    gathered[num_cities] = gathered[0];
+}
+
+/*
+ * Stores the distances from every city of the current solution in tour order to the city. The first entry is
+ * repeated at the end, for the edge closing the tour.
+ */
+void TabuSearch::gather_distances_to(int city, std::vector<int>& gathered) const {
+    if (distances.is_symmetric()) {
+        gather_distances_from(city, gathered);
+        return;
+    }
 
-        int neighbor_cost = calculate_cost(new_solution); // Calculate the cost
+    size_t num_cities = current_solution.size();
+    for (size_t k = 0; k < num_cities; ++k) {
+        gathered[k] = distances(current_solution[k], city);
+    }
+    gathered[num_cities] = gathered[0];
+}
 
-        // Add the neighbor to the sorted neighborhood
-        add_neighbor(sorted_neighborhood, new_solution, neighbor_cost,
-            std::make_pair(std::make_pair(current_solution[i], current_solution[i + 1]),
-                std::make_pair(current_solution[j], current_solution[(j + 1) % current_solution.size()])));
+/*
+ * Calculates the cost change of a 2-opt move from the two replaced edges and, for asymmetric distances, the
+ * prefix sums of the length changes of the reversed edges.
+ */
+long long TabuSearch::scanned_2opt_delta(int first, int second) const {
+    int num_cities = static_cast<int>(current_solution.size());
+    return static_cast<long long>(distances(current_solution[first], current_solution[second])) +
+           distances(current_solution[first + 1], current_solution[(second + 1) % num_cities]) -
+           tour_edges[first] - tour_edges[second] + reversal_gains[second] - reversal_gains[first + 1];
+}
 
-        // Add the move to the set to avoid duplicates
-        added_2opt_moves.insert({i, i + 1, j, (j + 1) % current_solution.size()});
+/*
+ * Replaces the best neighbor with the move if it comes first in the order of is_better() and is admissible.
+ */
+void TabuSearch::offer_neighbor(Neighbor& best_neighbor, int first, int second, long long delta) const {
+    Neighbor neighbor{first, second, delta};
+    if (is_better(neighbor, best_neighbor) && is_admissible(neighbor)) {
+        best_neighbor = neighbor;
     }
 }
 
-// --- Add Neighbor ---
 /*
- * Helper function to add a neighbor to the sorted neighborhood.
+ * Checks if a move would be applied: a Swap move if its cities are not tabu, a 2-opt move if at least one of the
+ * removed edges is not tabu, and any move that meets the aspiration criteria.
  */
-void TabuSearch::add_neighbor(std::multimap<int, Neighbor>& sorted_neighborhood,
-                              const std::vector<int>& new_solution, int neighbor_cost,
-                              std::variant<std::pair<int, int>, std::pair<std::pair<int, int>, std::pair<int, int>>> move) {
-    // Create a new Neighbor object and insert it into the sorted neighborhood.
-    Neighbor neighbor = { new_solution, move, neighbor_cost };
-    sorted_neighborhood.insert({neighbor_cost, neighbor});
+bool TabuSearch::is_admissible(const Neighbor& neighbor) const {
+    if (aspiration_criteria(current_cost + neighbor.delta)) {
+        return true;
+    }
+    if (neighbor_selection_method == NeighborSelectionMethodTS::SWAP) {
+        return !tabu_list.is_tabu(current_solution[neighbor.first], current_solution[neighbor.second]);
+    }
+
+    int num_cities = static_cast<int>(current_solution.size());
+    return !tabu_list.is_tabu(current_solution[neighbor.first], current_solution[neighbor.first + 1]) ||
+           !tabu_list.is_tabu(current_solution[neighbor.second], current_solution[(neighbor.second + 1) % num_cities]);
+}
+
+/*
+ * Compares moves by cost change, breaking ties by their positions.
+ */
+bool TabuSearch::is_better(const Neighbor& a, const Neighbor& b) {
+    if (a.delta != b.delta) {
+        return a.delta < b.delta;
+    }
+    return a.first != b.first ? a.first < b.first : a.second < b.second;
 }
 
 // --- Termination Condition ---
@@ -345,7 +713,7 @@ bool TabuSearch::should_terminate(const std::chrono::steady_clock::time_point& s
     auto current_time = std::chrono::steady_clock::now();
     auto elapsed_time = std::chrono::duration_cast<std::chrono::milliseconds>(current_time - start_time).count();
 
-    if (elapsed_time >= max_duration) {
+    if (elapsed_time >= max_duration || control.stop_requested()) {
         return true;
     }
     return false;
@@ -354,41 +722,69 @@ bool TabuSearch::should_terminate(const std::chrono::steady_clock::time_point& s
 // --- Swap Move Processing ---
 /*
  * Process a Swap move: checks if it's tabu and if aspiration criteria are met.
- * Updates the current solution and Tabu List if the move is valid.
+ * Updates the current solution in place and the Tabu List if the move is valid.
  */
-bool TabuSearch::process_swap_move(Neighbor& neighbor) {
-    auto [city1, city2] = std::get<std::pair<int, int>>(neighbor.move);
+bool TabuSearch::process_swap_move(const Neighbor& neighbor) {
+    int city1 = current_solution[neighbor.first];
+    int city2 = current_solution[neighbor.second];
+    long long neighbor_cost = current_cost + neighbor.delta;
 
     // If the move is not tabu or meets aspiration criteria, apply it.
-    if (!tabu_list.is_tabu(city1, city2) || aspiration_criteria(neighbor.cost)) {
-
-        current_solution = neighbor.solution;
-        current_cost = neighbor.cost;
+    bool move_is_tabu = tabu_list.is_tabu(city1, city2);
+    if (!move_is_tabu || aspiration_criteria(neighbor_cost)) {
+        aspiration_count += move_is_tabu;
+        // Leaving the best solution, keep a copy of it
+        if (neighbor.delta > 0) {
+            store_best_solution();
+        }
+        swap_cities(current_solution, positions, neighbor.first, neighbor.second);
+        current_cost = neighbor_cost;
         tabu_list.add_move(city1, city2);
 
         // Update the best solution if the new one is better.
         update_best_solution();
         return true; // Found a better solution, break the loop.
     }
+    tabu_rejection_count++;
     return false; // No better solution found
 }
 
 // --- 2-opt Move Processing ---
 /*
  * Process a 2-opt move: checks if it's tabu and if aspiration criteria are met.
- * Updates the current solution and Tabu List if the move is valid.
+ * Updates the current solution in place and the Tabu List if the move is valid.
  */
-bool TabuSearch::process_2opt_move(Neighbor& neighbor) {
-    auto [edge1, edge2] = std::get<std::pair<std::pair<int, int>, std::pair<int, int>>>(neighbor.move);
+bool TabuSearch::process_2opt_move(const Neighbor& neighbor) {
+    int num_cities = static_cast<int>(current_solution.size());
+    std::pair<int, int> edge1;
+    std::pair<int, int> edge2;
+    if (linked_tour.empty()) {
+        edge1 = {current_solution[neighbor.first], current_solution[neighbor.first + 1]};
+        edge2 = {current_solution[neighbor.second], current_solution[(neighbor.second + 1) % num_cities]};
+    } else {
+        edge1 = {neighbor.first, linked_tour.next(neighbor.first)};
+        edge2 = {neighbor.second, linked_tour.next(neighbor.second)};
+    }
+    long long neighbor_cost = current_cost + neighbor.delta;
 
     bool edge1_is_tabu = tabu_list.is_tabu(edge1.first, edge1.second);
     bool edge2_is_tabu = tabu_list.is_tabu(edge2.first, edge2.second);
 
     // Apply the move if at least one of the edges is not tabu or aspiration criteria are met.
-    if ((!edge1_is_tabu || !edge2_is_tabu) || aspiration_criteria(neighbor.cost)) {
-
-        current_solution = neighbor.solution;
-        current_cost = neighbor.cost;
+    bool move_is_tabu = edge1_is_tabu && edge2_is_tabu;
+    if (!move_is_tabu || aspiration_criteria(neighbor_cost)) {
+        aspiration_count += move_is_tabu;
+        // Leaving the best solution, keep a copy of it
+        if (neighbor.delta > 0) {
+            store_best_solution();
+        }
+        // Reverse the segment between the two edges
+        if (linked_tour.empty()) {
+            reverse_segment(current_solution, positions, neighbor.first + 1, neighbor.second, distances.is_symmetric());
+        } else {
+            linked_tour.reverse(edge1.second, edge2.first);
+        }
+        current_cost = neighbor_cost;
 
         if (!edge1_is_tabu) {
             tabu_list.add_move(edge1.first, edge1.second);
@@ -401,18 +797,44 @@ bool TabuSearch::process_2opt_move(Neighbor& neighbor) {
         update_best_solution();
         return true; // Found a better solution, break the loop.
     }
+    tabu_rejection_count++;
     return false; // No better solution found
 }
 
 // --- Best Solution Update ---
 /*
- * Updates the best solution and best cost if the current solution is better.
+ * Updates the best cost if the current solution is better. The solution is only copied by store_best_solution()
+ * when the search is about to leave it, so a run of improving moves does not copy the tour on every iteration.
  */
 void TabuSearch::update_best_solution() {
     if (current_cost < best_cost) {
-        best_solution = current_solution;
         best_cost = current_cost;
-        // std::cout << "New best solution: " << best_cost << std::endl;
+        current_is_best = true;
+    }
+}
+
+/*
+ * Copies the current solution into the best solution if it is the best one found so far.
+ */
+void TabuSearch::store_best_solution() {
+    if (current_is_best) {
+        if (linked_tour.empty()) {
+            best_solution = current_solution;
+        } else {
+            best_linked_tour = linked_tour;
+        }
+        current_is_best = false;
+    }
+}
+
+/*
+ * Stores the best solution found so far and reads it from the copy of the two-level list if the tour is stored
+ * in one.
+ */
+void TabuSearch::collect_best_solution() {
+    store_best_solution();
+    if (!best_linked_tour.empty()) {
+        best_linked_tour.to_vector(best_solution);
     }
 }
 
@@ -420,7 +842,7 @@ void TabuSearch::update_best_solution() {
 /*
  * Aspiration criteria check: determines if a move should be accepted based on the current cost.
  */
-bool TabuSearch::aspiration_criteria(int current_cost) {
+bool TabuSearch::aspiration_criteria(long long current_cost) const {
     return current_cost < best_cost;
 }
 
@@ -437,7 +859,8 @@ int TabuSearch::calculate_tabu_list_limit(TabuListLimitMethodTS tabu_list_limit_
         case TabuListLimitMethodTS::THREE_N:
             return 3 * num_cities;
         case TabuListLimitMethodTS::N_SQUARED:
-            return num_cities * num_cities;
+            // Clamped, as N^2 overflows int for the largest instances
+            return static_cast<int>(std::min<long long>(static_cast<long long>(num_cities) * num_cities, INT_MAX));
         case TabuListLimitMethodTS::CUSTOM:
             return tabu_list_custom_limit; // Custom value provided by the user
         default:
@@ -5,36 +5,55 @@
 
 #include "TabuList.h"
 #include "Neighbor.h"
+#include "ResultTS.h"
+#include "ScanWorkspace.h"
 #include "NeighborSelectionMethodTS.h"
+#include "NeighborhoodScanMethodTS.h"
 #include "TenureTypeTS.h"
 #include "TabuListLimitMethodTS.h"
 #include "InitialSolutionMethodTS.h"
-#include <nng/nng.h>
+#include "CandidateLists.h"
+#include "ControlWord.h"
+#include "Distances.h"
+#include "TelemetrySender.h"
+#include "TourMoves.h"
+#include "TwoLevelList.h"
+#include "ThreadPool.h"
+#include <chrono>
+#include <random>
+#include <unordered_set>
+#include <vector>
 
 
 // Class representing the Tabu Search algorithm for the Traveling Salesman Problem (TSP)
 class TabuSearch {
 public:
     // Constructor with parameters including various options for the Tabu Search algorithm
-    TabuSearch(int port, int data_frequency_ms, const std::vector<std::vector<int>>& dist_matrix, int duration_ms,
+    TabuSearch(int port, int data_frequency_ms, Distances dist, int duration_ms,
                 InitialSolutionMethodTS initial_solution_method, NeighborSelectionMethodTS neighbor_selection_method,
-                int max_neighbors, TabuListLimitMethodTS tabu_list_limit_method, int tabu_list_custom_limit,
-                TenureTypeTS tenure_type, int constant_tenure, std::pair<int, int> random_tenure_range);
+                NeighborhoodScanMethodTS neighborhood_scan_method, int max_neighbors, TabuListLimitMethodTS tabu_list_limit_method, int tabu_list_custom_limit,
+                TenureTypeTS tenure_type, int constant_tenure, std::pair<int, int> random_tenure_range,
+                CandidateLists candidate_lists = {}, int threads = 1, unsigned int seed = std::random_device{}(),
+                ControlWord control = {}, bool text_telemetry = false);
 
-    // Destructor for the Tabu Search algorithm
-    ~TabuSearch();
+    // Method to run the Tabu Search algorithm, returns the best solution found and statistics of the run
+    ResultTS run();
 
-    // Method to run the Tabu Search algorithm
-    void run();
+    // Returns the word through which the running algorithm is asked to stop, pause or take a snapshot
+    ControlWord& get_control() { return control; }
 
 private:
+    // --- Control Requests ---
+    // Sends a requested snapshot and waits while a pause is requested, shifting the clock by the pause
+    void handle_control_requests(std::chrono::steady_clock::time_point& start_time,
+                                 std::chrono::steady_clock::time_point& last_send_time);
+
     // --- Data Sending ---
     // Sends the current data (elapsed time and current cost) to the server
     void send_data(const std::chrono::steady_clock::time_point &start_time, std::chrono::steady_clock::time_point &last_send_time);
 
-    // --- Best Solution Saving ---
-    // Saves the best solution to a file
-    void save_best_solution_to_file();
+    // Sends the best solution found so far to the receiver
+    void send_snapshot(const std::chrono::steady_clock::time_point& start_time);
 
     // --- Solution Initialization ---
     // Initializes the solution based on the specified type (e.g., Random or Greedy)
@@ -48,48 +67,93 @@ private:
 
     // --- Cost Calculation ---
     // Calculates the cost of a solution (sum of distances between consecutive cities)
-    int calculate_cost(const std::vector<int>& solution);
+    long long calculate_cost(const std::vector<int>& solution);
 
     // --- Neighbor Management ---
-    // Generates the neighborhood of a solution, either using Swap or 2-opt moves
-    std::vector<Neighbor> generate_neighborhood(const std::vector<int>& current_solution);
+    // Fills the neighborhood buffer with Swap or 2-opt moves of the current solution
+    void generate_neighborhood();
 
     // Generates the neighborhood using Swap moves.
-    void generate_swap_neighborhood(const std::vector<int> &current_solution,
-                                    std::multimap<int, Neighbor> &sorted_neighborhood);
+    void generate_swap_neighborhood();
 
     // Generates the neighborhood using 2-opt moves.
-    void generate_2opt_neighborhood(const std::vector<int> &current_solution,
-                                    std::multimap<int, Neighbor> &sorted_neighborhood);
+    void generate_2opt_neighborhood();
+
+    // Generates the neighborhood using Swap moves that place a candidate city right after a random city.
+    void generate_candidate_swap_neighborhood();
+
+    // Generates the neighborhood using 2-opt moves that create an edge between a random city and its candidate.
+    void generate_candidate_2opt_neighborhood();
+
+    // Draws a random position and the position of one of the candidates of the city at it
+    std::pair<int, int> draw_candidate_pair();
+
+    // Adds a move to the neighborhood unless it is already there
+    void add_neighbor(int first, int second);
+
+    // Computes the cost changes of all moves of the neighborhood, split across the threads
+    void evaluate_neighborhood();
+
+    // --- Exhaustive Neighborhood Scan ---
+    // Finds the best admissible move of the whole neighborhood, returns false if every move is tabu
+    bool scan_neighborhood(Neighbor& best_neighbor);
+
+    // Scans the Swap moves of the city at position i with all later positions
+    void scan_swap_moves(int i, ScanWorkspace& workspace) const;
+
+    // Scans the 2-opt moves of the edge starting at position i with all later edges
+    void scan_2opt_moves(int i, ScanWorkspace& workspace) const;
+
+    // Scans the Swap or 2-opt moves that create an edge between the city at position i and its candidates
+    void scan_candidate_moves(int i, ScanWorkspace& workspace) const;
+
+    // Stores the distances from the city to the cities of the current solution, in tour order
+    void gather_distances_from(int city, std::vector<int>& gathered) const;
+
+    // Stores the distances from the cities of the current solution, in tour order, to the city
+    void gather_distances_to(int city, std::vector<int>& gathered) const;
+
+    // Returns the cost change of a 2-opt move from the tour edges of the current iteration in constant time
+    long long scanned_2opt_delta(int first, int second) const;
+
+    // Replaces the best neighbor with the move if it is better and admissible
+    void offer_neighbor(Neighbor& best_neighbor, int first, int second, long long delta) const;
+
+    // Checks if a move is not tabu or meets the aspiration criteria
+    bool is_admissible(const Neighbor& neighbor) const;
 
-    // Adds a neighbor to the sorted neighborhood map, which is sorted by cost
-    void add_neighbor(std::multimap<int, Neighbor>& sorted_neighborhood, const std::vector<int>& new_solution,
-                      int neighbor_cost, std::variant<std::pair<int, int>, std::pair<std::pair<int, int>, std::pair<int, int>>> move);
+    // Orders moves by cost change and then by position, so the selected move does not depend on the scan order
+    static bool is_better(const Neighbor& a, const Neighbor& b);
 
     // --- Tabu Search Logic ---
-    // Checks if the algorithm should terminate (based on maximum allowed duration)
+    // Checks if the algorithm should terminate (based on maximum allowed duration or a stop request)
     bool should_terminate(const std::chrono::steady_clock::time_point& start_time);
 
     // Processes a Swap move for a neighbor, updating Tabu List and current solution if valid
-    bool process_swap_move(Neighbor& neighbor);
+    bool process_swap_move(const Neighbor& neighbor);
 
     // Processes a 2-opt move for a neighbor, updating Tabu List and current solution if valid
-    bool process_2opt_move(Neighbor& neighbor);
+    bool process_2opt_move(const Neighbor& neighbor);
 
-    // Updates the best solution if the current one is better
+    // Updates the best cost if the current solution is better, the solution itself is copied lazily
     void update_best_solution();
 
+    // Copies the current solution into the best solution if it is the best one found
+    void store_best_solution();
+
+    // Brings best_solution up to date, reading it from the two-level list if the tour is stored in one
+    void collect_best_solution();
+
     // --- Aspiration Criteria ---
     // Checks if a solution passes the aspiration criteria (e.g., if it's better than the best found solution)
-    bool aspiration_criteria(int current_cost);
+    bool aspiration_criteria(long long current_cost) const;
 
     // --- Tabu List Limit Management ---
     // Calculates the limit for the Tabu List based on the type (e.g., N, 3N, sqrt(N), or tabu_list_custom_limit)
     int calculate_tabu_list_limit(TabuListLimitMethodTS tabu_list_limit_method, int num_cities, int tabu_list_custom_limit) const;
 
-    // --- NNG Socket ---
-    nng_socket sock{};                  // Socket for sendning data to the receiver
-    int port{};                         // Port number for the receiver
+    // --- Telemetry ---
+    TelemetrySender telemetry;          // Sends the data to the receiver (binary frames, or text for debugging)
     int data_frequency;                 // Frequency of sending data to the server in milliseconds
 
     // --- Member Variables ---
@@ -102,16 +166,62 @@ private:
     // Selected method for type of move
     NeighborSelectionMethodTS neighbor_selection_method;
 
-    // Distance matrix between cities
-    const std::vector<std::vector<int>> distances;
+    // Selected method for exploring the neighborhood
+    NeighborhoodScanMethodTS neighborhood_scan_method;
+
+    // Distances between cities (dense matrix or computed from coordinates)
+    const Distances distances;
+
+    // Nearest neighbors of every city; if not empty, moves only create edges to candidate cities
+    const CandidateLists candidate_lists;
+
+    // Number of neighbors sorted at a time while looking for an admissible move
+    static constexpr size_t SELECTION_BATCH_SIZE = 16;
+
+    // Number of neighbors evaluated, or first positions scanned, by one task of the thread pool
+    static constexpr int EVALUATION_CHUNK_SIZE = 256;
+    static constexpr int SCAN_CHUNK_SIZE = 8;
+
+    // Random number generator for the initial solution and the neighborhoods
+    std::mt19937 rng;
 
-    // Current solution and its cost
+    // Threads evaluating the neighborhood; the thread running the search is one of them
+    ThreadPool thread_pool;
+
+    // Neighborhood of the current iteration and the keys of its moves, reused across iterations
+    std::vector<Neighbor> neighborhood;
+    std::unordered_set<long long> neighborhood_keys;
+
+    // Buffers of the exhaustive scan: the length of the tour edge starting at every position, the prefix sums
+    // of the length changes of reversing those edges (all zero for symmetric distances), and one workspace
+    // per thread
+    std::vector<long long> tour_edges;
+    std::vector<long long> reversal_gains;
+    std::vector<ScanWorkspace> scan_workspaces;
+
+    // Current solution, the position of every city in it, and its cost
     std::vector<int> current_solution;
-    int current_cost;
+    std::vector<int> positions;
+    long long current_cost;
+
+    // Current solution of large symmetric instances searched with sampled 2-opt moves; if not empty, moves are
+    // given by the cities starting their removed edges and current_solution is only updated to be sent
+    TwoLevelList linked_tour;
 
-    // Best solution found and its cost
+    // Copy of the two-level list holding the best solution, which is only read into best_solution on request
+    TwoLevelList best_linked_tour;
+
+    // Best solution found and its cost; while current_is_best is set, best_solution may be stale
     std::vector<int> best_solution;
-    int best_cost;
+    long long best_cost;
+    bool current_is_best{true};
+
+    // Number of tabu moves applied thanks to the aspiration criteria, and of moves rejected as tabu
+    long long aspiration_count{0};
+    long long tabu_rejection_count{0};
+
+    // Stop, pause and snapshot requests, polled between iterations
+    ControlWord control;
 };
 
 #endif // TABU_SEARCH_H
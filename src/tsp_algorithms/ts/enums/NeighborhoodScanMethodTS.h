@@ -0,0 +1,13 @@
+// src/tsp_algorithms/ts/enums/NeighborhoodScanMethodTS.h
+
+#ifndef NEIGHBORHOODSCANMETHODTS_H
+#define NEIGHBORHOODSCANMETHODTS_H
+
+
+// Enum defining how the neighborhood is explored in Tabu Search
+enum class NeighborhoodScanMethodTS {
+    SAMPLED,   // Evaluate up to max_neighbors random moves
+    EXHAUSTIVE // Evaluate every move (or every candidate move) and take the best admissible one
+};
+
+#endif // NEIGHBORHOODSCANMETHODTS_H
@@ -3,15 +3,15 @@
 #ifndef NEIGHBOR_H
 #define NEIGHBOR_H
 
-#include <vector>
-#include <variant>
 
-
-// A struct representing a neighbor solution and the move (either Swap or 2-opt) that generated it
+// A struct representing a move of the neighborhood (either Swap or 2-opt) by tour positions, and the cost change
+// it causes. Swap exchanges the cities at first and second; 2-opt removes the edges starting at first and second
+// and reverses the segment between them. When the tour is stored as a two-level list, first and second are the
+// cities starting the removed edges
 struct Neighbor {
-    std::vector<int> solution;  // New solution (path)
-    std::variant<std::pair<int, int>, std::pair<std::pair<int, int>, std::pair<int, int>>> move;  // Move: Swap or 2-opt
-    int cost;  // Cost of the neighbor solution
+    int first;       // First position of the move
+    int second;      // Second position of the move
+    long long delta; // Cost change of the move
 };
 
-#endif // NEIGHBOR_H
\ No newline at end of file
+#endif // NEIGHBOR_H
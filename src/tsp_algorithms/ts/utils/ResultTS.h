@@ -0,0 +1,21 @@
+// src/tsp_algorithms/ts/utils/ResultTS.h
+
+#ifndef RESULTTS_H
+#define RESULTTS_H
+
+#include <vector>
+
+
+// A struct holding the outcome of a Tabu Search run and statistics of its tabu list, returned by run()
+struct ResultTS {
+    std::vector<int> best_solution;          // Best tour found
+    long long best_cost{0};                  // Cost of the best tour
+    long long iteration_count{0};            // Number of iterations
+    long long aspiration_count{0};           // Number of tabu moves applied because they met the aspiration criteria
+    long long tabu_rejection_count{0};       // Number of selected moves rejected because they were tabu
+    int tabu_list_size{0};                   // Number of moves tabu at the end
+    long long elapsed_ms{0};                 // Duration of the run without pauses, in milliseconds
+    bool stopped{false};                     // Whether the run ended on a stop request instead of its duration
+};
+
+#endif // RESULTTS_H
@@ -0,0 +1,19 @@
+// src/tsp_algorithms/ts/utils/ScanWorkspace.h
+
+#ifndef SCANWORKSPACE_H
+#define SCANWORKSPACE_H
+
+#include "Neighbor.h"
+#include <array>
+#include <vector>
+
+
+// A struct holding the buffers of one thread of the exhaustive neighborhood scan and the best admissible move
+// it has found, reduced with the moves of the other threads once the scan is done
+struct ScanWorkspace {
+    std::array<std::vector<int>, 4> gathered_distances; // Distances gathered in tour order
+    std::vector<long long> deltas;                      // Cost changes of the moves starting at one position
+    Neighbor best_neighbor;                             // Best admissible move found by the thread
+};
+
+#endif // SCANWORKSPACE_H